@@ -9,7 +9,9 @@
 
 from as64.core import (
     GameState,
-    GameController
+    GameController,
+    GameStateHistory,
+    StateChange
 )
 
 
@@ -28,7 +30,9 @@ from as64.plugins import (
     SplitPlugin,
     GameStatePlugin,
     PluginMetaData,
-    PluginValidationError
+    PluginValidationError,
+    reads,
+    writes
 )
 
 
@@ -40,6 +44,7 @@ from . import (
     rpc,
     state,
     image,
+    inference,
     modifiers,
     math
 )
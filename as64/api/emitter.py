@@ -7,10 +7,15 @@
 #
 # For more information see https://github.com/Kainev/AutoSplit64?tab=readme#license
 
-from typing import Callable, Any
-from pymitter import EventEmitter
+import threading
+from contextlib import contextmanager
+from typing import Callable, Any, Iterator, List, Tuple
 
-_emitter: EventEmitter = None
+from as64.helpers.events import EventBus
+
+_emitter: EventBus = None
+
+_local = threading.local()
 
 def on(event: str, callback: Callable[..., Any], ttl: int = -1) -> None:
     _emitter.on(event, callback, ttl=ttl)
@@ -22,4 +27,22 @@ def off(event: str, callback: Callable[..., Any]) -> None:
     _emitter.off(event, callback)
 
 def emit(event: str, *args: Any, **kwargs: Any) -> None:
+    buffer = getattr(_local, "buffer", None)
+    if buffer is not None:
+        buffer.append((event, args, kwargs))
+        return
+    
     _emitter.emit(event, *args, **kwargs)
+    
+@contextmanager
+def deferred() -> Iterator[List[Tuple[str, tuple, dict]]]:
+    """
+    Buffer events emitted on the current thread instead of dispatching them.
+    The caller is responsible for emitting the buffered events.
+    """
+    buffer = []
+    _local.buffer = buffer
+    try:
+        yield buffer
+    finally:
+        _local.buffer = None
@@ -9,5 +9,12 @@
 
 from as64.helpers.image import (
     in_colour_range,
-    is_white_like
+    in_colour_range_unchecked,
+    in_colour_ranges,
+    colour_proportion_exceeds,
+    ColourRangeBatch,
+    ColourRangeSpec,
+    is_white_like,
+    white_like_mask,
+    white_like_proportion
 )
\ No newline at end of file
@@ -0,0 +1,24 @@
+# AutoSplit64
+#
+# Copyright (C) 2025 Kainev
+#
+# This project is currently not open source and is under active development.
+# You may view the code, but it is not licensed for distribution, modification, or use at this time.
+#
+# For more information see https://github.com/Kainev/AutoSplit64?tab=readme#license
+
+from as64.core.inference import (
+    ChangeGate,
+    InferenceError,
+    InferenceService,
+    StarPredictor,
+    create_star_predictor,
+    get_service,
+    predict,
+    predict_batch
+)
+
+from as64.core.smoothing import (
+    PredictionFilter,
+    create_prediction_filter
+)
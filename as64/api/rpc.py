@@ -1 +1 @@
-from as64.ipc.rpc import register
\ No newline at end of file
+from as64.ipc.rpc import register, ExecutionPolicy
\ No newline at end of file
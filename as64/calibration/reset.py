@@ -33,6 +33,11 @@ class ResetCalibration:
         self._black_upper_bound = np.array(config.get("colour_bounds", "black_upper_bound"), dtype='uint8')
         self._black_threshold = config.get("thresholds", "black")
         
+        self._fade_checks = api.image.ColourRangeBatch([
+            api.image.ColourRangeSpec(Region.LIFE, self._black_lower_bound, self._black_upper_bound, self._black_threshold),
+            api.image.ColourRangeSpec(Region.FADEOUT, self._black_lower_bound, self._black_upper_bound, self._black_threshold),
+        ], rects=self._capture.region_rect)
+        
         self._capture_count = 5
         self._fps = 29.97
 
@@ -52,17 +57,14 @@ class ResetCalibration:
                 break
             
             reset_region = self._capture.region_image(Region.RESET)
-            life_region = self._capture.region_image(Region.LIFE)
-            fade_region = self._capture.region_image(Region.FADEOUT)
                         
-            in_fade = api.image.in_colour_range(life_region, self._black_lower_bound, self._black_upper_bound, self._black_threshold)
-            fade_complete = api.image.in_colour_range(fade_region, self._black_lower_bound, self._black_upper_bound, self._black_threshold)
+            in_fade, fade_complete = self._fade_checks.evaluate(self._capture.image)
             
             if in_fade and fade_complete:
                 reset_occurred = True
                 
             if reset_occurred:
-                if not api.image.in_colour_range(fade_region, self._black_lower_bound, self._black_upper_bound, self._black_threshold):
+                if not fade_complete:
                     frame += 1
                     
                     if frame <= self._capture_count:
@@ -88,9 +88,7 @@ def rollback(id: str, *path: str) -> None:
                 old_value = _get(_rollbacks[id], *path, default=_NO_DEFAULT)
             except KeyError:
                 # Path didn't exist in the rollback snapshot, remove it from current config
-                _delete(_config, *path)
-                logger.info(f"[config.rollback] Path {'.'.join(path)} removed; it did not exist in rollback ID '{id}'.")
-                return
+                old_value = _NO_DEFAULT
 
             if old_value is _NO_DEFAULT:
                 _delete(_config, *path)
@@ -98,6 +96,9 @@ def rollback(id: str, *path: str) -> None:
             else:
                 _set(_config, *path, old_value)
                 logger.info(f"[config.rollback] Path {'.'.join(path)} rolled back in config to ID '{id}'.")
+
+    # Clear cached RPC results derived from the config, also when called outside of an RPC
+    rpc.invalidate_dependants("config.rollback")
                 
 
 @rpc.register("config.save")
@@ -128,6 +129,8 @@ def set(*keys: Any) -> None:
     """Set a nested configuration value."""
     global _config
     _set(_config, *keys)
+    rpc.invalidate_dependants("config.set")
+    
     _enqueue_message({
         "event": "config.update",
         "data": keys
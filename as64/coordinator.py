@@ -10,23 +10,20 @@
 import threading
 import logging
 import queue
-import json
 
 import asyncio
-from pymitter import EventEmitter
 
 from as64 import config, log, api
 from as64.core import AS64
 from as64.plugins import Plugin, PluginValidationError
 from as64.plugins.management import plugin_manager
 from as64.ipc import rpc
-from as64.ipc.pipe import (
-    AsyncPipe,
-    PipeError,
-    PipeWriteError,
-    PipeReadError,
-)
+from as64.ipc.batching import MessageBatcher
+from as64.ipc.framing import FramedConnection
+from as64.ipc.pipe import PipeReadError
+from as64.ipc.transport import TransportError, create_transport
 from as64.enums import AS64Status
+from as64.helpers.events import EventBus
 
 # RPC Registration Imports
 from as64 import helpers
@@ -40,7 +37,18 @@ PIPE_NAME = r'\\.\pipe\AutoSplit64'
 
 class AS64Coordinator:
     def __init__(self, pipe_name: str):
-        self.pipe = AsyncPipe(pipe_name)
+        self.pipe = create_transport(
+            pipe_name,
+            kind=config.get('ipc', 'transport', default="auto"),
+            socket_path=config.get('ipc', 'socket_path', default="") or None,
+            host=config.get('ipc', 'host', default="127.0.0.1"),
+            port=config.get('ipc', 'port', default=47164)
+        )
+        self.connection = FramedConnection(
+            self.pipe,
+            binary=config.get('ipc', 'framing', default="auto") != "legacy",
+            use_msgpack=config.get('ipc', 'msgpack', default=True)
+        )
 
         # Incoming messages to AS64 processing thread
         self.in_queue: "queue.Queue[dict]" = queue.Queue()
@@ -53,7 +61,7 @@ class AS64Coordinator:
         self.as64_stop_event = threading.Event()
         
         # Emitter
-        self.emitter = EventEmitter()
+        self.emitter = EventBus()
         
         # Export to API and config
         api.emitter._emitter = self.emitter
@@ -66,9 +74,15 @@ class AS64Coordinator:
         # Event loop reference
         self.event_loop: asyncio.AbstractEventLoop = None
         
+        # Coalesces messages from the processing thread, created once the event loop is running
+        self.batcher: MessageBatcher = None
+        
         # Requests
         self.pending_requests = {}
         
+        # RPCs being handled, responses are sent as each completes
+        self.rpc_tasks: set = set()
+        
         # State Locking
         self._state_lock = threading.Lock()
         self._state_mutating = False
@@ -77,24 +91,18 @@ class AS64Coordinator:
         """Asynchronously reads messages from the pipe."""
         try:
             while not self.stop_event.is_set():
-                messages = await self.pipe.read()
-                for message in messages:
-                    try:
-                        data = json.loads(message)
-                        logger.debug(f"[AS64Coordinator.pipe_reader] Received message: {data}")
+                messages = await self.connection.read()
+                for data in messages:
+                    logger.debug(f"[AS64Coordinator.pipe_reader] Received message: {data}")
 
-                        if "rpc" in data:
-                            await self.handle_rpc(data)
-                            continue
-                        else:
-                            self.in_queue.put(data)
-
-                    except json.JSONDecodeError:
-                        logger.warning(f"Invalid JSON received: {message}")
+                    if "rpc" in data or "batch" in data:
+                        self.dispatch_rpc(data)
+                    else:
+                        self.in_queue.put(data)
 
         except PipeReadError as e:
             logger.error(f"[AS64Coordinator.pipe_reader] Pipe read error: {e}")
-        except PipeError as e:
+        except TransportError as e:
             logger.error(f"[AS64Coordinator.pipe_reader] Pipe error: {e}")
         except Exception as e:
             logger.exception(f"[AS64Coordinator.pipe_reader] Unexpected error: {e}")
@@ -104,63 +112,104 @@ class AS64Coordinator:
     async def pipe_writer(self):
         """
         Asynchronously writes messages to the pipe.
-        Awaits on the process_out_queue for messages from the AS64 processing thread
-        and then sends them to the pipe.
+        Awaits on the process_out_queue for batches of messages from the AS64 processing thread
+        and sends each batch to the pipe in a single frame.
         """
         try:
             while not self.stop_event.is_set():
                 try:
-                    item = await self.out_queue.get()
-                    if item is None:
+                    batch = await self.out_queue.get()
+                    if batch is None:
                         logger.debug("[AS64Coordinator.pipe_writer] Received shutdown sentinel.")
                         break
 
-                    serialized_payload = json.dumps(item)
-                    await self.pipe.write(serialized_payload)
+                    await self.connection.write(batch)
                     
-                    logger.debug(f"[AS64Coordinator.pipe_writer] Sent message: {serialized_payload}")
-                except PipeWriteError as e:
+                    logger.debug(f"[AS64Coordinator.pipe_writer] Sent {len(batch)} messages")
+                except TransportError as e:
                     logger.error(f"[AS64Coordinator.pipe_writer] Pipe write error: {e}")
                 except Exception as e:
                     logger.exception(f"[AS64Coordinator.pipe_writer] Unexpected error: {e}")
         finally:
             logger.info("[AS64Coordinator.pipe_writer] Exiting write loop.")
             
+    def dispatch_rpc(self, data):
+        """
+        Handle an RPC message in its own task, so slow RPCs do not hold up the messages after it.
+        Responses may be sent out of order and are matched to requests by requestId.
+        """
+        task = asyncio.create_task(self.handle_rpc(data))
+        self.rpc_tasks.add(task)
+        task.add_done_callback(self.rpc_tasks.discard)
+
     async def handle_rpc(self, data):
-        """Handle the RPC message (dispatcher call + sending the response)."""
-        proc_name = data["rpc"]
-        args = data.get("args", [])
-        kwargs = data.get("kwargs", {})
-        
+        """
+        Handle the RPC message (dispatcher call + sending the response).
+
+        A batch message, {"batch": [{"rpc": ..., "args": ..., "kwargs": ...}, ...], "ordered": bool},
+        is answered with a single response whose "results" holds a {"result": ...} or {"error": ...}
+        entry per call, in request order. Calls run one after another if "ordered" is set, and
+        concurrently otherwise.
+        """
         request_id = data.get("requestId")
 
         response = {"replyTo": request_id} if request_id else {}
 
-        result, error = await rpc.call(proc_name, args, kwargs)
-        if error is not None:
-            response["error"] = error
+        if "batch" in data:
+            response["results"] = await self.call_batch(data["batch"], data.get("ordered", False))
         else:
-            response["result"] = result
+            response.update(await self.call_rpc(data))
 
         if request_id:
             try:
-                await self.pipe.write(json.dumps(response))
-            except PipeWriteError as e:
+                await self.connection.write([response])
+            except TransportError as e:
                 logger.error(f"[handle_rpc] Pipe write error: {e}")
 
+    async def call_rpc(self, data) -> dict:
+        """
+        Call the RPC described by data, returning {"result": ...} or {"error": ...}.
+        """
+        if not isinstance(data, dict) or "rpc" not in data:
+            return {"error": "Invalid RPC call"}
+
+        result, error = await rpc.call(data["rpc"], data.get("args", []), data.get("kwargs", {}))
+        if error is not None:
+            return {"error": error}
+
+        return {"result": result}
+
+    async def call_batch(self, calls, ordered: bool = False) -> list:
+        if not isinstance(calls, list):
+            return [{"error": "Invalid RPC batch"}]
+
+        if ordered:
+            return [await self.call_rpc(call) for call in calls]
+
+        return list(await asyncio.gather(*(self.call_rpc(call) for call in calls)))
+
     def enqueue_message(self, message: dict):
         """
         Thread-safe method to enqueue a message to be written to the pipe.
         This method can be called from the AS64 processing thread.
         :param message: The message dictionary to send.
         """
-        if self.event_loop is None:
+        if self.event_loop is None or self.batcher is None:
             logger.error("[AS64Coordinator.enqueue_message] Event loop not set.")
             return
 
-        self.event_loop.call_soon_threadsafe(self.out_queue.put_nowait, message)
+        if message is None:
+            # Deliver pending messages ahead of the shutdown sentinel
+            self.event_loop.call_soon_threadsafe(self._enqueue_sentinel)
+            return
+
+        self.batcher.put(message)
         logger.debug(f"[AS64Coordinator.enqueue_message] Enqueued message for writing: {message}")
 
+    def _enqueue_sentinel(self):
+        self.batcher.drain()
+        self.out_queue.put_nowait(None)
+
     def start_as64(self):
         """
         Start the AS64 processing thread
@@ -242,6 +291,13 @@ class AS64Coordinator:
         """Main controller logic."""
         try:
             self.event_loop = asyncio.get_running_loop()
+            rpc.configure(workers=config.get('rpc', 'workers', default=4))
+            self.batcher = MessageBatcher(
+                self.event_loop,
+                self.out_queue.put_nowait,
+                interval=config.get('ipc', 'batch_interval', default=0.005),
+                max_size=config.get('ipc', 'batch_size', default=32)
+            )
             
             await self.pipe.create()
             await self.pipe.connect()
@@ -266,6 +322,10 @@ class AS64Coordinator:
             self.stop_event.set()
             self.enqueue_message(None)  # Enqueue sentinel
 
+            for task in self.rpc_tasks:
+                task.cancel()
+            rpc.shutdown()
+
             await self.pipe.close()
                 
                        
@@ -280,7 +340,7 @@ if __name__ == "__main__":
     def start():
         return controller.start_as64()
     
-    @rpc.register("as64.stop")
+    @rpc.register("as64.stop", policy=rpc.ExecutionPolicy.DEDICATED)
     def stop():
         return controller.stop_as64()
     
@@ -9,4 +9,6 @@
 
 from .as64 import AS64, GameController, GameState
 from .route import Route
-from .capture import GameCapture
\ No newline at end of file
+from .capture import GameCapture
+from .history import GameStateHistory
+from .changes import StateChange
\ No newline at end of file
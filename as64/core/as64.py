@@ -8,29 +8,50 @@
 # For more information see https://github.com/Kainev/AutoSplit64?tab=readme#license
 
 import time
+import logging
 from dataclasses import dataclass
-from typing import Optional
+from typing import Optional, Type
 
 from as64 import (
     config,
 )
 
 from as64.core.route import Route, Split, load as load_route
-from as64.core.capture import GameCapture
+from as64.core.capture import GameCapture, CapturePipeline
+from as64.core.profiling import profiler
+from as64.core.recording import FrameRecorder, RecordingError, create_recorder
+from as64.core.changes import ChangeTracker
+from as64.core.history import GameStateHistory, create_history
+from as64.core.smoothing import create_prediction_filter
+from as64.core.scheduler import FrameReport, FrameScheduler, PacingMode, from_config as scheduler_from_config
 
 from as64.enums import Version, FadeStatus, Camera, AS64Status
 from as64.plugins import PluginManager, SplitPlugin, CapturePlugin
 
 from as64 import api
 
-@dataclass
+logger = logging.getLogger(__name__)
+
+@dataclass(slots=True)
 class TimedEvent:
     started: float = 0.0
     stopped: float = 0.0
 
 
 class GameState(object):
-    def __init__(self, route, game_capture: GameCapture) -> None:
+    __slots__ = (
+        "current_time", "last_split_time", "last_fade_out_time", "last_fade_in_time", "last_reset_time",
+        "delta", "frame_index", "frame_report",
+        "x_cam", "mario_cam", "lakitu_cam", "save_menu",
+        "star_count", "fade_out_count", "fade_in_count", "x_cam_count", "camera",
+        "in_bowser_fight", "fade_status", "in_intro",
+        "prediction", "probability", "stable_prediction", "stable_since_frame",
+        "route", "current_split", "current_split_index", "external_split_update",
+        "frame", "view", "region",
+        "history",
+    )
+    
+    def __init__(self, route, game_capture: GameCapture, history: Optional[GameStateHistory] = None) -> None:
         # Timing
         self.current_time: float = 0        # Time the most recent analyzed frame occured
         self.last_split_time: float = 0     # Time the last split occured
@@ -38,6 +59,8 @@ class GameState(object):
         self.last_fade_in_time: float = 0   # Time the last fade-in began
         self.last_reset_time: float = 0     # Time the last reset occured
         self.delta: float = 0               # Amount of time the last frame took to execute
+        self.frame_index: int = 0           # Scheduler index of the most recent analyzed frame
+        self.frame_report: FrameReport = FrameReport()  # Pacing report for the previous frame
         
         self.x_cam = TimedEvent()
         self.mario_cam = TimedEvent()
@@ -57,6 +80,8 @@ class GameState(object):
         # Prediction
         self.prediction: int = -1
         self.probability: float = 0
+        self.stable_prediction: int = -1    # Prediction after temporal smoothing, -1 until one is stable
+        self.stable_since_frame: int = -1   # Frame index stable_prediction became stable
 
         # Route
         self.route: Route = route
@@ -66,8 +91,12 @@ class GameState(object):
 
         # Regions
         self.frame = game_capture.region_image
+        self.view = game_capture.region_view
         self.region = game_capture.region_rect
         
+        # Snapshots of previous frames
+        self.history: GameStateHistory = history if history is not None else GameStateHistory()
+        
         
 class GameController(object):
     def __init__(self) -> None:
@@ -89,31 +118,77 @@ class GameController(object):
         self.reset = split_plugin.reset
 
 class AS64(object):
-    def __init__(self, plugin_manager: PluginManager, enqueue_message) -> None:
+    def __init__(self,
+                 plugin_manager: PluginManager,
+                 enqueue_message,
+                 capture_plugin: Optional[CapturePlugin] = None,
+                 split_plugin_class: Optional[Type[SplitPlugin]] = None,
+                 scheduler: Optional[FrameScheduler] = None,
+                 route: Optional[Route] = None,
+                 record: Optional[bool] = None) -> None:
+        """
+        :param plugin_manager: Plugin manager providing the active plugins.
+        :param enqueue_message: Callable used to send messages to the UI.
+        :param capture_plugin: Capture plugin instance to use instead of the active capture plugin.
+        :param split_plugin_class: Split plugin class to use instead of the active split plugin.
+        :param scheduler: Frame scheduler to use instead of one created from the [scheduler] configuration.
+        :param route: Route to use instead of loading route.path.
+        :param record: Record captured frames. Defaults to recording.enabled.
+        """
         self._plugin_manager = plugin_manager
         self._enqueue_message = enqueue_message
         
-        self._route = load_route(config.get('route', 'path'))
+        self._route = route or load_route(config.get('route', 'path'))
                 
-        self._capture_plugin: CapturePlugin = plugin_manager.get_active_plugin_classes(api.CapturePlugin)()           
+        self._capture_plugin: CapturePlugin = capture_plugin or plugin_manager.get_active_plugin_classes(api.CapturePlugin)()           
             
-        self._game_capture: GameCapture = GameCapture(Version.JP, config.get('capture', 'region'),  self._capture_plugin)
-        self._game_state = GameState(self._route, self._game_capture)
         self._game_controller = GameController()
+        self._scheduler = scheduler or scheduler_from_config(self._game_controller.fps)
+        
+        capture_pipeline = None
+        if config.get('capture', 'pipelined', default=False):
+            # Grab frames as fast as possible when the scheduler does not pace the loop, and
+            # never drop them, so unpaced analysis of a recording or video is deterministic
+            unlimited = self._scheduler.mode == PacingMode.UNLIMITED
+            capture_pipeline = CapturePipeline(
+                self._capture_plugin,
+                size=config.get('capture', 'buffer_size', default=3),
+                lossless=unlimited or config.get('capture', 'lossless', default=False),
+                fps=None if unlimited else self._game_controller.fps
+            )
+            
+        self._capture_pipeline: Optional[CapturePipeline] = capture_pipeline
+        self._game_capture: GameCapture = GameCapture(Version.JP, config.get('capture', 'region'),  self._capture_plugin, capture_pipeline)
+        self._game_state = GameState(self._route, self._game_capture, create_history())
+        self._record = config.get('recording', 'enabled', default=False) if record is None else record
+        self._recorder: Optional[FrameRecorder] = None
+        self._prediction_filter = create_prediction_filter()
+        
+        profiler.configure(
+            enabled=config.get('profiling', 'enabled', default=True),
+            size=config.get('profiling', 'samples', default=512),
+            interval=config.get('profiling', 'interval', default=5.0)
+        )
         
         # Register with API
         api.get_game_controller = self._get_game_controller
         api.get_game_state = self._get_game_state
         
-        self._split_plugin: SplitPlugin = plugin_manager.get_active_plugin_classes(api.SplitPlugin)(self._game_state)
+        split_plugin_class = split_plugin_class or plugin_manager.get_active_plugin_classes(api.SplitPlugin)
+        self._split_plugin: SplitPlugin = split_plugin_class(self._game_state)
         
         self._game_controller._register_split_plugin(self._split_plugin)
         self._plugin_manager.instantiate_plugins(api.GameStatePlugin)
         self._plugin_manager.run_method(api.GameStatePlugin, "initialize", self._game_state, self._game_controller)
         
+        self._change_tracker = ChangeTracker(self._game_state, api.emitter.emit)
+        
         self._game_state_plugins = plugin_manager.get_plugin_instances(api.GameStatePlugin)
         self._realtime_plugins = [plugin for plugin in plugin_manager.get_plugin_instances(api.Plugin) if plugin.is_realtime]
         
+        self._game_state_executor = plugin_manager.create_executor(self._game_state_plugins, enqueue_message, profiler.plugin)
+        self._realtime_executor = plugin_manager.create_executor(self._realtime_plugins, enqueue_message, profiler.plugin)
+        
     def is_valid(self):
         if not self._capture_plugin.is_valid():
             return False
@@ -129,41 +204,128 @@ class AS64(object):
         return self._game_state
     
     def _on_start(self) -> None:
+        if self._record:
+            self._recorder = create_recorder()
+            
+        self._game_capture.start()
+        
         self._plugin_manager.run_method(api.GameStatePlugin, "start", self._game_state, self._game_controller)
         self._plugin_manager.run_method(api.Plugin, "start", self._game_state, self._game_controller)
         
     def _on_stop(self) -> None:
+        self._game_state_executor.shutdown()
+        self._realtime_executor.shutdown()
+        
         self._plugin_manager.run_method(api.Plugin, "stop")
         
         self._plugin_manager.run_method(api.GameStatePlugin, "stop")
         self._plugin_manager.run_method(api.GameStatePlugin, "shutdown")
         
+        self._game_capture.stop()
+        
+        if self._recorder:
+            self._recorder.close()
+            self._recorder = None
+        
+    def _record_frame(self) -> None:
+        try:
+            self._recorder.write(self._game_capture.image, self._game_capture.timestamp)
+        except RecordingError as e:
+            # e.g. the capture source was resized. Stop recording but keep analysing
+            message = f"Recording stopped: {e}"
+            logger.error(f"[AS64._record_frame] {message}")
+            self._enqueue_message({"event": "warning", "data": message})
+            
+            self._recorder.close()
+            self._recorder = None
+        
     def run(self, stop_event) -> None:
         self._on_start()
+        
+        try:
+            self._run(stop_event)
+        finally:
+            self._on_stop()
+        
+    def _run(self, stop_event) -> None:
         self._enqueue_message({"event": "status", "data": AS64Status.RUNNING.value})
         
+        capture_latency = profiler.stage("capture")
+        sync_latency = profiler.stage("sync")
+        plugins_latency = profiler.stage("plugins")
+        realtime_latency = profiler.stage("realtime")
+        sleep_latency = profiler.stage("sleep")
+        frame_latency = profiler.stage("frame")
+        
+        self._scheduler.start()
+        
         while not stop_event.is_set():
-            self._game_state.current_time = time.perf_counter()
+            frame_start = self._scheduler.begin()
+            self._game_state.frame_index = self._scheduler.frame
             
             # Capture the current frame
             self._game_capture.capture()
             
+            # Stop may be requested by the capture source itself, e.g. at the end of a replay
+            if stop_event.is_set():
+                break
+            
+            self._game_state.current_time = self._game_capture.timestamp
+            
+            if self._recorder and self._game_capture.image is not None:
+                self._record_frame()
+                
+            capture_end = time.perf_counter()
+            
             # Sync Split Plugin
             self._split_plugin.sync()
             
+            sync_end = time.perf_counter()
+            
             # Execute GameState plugins
-            for plugin in self._game_state_plugins:
-                plugin.execute(self._game_state, self._game_controller)
+            self._game_state_executor.execute(self._game_state, self._game_controller)
+            
+            # Smooth the star prediction made by the GameState plugins
+            self._game_state.stable_prediction = self._prediction_filter.update(
+                self._game_state.frame_index,
+                self._game_state.prediction,
+                self._game_state.probability
+            )
+            self._game_state.stable_since_frame = self._prediction_filter.stable_since
+            
+            # Notify subscribers of fields changed by this stage
+            self._change_tracker.publish()
+            
+            plugins_end = time.perf_counter()
 
-            # # Execute Real Time Plugins
-            for plugin in self._realtime_plugins:
-                plugin.execute(self._game_state, self._game_controller)
+            # Execute Real Time Plugins
+            self._realtime_executor.execute(self._game_state, self._game_controller)
+            
+            # Notify subscribers of fields changed by this stage
+            self._change_tracker.publish()
+            
+            self._game_state.history.record(self._game_state)
+            
+            realtime_end = time.perf_counter()
 
             # Limit FPS
-            try:
-                self._game_state.delta = time.perf_counter() - self._game_state.current_time
-                time.sleep(1 / self._game_controller.fps - self._game_state.delta)
-            except ValueError:
-                pass
-
-        self._on_stop()
+            self._scheduler.fps = self._game_controller.fps
+            
+            # Grab frames at the same rate, unless the pipeline grabs as fast as possible
+            if self._capture_pipeline and self._capture_pipeline.fps is not None:
+                self._capture_pipeline.fps = self._game_controller.fps
+                
+            self._game_state.frame_report = self._scheduler.wait()
+            self._game_state.delta = self._game_state.frame_report.work
+            
+            frame_end = time.perf_counter()
+            
+            if profiler.enabled:
+                capture_latency.add(capture_end - frame_start)
+                sync_latency.add(sync_end - capture_end)
+                plugins_latency.add(plugins_end - sync_end)
+                realtime_latency.add(realtime_end - plugins_end)
+                sleep_latency.add(frame_end - realtime_end)
+                frame_latency.add(frame_end - frame_start)
+                
+                profiler.publish(frame_end, self._enqueue_message)
@@ -7,46 +7,427 @@
 #
 # For more information see https://github.com/Kainev/AutoSplit64?tab=readme#license
 
+import time
+import threading
+import logging
+from typing import List, Optional, Tuple
+
+import numpy as np
+import cv2
+
 import as64.config as config
 
 from as64.enums import Region, Version
+from as64.core.scheduler import FrameScheduler
+
+logger = logging.getLogger(__name__)
+
+
+class FrameRing(object):
+    """
+    Bounded ring of preallocated frames shared between a single producer and a single consumer thread.
+    
+    In the default mode the consumer always receives the newest frame and older frames are overwritten.
+    In lossless mode the producer blocks while the ring is full so every frame is consumed in order.
+    The slot handed to the consumer is never written to until the consumer requests another frame.
+    """
+    
+    def __init__(self, size: int, lossless: bool = False) -> None:
+        if size < 3:
+            raise ValueError("FrameRing requires at least 3 slots.")
+        
+        self._size = size
+        self._lossless = lossless
+        
+        self._frames: List[Optional[np.ndarray]] = [None] * size
+        self._timestamps = np.zeros(size, dtype=np.float64)
+        self._sequences = np.full(size, -1, dtype=np.int64)
+        
+        self._condition = threading.Condition()
+        self._closed = False
+        
+        self._written = 0       # Number of frames committed by the producer
+        self._released = 0      # Number of frames the consumer has finished with (lossless)
+        self._write_slot = -1   # Slot the producer last wrote to
+        self._latest = -1       # Slot holding the newest committed frame
+        self._held = -1         # Slot currently held by the consumer
+        self._last_sequence = -1
+        
+    @property
+    def size(self) -> int:
+        return self._size
+    
+    @property
+    def lossless(self) -> bool:
+        return self._lossless
+        
+    def close(self) -> None:
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+    
+    def put(self, image: np.ndarray, timestamp: float) -> bool:
+        """
+        Copy `image` into a free slot and publish it to the consumer.
+        Returns False if the ring was closed while waiting for a free slot.
+        """
+        slot = self._acquire_write_slot()
+        
+        if slot < 0:
+            return False
+        
+        frame = self._frames[slot]
+        if frame is None or frame.shape != image.shape or frame.dtype != image.dtype:
+            frame = self._frames[slot] = np.empty_like(image)
+            
+        np.copyto(frame, image)
+        
+        with self._condition:
+            self._timestamps[slot] = timestamp
+            self._sequences[slot] = self._written
+            self._written += 1
+            self._latest = slot
+            self._condition.notify_all()
+            
+        return True
+    
+    def get(self, timeout: Optional[float] = None) -> Tuple[Optional[np.ndarray], float, int]:
+        """
+        Wait for the next frame and hold it until a following call returns another frame.
+        Returns (frame, timestamp, sequence), or (None, 0.0, -1) on timeout or if the ring is closed.
+        """
+        with self._condition:
+            if self._lossless:
+                # The held frame is released only once the next one is handed out, so it is
+                # not overwritten if the consumer keeps using it after a timeout
+                held = 1 if self._held >= 0 else 0
+                
+                ready = self._condition.wait_for(lambda: self._closed or self._written > self._released + held, timeout)
+                if not ready or self._written <= self._released + held:
+                    return None, 0.0, -1
+                
+                if held:
+                    self._released += 1
+                    self._condition.notify_all()
+                
+                self._held = self._released % self._size
+            else:
+                ready = self._condition.wait_for(
+                    lambda: self._closed or (self._latest >= 0 and self._sequences[self._latest] > self._last_sequence),
+                    timeout
+                )
+                if not ready or self._latest < 0 or self._sequences[self._latest] <= self._last_sequence:
+                    return None, 0.0, -1
+                
+                self._held = self._latest
+            
+            self._last_sequence = int(self._sequences[self._held])
+            
+            return self._frames[self._held], float(self._timestamps[self._held]), self._last_sequence
+    
+    def _acquire_write_slot(self) -> int:
+        with self._condition:
+            if self._lossless:
+                self._condition.wait_for(lambda: self._closed or self._written - self._released < self._size)
+                
+                if self._closed:
+                    return -1
+                
+                return self._written % self._size
+            
+            if self._closed:
+                return -1
+            
+            slot = self._write_slot
+            for _ in range(self._size):
+                slot = (slot + 1) % self._size
+                if slot != self._latest and slot != self._held:
+                    break
+                
+            self._write_slot = slot
+            return slot
+        
+        
+class CapturePipeline(object):
+    """
+    Runs the capture plugin on a dedicated grab thread, filling a FrameRing
+    so frame capture overlaps with analysis on the processing thread.
+    """
+    
+    def __init__(self, capture_plugin, size: int = 3, lossless: bool = False, fps: Optional[float] = None) -> None:
+        """
+        :param capture_plugin: Capture plugin used to grab frames.
+        :param size: Number of preallocated frames in the ring.
+        :param lossless: If True, every captured frame is handed to the consumer in order.
+        :param fps: Rate at which frames are grabbed. If None, frames are grabbed as fast as the plugin allows.
+        """
+        self._capture_plugin = capture_plugin
+        self._ring = FrameRing(size, lossless)
+        self._fps = fps
+        
+        self._thread: threading.Thread = None
+        self._stop_event = threading.Event()
+        self._error: Optional[Exception] = None
+        
+    @property
+    def ring(self) -> FrameRing:
+        return self._ring
+    
+    @property
+    def fps(self) -> Optional[float]:
+        """Rate at which frames are grabbed. Changes are applied by the grab thread from its next frame."""
+        return self._fps
+    
+    @fps.setter
+    def fps(self, fps: float) -> None:
+        self._fps = fps
+        
+    def start(self) -> None:
+        if self._thread and self._thread.is_alive():
+            return
+        
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="AS64CaptureThread", daemon=True)
+        self._thread.start()
+        
+    def stop(self) -> None:
+        self._stop_event.set()
+        self._ring.close()
+        
+        if self._thread:
+            self._thread.join(timeout=2)
+            self._thread = None
+            
+    def get(self, timeout: Optional[float] = None) -> Tuple[Optional[np.ndarray], float]:
+        """
+        Retrieve the next frame and its capture timestamp.
+        Re-raises any exception raised by the capture plugin on the grab thread.
+        """
+        frame, timestamp, _ = self._ring.get(timeout)
+        
+        if frame is None and self._error is not None:
+            raise self._error
+        
+        return frame, timestamp
+    
+    def _run(self) -> None:
+        scheduler = FrameScheduler(self._fps) if self._fps else None
+        
+        if scheduler:
+            scheduler.start()
+        
+        while not self._stop_event.is_set():
+            timestamp = scheduler.begin() if scheduler else time.perf_counter()
+            
+            try:
+                image = self._capture_plugin.capture()
+            except Exception as e:
+                logger.exception("[CapturePipeline._run] Capture plugin raised an exception.")
+                self._error = e
+                self._ring.close()
+                return
+            
+            frame_time = self._capture_plugin.frame_time()
+            if frame_time is not None:
+                timestamp = frame_time
+            
+            if image is not None and not self._ring.put(image, timestamp):
+                return
+            
+            if scheduler:
+                scheduler.fps = self._fps
+                scheduler.wait()
+
+
+class RegionView(object):
+    """
+    A view of a single region of the current frame.
+    
+    The region rect is compiled into a slice index once, so the region image is a zero-copy
+    view into the captured frame. Derived forms (grayscale, HSV, resized) are computed at most
+    once per frame into scratch buffers that are reused across frames.
+    """
+    
+    __slots__ = (
+        "region",
+        "rect",
+        "_index",
+        "_image",
+        "_frame",
+        "_bgr",
+        "_bgr_frame",
+        "_gray",
+        "_gray_frame",
+        "_hsv",
+        "_hsv_frame",
+        "_resized",
+    )
+    
+    def __init__(self, region: Region, rect: List[int]) -> None:
+        x, y, width, height = rect
+        
+        self.region = region
+        self.rect = rect
+        
+        self._index = (slice(y, y + height), slice(x, x + width))
+        self._image: Optional[np.ndarray] = None
+        self._frame = -1
+        
+        self._bgr: Optional[np.ndarray] = None
+        self._bgr_frame = -1
+        self._gray: Optional[np.ndarray] = None
+        self._gray_frame = -1
+        self._hsv: Optional[np.ndarray] = None
+        self._hsv_frame = -1
+        self._resized = {}
+        
+    @property
+    def image(self) -> Optional[np.ndarray]:
+        """Zero-copy view of the region within the current frame."""
+        return self._image
+    
+    @property
+    def frame(self) -> int:
+        """Index of the frame the view currently refers to."""
+        return self._frame
+    
+    def bgr(self) -> np.ndarray:
+        """The region as a 3 channel BGR image, converting from BGRA if needed."""
+        if self._image.ndim == 3 and self._image.shape[2] == 3:
+            return self._image
+        
+        if self._bgr_frame != self._frame:
+            self._bgr = _ensure_buffer(self._bgr, self._image.shape[:2] + (3,))
+            cv2.cvtColor(self._image, _to_bgr_code(self._image), dst=self._bgr)
+            self._bgr_frame = self._frame
+            
+        return self._bgr
+    
+    def gray(self) -> np.ndarray:
+        """The region converted to single channel grayscale."""
+        if self._image.ndim == 2:
+            return self._image
+        
+        if self._gray_frame != self._frame:
+            self._gray = _ensure_buffer(self._gray, self._image.shape[:2])
+            cv2.cvtColor(self._image, _to_gray_code(self._image), dst=self._gray)
+            self._gray_frame = self._frame
+            
+        return self._gray
+    
+    def hsv(self) -> np.ndarray:
+        """The region converted to HSV."""
+        if self._hsv_frame != self._frame:
+            bgr = self.bgr()
+            self._hsv = _ensure_buffer(self._hsv, bgr.shape)
+            cv2.cvtColor(bgr, cv2.COLOR_BGR2HSV, dst=self._hsv)
+            self._hsv_frame = self._frame
+            
+        return self._hsv
+    
+    def resized(self, width: int, height: int, interpolation: int = cv2.INTER_AREA) -> np.ndarray:
+        """The region resized to (width, height)."""
+        key = (width, height, interpolation)
+        entry = self._resized.get(key)
+        
+        if entry is None:
+            entry = self._resized[key] = [None, -1]
+            
+        if entry[1] != self._frame:
+            entry[0] = _ensure_buffer(entry[0], (height, width) + self._image.shape[2:])
+            cv2.resize(self._image, (width, height), dst=entry[0], interpolation=interpolation)
+            entry[1] = self._frame
+            
+        return entry[0]
+    
+    def model_input(self) -> np.ndarray:
+        """The region resized to the input size of the configured star prediction model."""
+        return self.resized(config.get('model', 'width'), config.get('model', 'height'))
+    
+    def _update(self, game_image: Optional[np.ndarray], frame: int) -> None:
+        self._image = None if game_image is None else game_image[self._index]
+        self._frame = frame
+
+
+def _ensure_buffer(buffer: Optional[np.ndarray], shape: Tuple[int, ...]) -> np.ndarray:
+    if buffer is None or buffer.shape != shape:
+        return np.empty(shape, dtype=np.uint8)
+    
+    return buffer
+
+
+def _to_gray_code(image: np.ndarray) -> int:
+    return cv2.COLOR_BGRA2GRAY if image.shape[2] == 4 else cv2.COLOR_BGR2GRAY
+
+
+def _to_bgr_code(image: np.ndarray) -> int:
+    return cv2.COLOR_BGRA2BGR if image.ndim == 3 and image.shape[2] == 4 else cv2.COLOR_GRAY2BGR
 
 
 class GameCapture(object):
-    def __init__(self, version, game_region, capture_plugin):
+    def __init__(self, version, game_region, capture_plugin, pipeline: Optional[CapturePipeline] = None):
         self._version = version
         self._game_region = game_region
  
         self._regions = _generate_regions(game_region, version)
+        self._views = {region: RegionView(region, rect) for region, rect in self._regions.items()}
         
         self._capture_plugin = capture_plugin
+        self._pipeline = pipeline
 
         self._game_image = None
-        self._region_images = {}
+        self._frame = -1
+        
+        self.timestamp: float = 0   # Time the current frame was captured
+        
+    def start(self):
+        if self._pipeline:
+            self._pipeline.start()
+            
+    def stop(self):
+        if self._pipeline:
+            self._pipeline.stop()
         
     def capture(self):
-        self._game_image = self._capture_plugin.capture() 
-        self._region_images.clear()
+        if self._pipeline:
+            image, timestamp = self._pipeline.get(timeout=1.0)
+            
+            # No new frame arrived in time, keep analysing the previous frame
+            if image is not None:
+                self._game_image = image
+                self.timestamp = timestamp
+        else:
+            self.timestamp = time.perf_counter()
+            self._game_image = self._capture_plugin.capture()
+            
+            frame_time = self._capture_plugin.frame_time()
+            if frame_time is not None:
+                self.timestamp = frame_time
+            
+        self._frame += 1
         
-    def region_image(self, region: Region):
-        if region in self._region_images:
-            return self._region_images[region]
+        for view in self._views.values():
+            view._update(self._game_image, self._frame)
         
+    @property
+    def image(self):
+        """The full captured frame."""
+        return self._game_image
+        
+    def region_image(self, region: Region):
         try:
-            self._region_images[region] = self._get_crop(*self._regions[region])
-            return self._region_images[region]
+            return self._views[region].image
         except KeyError:
             return None
         
+    def region_view(self, region: Region) -> Optional[RegionView]:
+        return self._views.get(region)
+        
     def region_rect(self, region: Region):
         try:
             return self._regions[region]
         except KeyError:
             return None
-        
-    def _get_crop(self, x, y, width, height):
-        # TODO: Add a crop function util class for plugins developers?
-        return self._game_image[y:y + height, x:x + width]
     
 def _calculate_region(game_region, region_ratio) -> list:
     return [
@@ -0,0 +1,81 @@
+# AutoSplit64
+#
+# Copyright (C) 2025 Kainev
+#
+# This project is currently not open source and is under active development.
+# You may view the code, but it is not licensed for distribution, modification, or use at this time.
+#
+# For more information see https://github.com/Kainev/AutoSplit64?tab=readme#license
+
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List
+
+from as64.enums import Event
+
+
+@dataclass(slots=True, frozen=True)
+class StateChange:
+    field: str      # GameState attribute which changed
+    old: Any
+    new: Any
+    time: float     # GameState.current_time of the frame the change was detected in
+    frame: int      # GameState.frame_index of the frame the change was detected in
+
+
+# GameState attribute -> Event emitted when it changes
+WATCHED_FIELDS: Dict[str, Event] = {
+    "star_count": Event.STAR_COUNT_CHANGED,
+    "fade_status": Event.FADE_STATUS_CHANGED,
+    "camera": Event.CAMERA_CHANGED,
+    "stable_prediction": Event.STABLE_PREDICTION_CHANGED,
+    "current_split_index": Event.SPLIT_INDEX_CHANGED,
+    "in_bowser_fight": Event.BOWSER_FIGHT_CHANGED,
+    "in_intro": Event.INTRO_CHANGED,
+}
+
+
+class ChangeTracker(object):
+    """
+    Publishes an event whenever a watched GameState field changes.
+
+    publish() compares each watched field against the value seen by the previous call and
+    emits the field's Event with a StateChange for every field which differs, so plugins can
+    subscribe to changes rather than comparing fields themselves each frame.
+    """
+
+    def __init__(self, game_state, emit: Callable[..., None], fields: Dict[str, Event] = WATCHED_FIELDS) -> None:
+        """
+        :param game_state: GameState to watch.
+        :param emit: Callable used to emit change events, e.g. api.emitter.emit.
+        :param fields: GameState attributes to watch, and the Event emitted for each.
+        """
+        self._game_state = game_state
+        self._emit = emit
+        self._fields = tuple(fields.items())
+        self._values: List[Any] = []
+
+        self.reset()
+
+    def publish(self) -> int:
+        """
+        Emit events for fields which changed since the previous call.
+        :return: Number of changes published.
+        """
+        game_state = self._game_state
+        values = self._values
+        changes = 0
+
+        for index, (field, event) in enumerate(self._fields):
+            value = getattr(game_state, field)
+            old = values[index]
+
+            if value != old:
+                values[index] = value
+                self._emit(event, StateChange(field, old, value, game_state.current_time, game_state.frame_index))
+                changes += 1
+
+        return changes
+
+    def reset(self) -> None:
+        """Take the current GameState values as the baseline without emitting events."""
+        self._values = [getattr(self._game_state, field) for field, _ in self._fields]
@@ -0,0 +1,161 @@
+# AutoSplit64
+#
+# Copyright (C) 2025 Kainev
+#
+# This project is currently not open source and is under active development.
+# You may view the code, but it is not licensed for distribution, modification, or use at this time.
+#
+# For more information see https://github.com/Kainev/AutoSplit64?tab=readme#license
+
+from typing import Any
+
+import numpy as np
+
+from as64 import config
+from as64.enums import Camera, FadeStatus
+
+
+# (GameState attribute, dtype) recorded per frame. Attributes of TimedEvents are flattened as `event.attribute`.
+SNAPSHOT_FIELDS = (
+    ("frame_index", np.int64),
+    ("current_time", np.float64),
+    ("delta", np.float64),
+    ("last_split_time", np.float64),
+    ("last_fade_out_time", np.float64),
+    ("last_fade_in_time", np.float64),
+    ("last_reset_time", np.float64),
+    ("x_cam.started", np.float64),
+    ("x_cam.stopped", np.float64),
+    ("mario_cam.started", np.float64),
+    ("mario_cam.stopped", np.float64),
+    ("lakitu_cam.started", np.float64),
+    ("lakitu_cam.stopped", np.float64),
+    ("save_menu.started", np.float64),
+    ("save_menu.stopped", np.float64),
+    ("star_count", np.int32),
+    ("fade_out_count", np.int32),
+    ("fade_in_count", np.int32),
+    ("x_cam_count", np.int32),
+    ("camera", np.int16),
+    ("in_bowser_fight", np.bool_),
+    ("fade_status", np.int16),
+    ("in_intro", np.bool_),
+    ("prediction", np.int32),
+    ("probability", np.float32),
+    ("stable_prediction", np.int32),
+    ("stable_since_frame", np.int64),
+    ("current_split_index", np.int32),
+)
+
+SNAPSHOT_DTYPE = np.dtype([(name, dtype) for name, dtype in SNAPSHOT_FIELDS])
+
+
+class GameStateHistory(object):
+    """
+    Fixed-length ring of per-frame GameState snapshots.
+
+    Snapshots are stored in a preallocated structured NumPy array, so recording a frame
+    writes a single row and never allocates a new array. Enum fields are stored by value
+    (0 for None) and decoded again by get(); star_count is stored as -1 when unknown.
+    """
+
+    def __init__(self, size: int = 300) -> None:
+        """
+        :param size: Number of frames kept.
+        """
+        self.size = size
+
+        self._snapshots = np.zeros(size, dtype=SNAPSHOT_DTYPE)
+        self._index = 0
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def record(self, game_state) -> None:
+        """
+        Store a snapshot of `game_state` as the most recent frame, replacing the oldest if full.
+        """
+        self._snapshots[self._index] = (
+            game_state.frame_index,
+            game_state.current_time,
+            game_state.delta,
+            game_state.last_split_time,
+            game_state.last_fade_out_time,
+            game_state.last_fade_in_time,
+            game_state.last_reset_time,
+            game_state.x_cam.started,
+            game_state.x_cam.stopped,
+            game_state.mario_cam.started,
+            game_state.mario_cam.stopped,
+            game_state.lakitu_cam.started,
+            game_state.lakitu_cam.stopped,
+            game_state.save_menu.started,
+            game_state.save_menu.stopped,
+            -1 if game_state.star_count is None else game_state.star_count,
+            game_state.fade_out_count,
+            game_state.fade_in_count,
+            game_state.x_cam_count,
+            game_state.camera.value if game_state.camera else 0,
+            game_state.in_bowser_fight,
+            game_state.fade_status.value,
+            game_state.in_intro,
+            game_state.prediction,
+            game_state.probability,
+            game_state.stable_prediction,
+            game_state.stable_since_frame,
+            game_state.current_split_index,
+        )
+
+        self._index = self._index + 1 if self._index + 1 < self.size else 0
+        if self._count < self.size:
+            self._count += 1
+
+    def lookback(self, frames: int = 0) -> np.void:
+        """
+        Snapshot recorded `frames` frames before the most recent one.
+        The returned record is a view into the ring and is overwritten once the ring wraps.
+
+        :raises IndexError: If fewer than `frames + 1` frames have been recorded.
+        """
+        if not 0 <= frames < self._count:
+            raise IndexError(f"Cannot look back {frames} frames, {self._count} recorded")
+
+        return self._snapshots[(self._index - 1 - frames) % self.size]
+
+    def get(self, field: str, frames: int = 0) -> Any:
+        """
+        Value of a GameState attribute `frames` frames ago, decoded to its GameState type.
+        Usage:
+            history.get("fade_status", 10)
+        """
+        value = self.lookback(frames)[field]
+
+        if field == "fade_status":
+            return FadeStatus(int(value))
+        if field == "camera":
+            return Camera(int(value)) if value else None
+        if field == "star_count":
+            return None if value < 0 else int(value)
+
+        return value.item()
+
+    def series(self, field: str, frames: int = None) -> np.ndarray:
+        """
+        Copy of the raw values of `field` over the last `frames` frames (all recorded frames by default), oldest first.
+        """
+        count = self._count if frames is None else min(frames, self._count)
+        indices = (np.arange(self._index - count, self._index)) % self.size
+
+        return self._snapshots[field][indices]
+
+    def clear(self) -> None:
+        self._index = 0
+        self._count = 0
+
+
+def create_history() -> GameStateHistory:
+    """
+    Create a GameStateHistory using the [history] configuration section.
+    """
+    return GameStateHistory(config.get('history', 'frames', default=300))
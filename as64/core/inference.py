@@ -0,0 +1,373 @@
+# AutoSplit64
+#
+# Copyright (C) 2025 Kainev
+#
+# This project is currently not open source and is under active development.
+# You may view the code, but it is not licensed for distribution, modification, or use at this time.
+#
+# For more information see https://github.com/Kainev/AutoSplit64?tab=readme#license
+
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import cv2
+
+try:
+    import onnxruntime
+except ImportError:
+    onnxruntime = None
+
+from as64 import config
+
+logger = logging.getLogger(__name__)
+
+
+class InferenceError(Exception):
+    """Raised when the star prediction model cannot be loaded or run."""
+    pass
+
+
+class InferenceService(object):
+    """
+    Shared star count inference over the configured ONNX model.
+
+    The ONNX Runtime session is created once, on first use. Input and output tensors are
+    preallocated for up to `batch_size` images and bound to the session through IO binding,
+    so a prediction performs no allocation beyond the result list. Predictions are cached by
+    a hash of the input image, and repeated inputs (e.g. a static STAR region) skip the model.
+    """
+
+    def __init__(self,
+                 path: str,
+                 width: int,
+                 height: int,
+                 batch_size: int = 4,
+                 intra_op_threads: int = 1,
+                 inter_op_threads: int = 1,
+                 cache_size: int = 64,
+                 scale: float = 1 / 255) -> None:
+        """
+        :param path: Path of the ONNX model.
+        :param width: Model input width.
+        :param height: Model input height.
+        :param batch_size: Maximum number of images evaluated per model run.
+        :param intra_op_threads: Threads used within each model operator.
+        :param inter_op_threads: Threads used to run independent operators.
+        :param cache_size: Number of predictions cached by input hash. 0 disables caching.
+        :param scale: Factor applied to uint8 pixel values before inference.
+        """
+        self.path = path
+        self.width = width
+        self.height = height
+        self.batch_size = max(1, batch_size)
+        self.intra_op_threads = intra_op_threads
+        self.inter_op_threads = inter_op_threads
+        self.cache_size = cache_size
+        self.scale = scale
+
+        self.hits = 0
+        self.misses = 0
+
+        self._session = None
+        self._input_name: Optional[str] = None
+        self._output_name: Optional[str] = None
+        self._inputs: Optional[np.ndarray] = None
+        self._outputs: Optional[np.ndarray] = None
+        self._bindings: Dict[int, object] = {}
+
+        self._cache: "OrderedDict[bytes, Tuple[int, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def loaded(self) -> bool:
+        return self._session is not None
+
+    def load(self) -> None:
+        """
+        Create the inference session and its bound buffers. Called automatically on first use.
+        """
+        if self._session is not None:
+            return
+
+        if onnxruntime is None:
+            raise InferenceError("onnxruntime is not installed.")
+
+        options = onnxruntime.SessionOptions()
+        options.intra_op_num_threads = self.intra_op_threads
+        options.inter_op_num_threads = self.inter_op_threads
+        options.execution_mode = onnxruntime.ExecutionMode.ORT_SEQUENTIAL
+        options.graph_optimization_level = onnxruntime.GraphOptimizationLevel.ORT_ENABLE_ALL
+
+        try:
+            session = onnxruntime.InferenceSession(self.path, sess_options=options, providers=["CPUExecutionProvider"])
+        except Exception as e:
+            raise InferenceError(f"Unable to load model '{self.path}': {e}") from e
+
+        model_input = session.get_inputs()[0]
+        model_output = session.get_outputs()[0]
+
+        channels = model_input.shape[-1] if isinstance(model_input.shape[-1], int) else 3
+        classes = model_output.shape[-1]
+
+        if not isinstance(classes, int):
+            raise InferenceError(f"Model '{self.path}' has an unsupported output shape {model_output.shape}")
+
+        self._input_name = model_input.name
+        self._output_name = model_output.name
+        self._inputs = np.zeros((self.batch_size, self.height, self.width, channels), dtype=np.float32)
+        self._outputs = np.zeros((self.batch_size, classes), dtype=np.float32)
+        self._bindings.clear()
+        self._session = session
+
+        logger.info(f"[InferenceService.load] Loaded model {self.path}")
+
+    def predict(self, image: np.ndarray) -> Tuple[int, float]:
+        """
+        Predict the star count shown in a model input image.
+
+        :param image: uint8 image of the model input size, e.g. RegionView.model_input().
+        :return: (prediction, probability)
+        """
+        return self.predict_batch((image,))[0]
+
+    def predict_batch(self, images: Sequence[np.ndarray]) -> List[Tuple[int, float]]:
+        """
+        Predict the star count of several images, running the model at most once per `batch_size` uncached images.
+        """
+        with self._lock:
+            self.load()
+
+            results: List[Optional[Tuple[int, float]]] = [None] * len(images)
+            pending: List[Tuple[int, Optional[bytes]]] = []
+
+            for index, image in enumerate(images):
+                if image.shape[:2] != (self.height, self.width):
+                    raise InferenceError(f"Expected a {self.width}x{self.height} image, got {image.shape[1]}x{image.shape[0]}")
+
+                key = self._key(image) if self.cache_size else None
+                cached = self._cache.get(key) if key is not None else None
+
+                if cached is not None:
+                    self._cache.move_to_end(key)
+                    self.hits += 1
+                    results[index] = cached
+                else:
+                    self.misses += 1
+                    pending.append((index, key))
+
+            for start in range(0, len(pending), self.batch_size):
+                batch = pending[start:start + self.batch_size]
+
+                for slot, (index, _) in enumerate(batch):
+                    np.multiply(images[index], self.scale, out=self._inputs[slot], casting="unsafe")
+
+                self._run(len(batch))
+
+                outputs = self._outputs[:len(batch)]
+                predictions = outputs.argmax(axis=1)
+
+                for slot, (index, key) in enumerate(batch):
+                    prediction = int(predictions[slot])
+                    result = (prediction, float(outputs[slot, prediction]))
+                    results[index] = result
+
+                    if key is not None:
+                        self._store(key, result)
+
+            return results
+
+    def clear_cache(self) -> None:
+        with self._lock:
+            self._cache.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict:
+        return {"loaded": self.loaded, "hits": self.hits, "misses": self.misses, "cached": len(self._cache)}
+
+    def _run(self, count: int) -> None:
+        binding = self._bindings.get(count)
+
+        if binding is None:
+            inputs = self._inputs[:count]
+            outputs = self._outputs[:count]
+
+            binding = self._session.io_binding()
+            binding.bind_input(self._input_name, "cpu", 0, np.float32, list(inputs.shape), inputs.ctypes.data)
+            binding.bind_output(self._output_name, "cpu", 0, np.float32, list(outputs.shape), outputs.ctypes.data)
+
+            self._bindings[count] = binding
+
+        try:
+            self._session.run_with_iobinding(binding)
+        except Exception as e:
+            raise InferenceError(f"Inference failed: {e}") from e
+
+    def _store(self, key: bytes, result: Tuple[int, float]) -> None:
+        self._cache[key] = result
+
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    @staticmethod
+    def _key(image: np.ndarray) -> bytes:
+        data = image if image.flags.c_contiguous else np.ascontiguousarray(image)
+        return hashlib.blake2b(data, digest_size=16).digest()
+
+
+class ChangeGate(object):
+    """
+    Detects whether an image differs from the last accepted image.
+
+    Images are downsampled to a small grayscale thumbnail and compared by mean absolute
+    difference, so sensor noise and compression artifacts stay below `tolerance` while a
+    changed digit does not. The reference only moves when accept() is called, so gradual
+    drift still accumulates into a change.
+    """
+
+    def __init__(self, width: int = 16, height: int = 10, tolerance: float = 2.0) -> None:
+        """
+        :param width: Thumbnail width.
+        :param height: Thumbnail height.
+        :param tolerance: Mean absolute difference (0-255) above which an image counts as changed.
+        """
+        self.width = width
+        self.height = height
+        self.tolerance = tolerance
+        self.difference: float = 0.0
+
+        self._thumbnail = np.empty((height, width), dtype=np.uint8)
+        self._gray: Optional[np.ndarray] = None
+        self._reference: Optional[np.ndarray] = None
+        self._diff = np.empty((height, width), dtype=np.uint8)
+
+    def changed(self, image: np.ndarray) -> bool:
+        if image.ndim == 3:
+            if self._gray is None or self._gray.shape != image.shape[:2]:
+                self._gray = np.empty(image.shape[:2], dtype=np.uint8)
+            cv2.cvtColor(image, cv2.COLOR_BGR2GRAY, dst=self._gray)
+            image = self._gray
+
+        cv2.resize(image, (self.width, self.height), dst=self._thumbnail, interpolation=cv2.INTER_AREA)
+
+        if self._reference is None:
+            self.difference = float("inf")
+            return True
+
+        cv2.absdiff(self._thumbnail, self._reference, dst=self._diff)
+        self.difference = cv2.mean(self._diff)[0]
+
+        return self.difference > self.tolerance
+
+    def accept(self) -> None:
+        """Use the image last passed to changed() as the reference."""
+        if self._reference is None:
+            self._reference = self._thumbnail.copy()
+        else:
+            self._reference[:] = self._thumbnail
+
+    def reset(self) -> None:
+        self._reference = None
+
+
+class StarPredictor(object):
+    """
+    Predicts the star count of successive frames, reusing the previous prediction while the
+    STAR region is unchanged.
+    """
+
+    def __init__(self, service: Optional[InferenceService] = None, gate: Optional[ChangeGate] = None) -> None:
+        """
+        :param service: InferenceService to predict with. Defaults to the shared service.
+        :param gate: ChangeGate deciding when inference runs. If None, inference runs every frame.
+        """
+        self.service = service or get_service()
+        self.gate = gate
+
+        self.prediction: int = -1
+        self.probability: float = 0.0
+
+        self.inferred = 0
+        self.skipped = 0
+
+    def predict(self, image: np.ndarray) -> Tuple[int, float]:
+        """
+        :param image: Model input image of the STAR region, e.g. RegionView.model_input().
+        :return: (prediction, probability)
+        """
+        if self.gate is not None and not self.gate.changed(image):
+            self.skipped += 1
+            return self.prediction, self.probability
+
+        self.prediction, self.probability = self.service.predict(image)
+        self.inferred += 1
+
+        if self.gate is not None:
+            self.gate.accept()
+
+        return self.prediction, self.probability
+
+    def reset(self) -> None:
+        self.prediction = -1
+        self.probability = 0.0
+
+        if self.gate is not None:
+            self.gate.reset()
+
+
+_service: Optional[InferenceService] = None
+_service_lock = threading.Lock()
+
+
+def get_service() -> InferenceService:
+    """
+    The shared InferenceService, created from the [model] configuration section on first use.
+    """
+    global _service
+
+    with _service_lock:
+        if _service is None:
+            _service = InferenceService(
+                config.get('model', 'path'),
+                config.get('model', 'width'),
+                config.get('model', 'height'),
+                batch_size=config.get('model', 'batch_size', default=4),
+                intra_op_threads=config.get('model', 'intra_op_threads', default=1),
+                inter_op_threads=config.get('model', 'inter_op_threads', default=1),
+                cache_size=config.get('model', 'cache_size', default=64)
+            )
+
+        return _service
+
+
+def reset_service() -> None:
+    """
+    Discard the shared InferenceService, e.g. after the [model] configuration changes.
+    """
+    global _service
+
+    with _service_lock:
+        _service = None
+
+
+def predict(image: np.ndarray) -> Tuple[int, float]:
+    return get_service().predict(image)
+
+
+def predict_batch(images: Sequence[np.ndarray]) -> List[Tuple[int, float]]:
+    return get_service().predict_batch(images)
+
+
+def create_star_predictor() -> StarPredictor:
+    """
+    Create a StarPredictor using the shared service and the [model] change gate configuration.
+    """
+    gate = None
+    if config.get('model', 'change_gate', default=True):
+        gate = ChangeGate(tolerance=config.get('model', 'change_tolerance', default=2.0))
+
+    return StarPredictor(get_service(), gate)
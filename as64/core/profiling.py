@@ -0,0 +1,155 @@
+# AutoSplit64
+#
+# Copyright (C) 2025 Kainev
+#
+# This project is currently not open source and is under active development.
+# You may view the code, but it is not licensed for distribution, modification, or use at this time.
+#
+# For more information see https://github.com/Kainev/AutoSplit64?tab=readme#license
+
+import threading
+from typing import Dict
+
+import numpy as np
+
+from as64.ipc import rpc
+
+
+class LatencyRing(object):
+    """
+    Fixed-size ring of latency samples (in seconds).
+    Recording a sample is O(1) and never allocates; percentiles are computed on demand.
+    """
+
+    __slots__ = ("_samples", "_size", "_index", "_count", "_total")
+
+    def __init__(self, size: int = 512) -> None:
+        self._samples = np.zeros(size, dtype=np.float64)
+        self._size = size
+        self._index = 0
+        self._count = 0
+        self._total = 0
+
+    def add(self, value: float) -> None:
+        self._samples[self._index] = value
+        self._index += 1
+        self._total += 1
+
+        if self._index == self._size:
+            self._index = 0
+        if self._count < self._size:
+            self._count += 1
+
+    def clear(self) -> None:
+        self._index = 0
+        self._count = 0
+        self._total = 0
+
+    def summary(self) -> dict:
+        """
+        Latency statistics over the samples currently held in the ring, in milliseconds.
+        """
+        if self._count == 0:
+            return {"count": 0, "total": self._total, "mean": 0.0, "max": 0.0, "p50": 0.0, "p95": 0.0, "p99": 0.0}
+
+        samples = self._samples[:self._count] * 1000
+        p50, p95, p99 = np.percentile(samples, (50, 95, 99))
+
+        return {
+            "count": self._count,
+            "total": self._total,
+            "mean": float(samples.mean()),
+            "max": float(samples.max()),
+            "p50": float(p50),
+            "p95": float(p95),
+            "p99": float(p99),
+        }
+
+
+class Profiler(object):
+    """
+    Collects per-stage and per-plugin latencies for the processing loop.
+
+    Stages and plugins are identified by name, and each owns a LatencyRing. Callers on the
+    hot path should resolve rings once with stage()/plugin() and call add() directly.
+    """
+
+    STAGES = ("capture", "sync", "plugins", "realtime", "sleep", "frame")
+
+    def __init__(self, size: int = 512, interval: float = 5.0) -> None:
+        """
+        :param size: Number of samples kept per stage and plugin.
+        :param interval: Seconds between summaries published by the processing loop.
+        """
+        self.enabled: bool = True
+        self.interval: float = interval
+
+        self._size = size
+        self._lock = threading.Lock()
+        self._stages: Dict[str, LatencyRing] = {}
+        self._plugins: Dict[str, LatencyRing] = {}
+        self._last_publish: float = 0.0
+
+    def configure(self, enabled: bool = True, size: int = 512, interval: float = 5.0) -> None:
+        with self._lock:
+            self.enabled = enabled
+            self.interval = interval
+
+            if size != self._size:
+                self._size = size
+                self._stages.clear()
+                self._plugins.clear()
+
+    def stage(self, name: str) -> LatencyRing:
+        return self._get_ring(self._stages, name)
+
+    def plugin(self, name: str) -> LatencyRing:
+        return self._get_ring(self._plugins, name)
+
+    def reset(self) -> None:
+        with self._lock:
+            for ring in list(self._stages.values()) + list(self._plugins.values()):
+                ring.clear()
+
+    def summary(self) -> dict:
+        with self._lock:
+            return {
+                "stages": {name: ring.summary() for name, ring in self._stages.items()},
+                "plugins": {name: ring.summary() for name, ring in self._plugins.items()},
+            }
+
+    def publish(self, now: float, enqueue_message) -> None:
+        """
+        Send a summary to the UI if at least `interval` seconds have passed since the last one.
+        """
+        if not self.enabled or now - self._last_publish < self.interval:
+            return
+
+        self._last_publish = now
+        enqueue_message({"event": "profiling", "data": self.summary()})
+
+    def _get_ring(self, rings: Dict[str, LatencyRing], name: str) -> LatencyRing:
+        with self._lock:
+            ring = rings.get(name)
+            if ring is None:
+                ring = rings[name] = LatencyRing(self._size)
+
+            return ring
+
+
+profiler = Profiler()
+
+
+@rpc.register("profiling.summary")
+def summary() -> dict:
+    return profiler.summary()
+
+
+@rpc.register("profiling.reset")
+def reset() -> None:
+    profiler.reset()
+
+
+@rpc.register("profiling.set_enabled")
+def set_enabled(enabled: bool) -> None:
+    profiler.enabled = enabled
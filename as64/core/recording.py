@@ -0,0 +1,479 @@
+# AutoSplit64
+#
+# Copyright (C) 2025 Kainev
+#
+# This project is currently not open source and is under active development.
+# You may view the code, but it is not licensed for distribution, modification, or use at this time.
+#
+# For more information see https://github.com/Kainev/AutoSplit64?tab=readme#license
+
+import os
+import json
+import time
+import logging
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+import cv2
+
+from as64 import config
+from as64.plugins import CapturePlugin, PluginMetaData, PluginValidationError
+
+logger = logging.getLogger(__name__)
+
+
+FORMAT_VERSION = 2
+MANIFEST_FILE_NAME = "manifest.json"
+
+
+class RecordingError(Exception):
+    """Raised when a recording cannot be written or read."""
+    pass
+
+
+class FrameRecorder(object):
+    """
+    Records captured frames and their timestamps to a chunked on-disk format.
+
+    A recording is a directory containing a manifest and a series of compressed .npz chunks,
+    each holding up to `chunk_size` frames and their capture timestamps. Only `region` of each
+    frame is stored. Frames are copied into one of `buffers` preallocated chunk buffers on the
+    calling thread, and full chunks are compressed and written on a background thread. If the
+    writer falls behind and every buffer is waiting to be written, frames are dropped rather
+    than allocating more memory.
+    """
+
+    def __init__(self, path: str, chunk_size: int = 30, buffers: int = 3, region: Optional[Sequence[int]] = None) -> None:
+        """
+        :param path: Directory to write the recording to. Created if it does not exist.
+        :param chunk_size: Number of frames stored per chunk.
+        :param buffers: Number of chunk buffers, bounding the chunks waiting to be written.
+        :param region: [x, y, width, height] of each frame to record. Defaults to the whole frame.
+        """
+        self.path = path
+        self.chunk_size = chunk_size
+        self.region = list(region) if region else None
+
+        self._chunks: List[dict] = []
+        self._chunk_index = 0
+        self._frame_count = 0
+        self._dropped = 0
+        self._frame_shape: Optional[Tuple[int, ...]] = None
+        self._shape: Optional[Tuple[int, ...]] = None
+        self._dtype: Optional[np.dtype] = None
+
+        # Buffers are allocated once the frame shape is known, and returned by the writer thread
+        self._buffer_count = max(1, buffers)
+        self._free: "queue.Queue[Tuple[np.ndarray, np.ndarray]]" = queue.Queue()
+        self._buffer: Optional[Tuple[np.ndarray, np.ndarray]] = None
+        self._count = 0
+        self._dropping = False
+
+        self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="AS64Recorder")
+        self._lock = threading.Lock()
+        self._closed = False
+
+        os.makedirs(path, exist_ok=True)
+
+    @property
+    def frame_count(self) -> int:
+        return self._frame_count
+
+    @property
+    def dropped(self) -> int:
+        """Number of frames dropped because the writer thread fell behind."""
+        return self._dropped
+
+    def write(self, frame: np.ndarray, timestamp: float) -> None:
+        """
+        Append a frame to the recording.
+        All frames in a recording must share the shape and dtype of the first frame.
+        """
+        if self._closed:
+            raise RecordingError("Cannot write to a closed recording.")
+
+        if self._frame_shape is None:
+            self._allocate(frame)
+        elif frame.shape != self._frame_shape or frame.dtype != self._dtype:
+            raise RecordingError(f"Frame shape {frame.shape} does not match recording shape {self._frame_shape}.")
+
+        if self._buffer is None:
+            try:
+                self._buffer = self._free.get_nowait()
+            except queue.Empty:
+                self._dropped += 1
+                if not self._dropping:
+                    self._dropping = True
+                    logger.warning("[FrameRecorder.write] Chunk writer is falling behind, dropping frames.")
+                return
+
+            if self._dropping:
+                self._dropping = False
+                logger.warning(f"[FrameRecorder.write] Chunk writer caught up, {self._dropped} frames dropped so far.")
+
+        x, y, width, height = self.region
+        frames, timestamps = self._buffer
+
+        frames[self._count] = frame[y:y + height, x:x + width]
+        timestamps[self._count] = timestamp
+        self._count += 1
+        self._frame_count += 1
+
+        if self._count == self.chunk_size:
+            self._flush()
+
+    def close(self) -> None:
+        """
+        Flush any buffered frames, wait for pending chunks to be written and finalise the manifest.
+        """
+        if self._closed:
+            return
+
+        self._closed = True
+
+        if self._count:
+            self._flush()
+
+        self._writer.shutdown(wait=True)
+        self._write_manifest()
+
+        if self._dropped:
+            logger.warning(f"[FrameRecorder.close] {self._dropped} frames were dropped while recording.")
+
+        logger.info(f"[FrameRecorder.close] Recorded {self._frame_count} frames to {self.path}")
+
+    def _allocate(self, frame: np.ndarray) -> None:
+        height, width = frame.shape[:2]
+
+        # Clamp the region to the frame
+        x, y, region_width, region_height = self.region or (0, 0, width, height)
+        x, y = min(max(int(x), 0), width), min(max(int(y), 0), height)
+        region_width = min(int(region_width), width - x)
+        region_height = min(int(region_height), height - y)
+
+        if region_width <= 0 or region_height <= 0:
+            raise RecordingError(f"Recording region {self.region} lies outside the {width}x{height} frame.")
+
+        self.region = [x, y, region_width, region_height]
+        self._frame_shape = frame.shape
+        self._shape = (region_height, region_width) + frame.shape[2:]
+        self._dtype = frame.dtype
+
+        for _ in range(self._buffer_count):
+            self._free.put((
+                np.empty((self.chunk_size,) + self._shape, dtype=self._dtype),
+                np.zeros(self.chunk_size, dtype=np.float64)
+            ))
+
+    def _flush(self) -> None:
+        file_name = f"chunk_{self._chunk_index:05d}.npz"
+        self._chunk_index += 1
+
+        # Hand the filled buffer to the writer thread, which returns it once written
+        buffer, count = self._buffer, self._count
+
+        self._buffer = None
+        self._count = 0
+
+        self._writer.submit(self._write_chunk, file_name, buffer, count)
+
+    def _write_chunk(self, file_name: str, buffer: Tuple[np.ndarray, np.ndarray], count: int) -> None:
+        frames, timestamps = buffer
+
+        try:
+            np.savez_compressed(os.path.join(self.path, file_name), frames=frames[:count], timestamps=timestamps[:count])
+            
+            # Only chunks which have been fully written are listed in the manifest
+            with self._lock:
+                self._chunks.append({"file": file_name, "frames": count})
+                
+            self._write_manifest()
+        except Exception:
+            logger.exception(f"[FrameRecorder._write_chunk] Failed to write chunk {file_name}")
+        finally:
+            self._free.put(buffer)
+
+    def _write_manifest(self) -> None:
+        with self._lock:
+            manifest = {
+                "version": FORMAT_VERSION,
+                "chunk_size": self.chunk_size,
+                "frame_count": sum(chunk["frames"] for chunk in self._chunks),
+                "dropped": self._dropped,
+                "shape": list(self._shape) if self._shape else None,
+                "frame_shape": list(self._frame_shape) if self._frame_shape else None,
+                "region": self.region,
+                "dtype": str(self._dtype) if self._dtype else None,
+                "chunks": self._chunks,
+            }
+
+            with open(os.path.join(self.path, MANIFEST_FILE_NAME), "w") as file:
+                json.dump(manifest, file, indent=2)
+
+
+class FrameReader(object):
+    """
+    Reads a recording written by FrameRecorder, one chunk at a time.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+
+        try:
+            with open(os.path.join(path, MANIFEST_FILE_NAME), "r") as file:
+                self._manifest = json.load(file)
+        except FileNotFoundError as e:
+            raise RecordingError(f"No recording found at {path}") from e
+        except json.JSONDecodeError as e:
+            raise RecordingError(f"Invalid recording manifest at {path}: {e}") from e
+
+        if self._manifest.get("version") != FORMAT_VERSION:
+            raise RecordingError(f"Unsupported recording version {self._manifest.get('version')}")
+
+    @property
+    def region(self) -> Optional[List[int]]:
+        """[x, y, width, height] of the original frames which was recorded, or None if no frames were recorded."""
+        return self._manifest.get("region")
+
+    @property
+    def frame_shape(self) -> Optional[Tuple[int, ...]]:
+        """Shape of the original captured frames."""
+        shape = self._manifest.get("frame_shape")
+        return tuple(shape) if shape else None
+
+    @property
+    def dtype(self) -> Optional[np.dtype]:
+        dtype = self._manifest.get("dtype")
+        return np.dtype(dtype) if dtype else None
+
+    def __len__(self) -> int:
+        return self._manifest["frame_count"]
+
+    def __iter__(self) -> Iterator[Tuple[np.ndarray, float]]:
+        for chunk in self._manifest["chunks"]:
+            with np.load(os.path.join(self.path, chunk["file"])) as data:
+                frames = data["frames"]
+                timestamps = data["timestamps"]
+
+            for frame, timestamp in zip(frames, timestamps):
+                yield frame, float(timestamp)
+
+
+def recording_path(name: Optional[str] = None) -> str:
+    """
+    Path of a recording within the configured recordings directory.
+    If no name is given a timestamped name is generated.
+    """
+    name = name or time.strftime("%Y%m%d-%H%M%S")
+    return os.path.join(config.get('recording', 'path', default="recordings"), name)
+
+
+def create_recorder() -> FrameRecorder:
+    """
+    Create a FrameRecorder using the [recording] configuration section.
+    """
+    return FrameRecorder(
+        recording_path(),
+        chunk_size=config.get('recording', 'chunk_size', default=30),
+        buffers=config.get('recording', 'buffers', default=3),
+        region=config.get('capture', 'region', default=None)
+    )
+
+
+class ReplayCapturePlugin(CapturePlugin):
+    """
+    Capture plugin which feeds a recording back through the processing pipeline.
+
+    Frames are replayed either at their original timing or as fast as possible. In both
+    cases frame_time() reports the recorded timestamp, so GameState.current_time follows
+    the recording rather than the wall clock and replays are deterministic.
+    """
+
+    metadata = PluginMetaData(
+        name="Replay Capture",
+        version="1.0.0",
+        author="Kainev",
+        description="Replays frames recorded by the frame recorder."
+    )
+
+    def __init__(self, path: Optional[str] = None, realtime: Optional[bool] = None, stop_event: Optional[threading.Event] = None) -> None:
+        """
+        :param path: Recording directory. Defaults to recording.replay_path.
+        :param realtime: Replay at the original timing if True, as fast as possible if False. Defaults to recording.replay_realtime.
+        :param stop_event: Set once the final frame has been replayed.
+        """
+        super().__init__()
+
+        self.path = path or config.get('recording', 'replay_path', default="")
+        self.realtime = config.get('recording', 'replay_realtime', default=True) if realtime is None else realtime
+        self.stop_event = stop_event
+
+        self._frames: Optional[Iterator[Tuple[np.ndarray, float]]] = None
+        self._frame: Optional[np.ndarray] = None
+        self._timestamp: Optional[float] = None
+
+        # Full size frame the recorded region is placed into, when only a region was recorded
+        self._canvas: Optional[np.ndarray] = None
+        self._region: Optional[List[int]] = None
+
+        self._first_timestamp: Optional[float] = None
+        self._start_time: float = 0.0
+
+        self._finished = False
+
+    @property
+    def finished(self) -> bool:
+        return self._finished
+
+    def is_valid(self) -> bool:
+        if not os.path.isfile(os.path.join(self.path, MANIFEST_FILE_NAME)):
+            raise PluginValidationError(f"No recording found at '{self.path}'")
+
+        return True
+
+    def capture(self) -> np.ndarray:
+        if self._frames is None:
+            reader = FrameReader(self.path)
+            self._frames = iter(reader)
+
+            if reader.region is not None and reader.frame_shape is not None:
+                self._region = reader.region
+                self._canvas = np.zeros(reader.frame_shape, dtype=reader.dtype)
+
+        try:
+            frame, self._timestamp = next(self._frames)
+        except StopIteration:
+            # Keep returning the final frame so the pipeline can shut down cleanly
+            self._finished = True
+            if self.stop_event is not None:
+                self.stop_event.set()
+
+            return self._frame
+
+        if self._canvas is not None:
+            x, y, width, height = self._region
+            self._canvas[y:y + height, x:x + width] = frame
+            frame = self._canvas
+
+        self._frame = frame
+
+        if self._first_timestamp is None:
+            self._first_timestamp = self._timestamp
+            self._start_time = time.perf_counter()
+
+        if self.realtime:
+            delay = (self._timestamp - self._first_timestamp) - (time.perf_counter() - self._start_time)
+            if delay > 0:
+                time.sleep(delay)
+
+        return self._frame
+
+    def frame_time(self) -> Optional[float]:
+        return self._timestamp
+
+    def get_available_sources(self) -> List[str]:
+        directory = config.get('recording', 'path', default="recordings")
+
+        try:
+            entries = os.listdir(directory)
+        except FileNotFoundError:
+            return []
+
+        return sorted(
+            entry for entry in entries
+            if os.path.isfile(os.path.join(directory, entry, MANIFEST_FILE_NAME))
+        )
+
+
+class VideoFileCapturePlugin(CapturePlugin):
+    """
+    Capture plugin which reads frames from a video file.
+
+    frame_time() reports the position of each frame within the video, so
+    GameState.current_time follows the video timeline.
+    """
+
+    metadata = PluginMetaData(
+        name="Video File Capture",
+        version="1.0.0",
+        author="Kainev",
+        description="Reads frames from a video file."
+    )
+
+    def __init__(self, path: str, stop_event: Optional[threading.Event] = None) -> None:
+        """
+        :param path: Path of the video file.
+        :param stop_event: Set once the final frame has been read.
+        """
+        super().__init__()
+
+        self.path = path
+        self.stop_event = stop_event
+
+        self._video: Optional[cv2.VideoCapture] = None
+        self._fps: float = 0.0
+        self._index = -1
+
+        self._frame: Optional[np.ndarray] = None
+        self._timestamp: Optional[float] = None
+
+        self._finished = False
+
+    @property
+    def finished(self) -> bool:
+        return self._finished
+
+    @property
+    def frame_count(self) -> int:
+        self._open()
+        return int(self._video.get(cv2.CAP_PROP_FRAME_COUNT))
+
+    def is_valid(self) -> bool:
+        self._open()
+
+        if not self._video.isOpened():
+            raise PluginValidationError(f"Unable to open video file '{self.path}'")
+
+        return True
+
+    def capture(self) -> np.ndarray:
+        self._open()
+
+        ok, frame = self._video.read()
+
+        if not ok:
+            self._finished = True
+            if self.stop_event is not None:
+                self.stop_event.set()
+
+            return self._frame
+
+        self._index += 1
+        self._frame = frame
+
+        position = self._video.get(cv2.CAP_PROP_POS_MSEC)
+        if position > 0 or self._index == 0:
+            self._timestamp = position / 1000
+        else:
+            self._timestamp = self._index / self._fps
+
+        return self._frame
+
+    def frame_time(self) -> Optional[float]:
+        return self._timestamp
+
+    def get_available_sources(self) -> List[str]:
+        return [self.path]
+
+    def release(self) -> None:
+        if self._video is not None:
+            self._video.release()
+            self._video = None
+
+    def _open(self) -> None:
+        if self._video is None:
+            self._video = cv2.VideoCapture(self.path)
+            self._fps = self._video.get(cv2.CAP_PROP_FPS) or 29.97
@@ -23,6 +23,14 @@ def route_rpc_processor(result):
     return result
 
 
+def route_cache_key(file_path: str):
+    # Keyed on modification time, so a route edited on disk is reloaded
+    try:
+        return file_path, path.getmtime(file_path)
+    except OSError:
+        return file_path, None
+
+
 class RouteToken(object):
     ROUTE = "__route__"
     TITLE = "title"
@@ -80,7 +88,7 @@ class Split(object):
             "split_type": self.split_type.value if self.split_type is not None else None,
         }
         
-@rpc.register("route.load", route_rpc_processor)
+@rpc.register("route.load", route_rpc_processor, cache_ttl=30, cache_size=8, cache_key=route_cache_key)
 def load(file_path: str):
     try:
         with open(file_path) as file:
@@ -213,7 +221,7 @@ BLJ_TOKENS = [
     'blj'
 ]
 
-@rpc.register("route.translate_lss", processor=route_rpc_processor)
+@rpc.register("route.translate_lss", processor=route_rpc_processor, policy=rpc.ExecutionPolicy.THREAD_POOL)
 def translate_lss(file_path):
     try:
         if not path.exists(file_path):
@@ -0,0 +1,180 @@
+# AutoSplit64
+#
+# Copyright (C) 2025 Kainev
+#
+# This project is currently not open source and is under active development.
+# You may view the code, but it is not licensed for distribution, modification, or use at this time.
+#
+# For more information see https://github.com/Kainev/AutoSplit64?tab=readme#license
+
+import time
+import math
+from dataclasses import dataclass
+
+from as64 import config
+from as64.enums import PacingMode, OverrunPolicy
+
+
+@dataclass
+class FrameReport:
+    frame: int = 0              # Index of the frame the report describes
+    deadline: float = 0.0       # Absolute time the frame was scheduled to begin
+    started: float = 0.0        # Absolute time the frame actually began
+    lateness: float = 0.0       # How late the frame began relative to its deadline
+    work: float = 0.0           # Time spent processing the frame
+    overrun: bool = False       # True if processing ran past the next deadline
+    overruns: int = 0           # Total overruns since the scheduler started
+    dropped: int = 0            # Frames dropped after this frame
+    dropped_total: int = 0      # Total frames dropped since the scheduler started
+
+
+class FrameScheduler(object):
+    """
+    Paces a processing loop against absolute frame deadlines.
+
+    Deadlines are derived from the time the scheduler started rather than from the
+    end of the previous frame, so jitter in a single frame does not accumulate as drift.
+    """
+
+    def __init__(self,
+                 fps: float,
+                 mode: PacingMode = PacingMode.HYBRID,
+                 overrun_policy: OverrunPolicy = OverrunPolicy.DROP,
+                 spin_threshold: float = 0.002,
+                 max_catch_up: int = 2) -> None:
+        """
+        :param fps: Target frames per second.
+        :param mode: SLEEP relies on time.sleep alone, HYBRID sleeps until close to the deadline and spins for the remainder,
+                     UNLIMITED never waits and runs frames back-to-back.
+        :param overrun_policy: CATCH_UP runs missed frames back-to-back, DROP skips them and realigns to the next deadline.
+        :param spin_threshold: Time before a deadline (in seconds) at which HYBRID mode stops sleeping and starts spinning.
+        :param max_catch_up: Maximum number of frames CATCH_UP will run behind before dropping the backlog.
+        """
+        self.mode = mode
+        self.overrun_policy = overrun_policy
+        self.spin_threshold = spin_threshold
+        self.max_catch_up = max_catch_up
+
+        self._fps: float = fps
+        self._period: float = 1 / fps
+
+        self._frame: int = 0
+        self._deadline: float = 0.0
+        self._started: float = 0.0
+        self._overruns: int = 0
+        self._dropped_total: int = 0
+
+    @property
+    def fps(self) -> float:
+        return self._fps
+
+    @fps.setter
+    def fps(self, fps: float) -> None:
+        if fps == self._fps:
+            return
+
+        # Keep the current deadline, subsequent deadlines use the new period
+        self._fps = fps
+        self._period = 1 / fps
+
+    @property
+    def frame(self) -> int:
+        return self._frame
+
+    @property
+    def deadline(self) -> float:
+        return self._deadline
+
+    def start(self, now: float = None) -> None:
+        """
+        Anchor the first deadline at `now` (defaults to the current time).
+        """
+        now = time.perf_counter() if now is None else now
+
+        self._frame = 0
+        self._deadline = now
+        self._started = now
+        self._overruns = 0
+        self._dropped_total = 0
+
+    def begin(self) -> float:
+        """
+        Mark the beginning of a frame.
+        Returns the time the frame began.
+        """
+        self._started = time.perf_counter()
+        return self._started
+
+    def wait(self) -> FrameReport:
+        """
+        Block until the deadline of the next frame.
+        Returns a report describing the frame that just finished.
+        """
+        now = time.perf_counter()
+
+        report = FrameReport(
+            frame=self._frame,
+            deadline=self._deadline,
+            started=self._started,
+            lateness=max(0.0, self._started - self._deadline),
+            work=now - self._started,
+        )
+
+        self._frame += 1
+
+        if self.mode == PacingMode.UNLIMITED:
+            self._deadline = now
+            report.overruns = self._overruns
+            report.dropped_total = self._dropped_total
+            return report
+
+        self._deadline += self._period
+
+        if now > self._deadline:
+            report.overrun = True
+            self._overruns += 1
+
+            missed = math.floor((now - self._deadline) / self._period) + 1
+
+            if self.overrun_policy == OverrunPolicy.DROP:
+                report.dropped = missed
+            elif missed > self.max_catch_up:
+                report.dropped = missed - self.max_catch_up
+
+            self._deadline += report.dropped * self._period
+            self._frame += report.dropped
+            self._dropped_total += report.dropped
+
+        report.overruns = self._overruns
+        report.dropped_total = self._dropped_total
+
+        # When catching up the deadline has already passed and the next frame begins immediately
+        self._sleep_until(self._deadline)
+
+        return report
+
+    def _sleep_until(self, deadline: float) -> None:
+        if self.mode == PacingMode.HYBRID:
+            remaining = deadline - time.perf_counter() - self.spin_threshold
+            if remaining > 0:
+                time.sleep(remaining)
+
+            while time.perf_counter() < deadline:
+                pass
+        else:
+            remaining = deadline - time.perf_counter()
+            if remaining > 0:
+                time.sleep(remaining)
+
+
+def from_config(fps: float) -> FrameScheduler:
+    """
+    Create a FrameScheduler using the [scheduler] configuration section.
+    """
+    return FrameScheduler(
+        fps,
+        mode=PacingMode(config.get('scheduler', 'mode', default=PacingMode.HYBRID.value)),
+        overrun_policy=OverrunPolicy(config.get('scheduler', 'overrun_policy', default=OverrunPolicy.DROP.value)),
+        spin_threshold=config.get('scheduler', 'spin_threshold', default=0.002),
+        max_catch_up=config.get('scheduler', 'max_catch_up', default=2),
+    )
@@ -0,0 +1,101 @@
+# AutoSplit64
+#
+# Copyright (C) 2025 Kainev
+#
+# This project is currently not open source and is under active development.
+# You may view the code, but it is not licensed for distribution, modification, or use at this time.
+#
+# For more information see https://github.com/Kainev/AutoSplit64?tab=readme#license
+
+import numpy as np
+
+from as64 import config
+
+
+class PredictionFilter(object):
+    """
+    Temporal filter over per-frame star predictions.
+
+    The most recent `window` predictions are kept in a ring, alongside per-class vote counts
+    and accumulated probabilities which are updated incrementally as predictions enter and
+    leave the ring. Predictions below `threshold` probability do not vote.
+
+    A prediction becomes stable once it holds at least `votes` votes within the window. To
+    avoid flickering between two predictions, the current stable prediction is only replaced
+    by one which has also accumulated more confidence within the window.
+    """
+
+    __slots__ = ("window", "votes", "threshold", "classes", "stable", "stable_since",
+                 "_predictions", "_probabilities", "_votes", "_confidence", "_index")
+
+    def __init__(self, window: int = 8, votes: int = 3, threshold: float = 0.6, classes: int = 128) -> None:
+        """
+        :param window: Number of recent predictions considered.
+        :param votes: Votes within the window required for a prediction to become stable.
+        :param threshold: Minimum probability for a prediction to vote.
+        :param classes: Number of possible predictions. Predictions outside [0, classes) are ignored.
+        """
+        self.window = window
+        self.votes = min(votes, window)
+        self.threshold = threshold
+        self.classes = classes
+
+        self.stable: int = -1
+        self.stable_since: int = -1
+
+        self._predictions = np.full(window, -1, dtype=np.int32)
+        self._probabilities = np.zeros(window, dtype=np.float64)
+        self._votes = np.zeros(classes, dtype=np.int32)
+        self._confidence = np.zeros(classes, dtype=np.float64)
+        self._index = 0
+
+    def update(self, frame: int, prediction: int, probability: float) -> int:
+        """
+        Add the prediction for `frame` and return the stable prediction, or -1 if there is none yet.
+        """
+        index = self._index
+
+        previous = self._predictions[index]
+        if previous >= 0:
+            self._votes[previous] -= 1
+            self._confidence[previous] -= self._probabilities[index]
+
+        if probability < self.threshold or not 0 <= prediction < self.classes:
+            prediction = -1
+            probability = 0.0
+        else:
+            self._votes[prediction] += 1
+            self._confidence[prediction] += probability
+
+        self._predictions[index] = prediction
+        self._probabilities[index] = probability
+
+        self._index = index + 1 if index + 1 < self.window else 0
+
+        if prediction >= 0 and prediction != self.stable and self._votes[prediction] >= self.votes:
+            if self.stable < 0 or self._confidence[prediction] > self._confidence[self.stable]:
+                self.stable = prediction
+                self.stable_since = frame
+
+        return self.stable
+
+    def reset(self) -> None:
+        self.stable = -1
+        self.stable_since = -1
+
+        self._predictions.fill(-1)
+        self._probabilities.fill(0)
+        self._votes.fill(0)
+        self._confidence.fill(0)
+        self._index = 0
+
+
+def create_prediction_filter() -> PredictionFilter:
+    """
+    Create a PredictionFilter using the [smoothing] configuration section and thresholds.probability.
+    """
+    return PredictionFilter(
+        window=config.get('smoothing', 'window', default=8),
+        votes=config.get('smoothing', 'votes', default=3),
+        threshold=config.get('thresholds', 'probability', default=0.6)
+    )
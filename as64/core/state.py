@@ -27,6 +27,7 @@ class State:
     def __init__(self) -> None:
         self._transitions: Dict[Any, Transition] = {}
         self._parent: Optional['StateMachine'] = None
+        self._state_id: int = -1
 
     def on_enter(self, sm: 'StateMachine', *args, **kwargs) -> None:
         """
@@ -51,6 +52,41 @@ class State:
             raise ValueError(f"Transition for signal '{signal}' already exists in {self.__class__.__name__}.")
         self._transitions[signal] = Transition(destination, condition)
 
+class TransitionTable(object):
+    """
+    Dense transition table for a tree of nested state machines, built by StateMachine.compile().
+
+    Every state in the tree is assigned a state id and every signal a signal id, and the
+    transition for a (state, signal) pair is stored at `state_id * width + signal_id`, or
+    None if the state does not handle the signal.
+    """
+
+    __slots__ = ("signals", "transitions", "width", "log", "valid")
+
+    def __init__(self, root: 'StateMachine', log: bool = False) -> None:
+        states: List[State] = [root]
+        for state in states:
+            if isinstance(state, StateMachine):
+                states.extend(state._states)
+
+        self.signals: Dict[Any, int] = {}
+        for state in states:
+            for signal in state._transitions:
+                self.signals.setdefault(signal, len(self.signals))
+
+        self.width: int = len(self.signals)
+        self.transitions: List[Optional[Transition]] = [None] * (len(states) * self.width)
+        self.log: bool = log
+        self.valid: bool = True
+
+        for state_id, state in enumerate(states):
+            state._state_id = state_id
+            offset = state_id * self.width
+
+            for signal, transition in state._transitions.items():
+                self.transitions[offset + self.signals[signal]] = transition
+
+
 class StateMachine(State):
     """
     Represents a state machine which can contain multiple states and transitions.
@@ -63,6 +99,7 @@ class StateMachine(State):
         self._states: List[State] = []
         self._global_transitions: Dict[Any, State] = {}
         self._has_started: bool = False
+        self._table: Optional[TransitionTable] = None
 
     def add_transition(self, source: Optional[State], destination: State, signal: Any, condition: Optional[callable] = None) -> None:
         """
@@ -75,6 +112,8 @@ class StateMachine(State):
         if source is not None and not isinstance(source, State):
             raise TypeError("Source must be an instance of State or None for global transitions.")
         
+        self._invalidate()
+        
         if source and source not in self._states:
             self._add_state(source)
         if destination not in self._states:
@@ -91,6 +130,7 @@ class StateMachine(State):
             source._add_transition(destination, signal, condition)
 
     def _add_state(self, state: State) -> None:
+        self._invalidate()
         self._states.append(state)
         state._parent = self
         for signal, destination in self._global_transitions.items():
@@ -106,10 +146,36 @@ class StateMachine(State):
         self._initial_state = state
         self._current_state = self._initial_state
 
+    def compile(self, log: bool = False) -> None:
+        """
+        Flattens this state machine and all machines nested in or above it into a single
+        TransitionTable, which trigger() then uses instead of recursive dictionary lookups.
+        
+        Adding states or transitions anywhere in the tree invalidates the table, and
+        trigger() falls back to recursive dispatch until compile() is called again.
+        
+        :param log: Log unhandled signals, unmet conditions and transitions as trigger() does when not compiled.
+        """
+        root = self
+        while root._parent:
+            root = root._parent
+            
+        table = TransitionTable(root, log)
+        
+        machines = [root]
+        for machine in machines:
+            machine._table = table
+            machines.extend(state for state in machine._states if isinstance(state, StateMachine))
+            
     def trigger(self, signal: Any, *args, **kwargs) -> None:
         """
         Triggers a transition based on the given signal and event.
         """
+        table = self._table
+        if table is not None and table.valid:
+            self._trigger_compiled(table, signal, args, kwargs)
+            return
+        
         transition = self._current_state._transitions.get(signal) if self._current_state else None
         
         if not transition:
@@ -139,6 +205,53 @@ class StateMachine(State):
         self._current_state = transition.destination
         self._current_state.on_enter(self, *args, **kwargs)
 
+    def _trigger_compiled(self, table: TransitionTable, signal: Any, args: tuple, kwargs: dict) -> None:
+        signal_id = table.signals.get(signal)
+        machine = self
+        transition = None
+        
+        # Climb to the first machine whose current state handles the signal
+        if signal_id is not None:
+            while machine is not None:
+                state = machine._current_state
+                if state is not None:
+                    transition = table.transitions[state._state_id * table.width + signal_id]
+                    if transition is not None:
+                        break
+                    
+                machine = machine._parent
+                
+        if transition is None:
+            if table.log:
+                logger.warning(f"[trigger] Signal '{signal}' not handled and no parent to propagate to.")
+            return
+        
+        if transition.condition and not transition.condition(*args, **kwargs):
+            if table.log:
+                logger.debug(f"[trigger] Transition condition for signal '{signal}' not met.")
+            return
+        
+        if transition.destination is machine._current_state:
+            if table.log:
+                logger.debug(f"[trigger] Ignoring internal transition for signal '{signal}'.")
+            return
+        
+        if table.log:
+            logger.debug(
+                "[trigger] Transition - Source: %s Destination: %s Signal: %s",
+                machine._current_state.__class__.__name__,
+                transition.destination.__class__.__name__,
+                signal
+            )
+            
+        machine._current_state.on_exit(machine, *args, **kwargs)
+        machine._current_state = transition.destination
+        machine._current_state.on_enter(machine, *args, **kwargs)
+        
+    def _invalidate(self) -> None:
+        if self._table is not None:
+            self._table.valid = False
+            
     def update(self, *args, **kwargs) -> None:
         """
         Updates the current state.
@@ -76,6 +76,15 @@ class Event(StringEnum):
     GAME_START = auto()
     FINISHED = auto()
     
+    # GameState change notifications, emitted with a StateChange
+    STAR_COUNT_CHANGED = auto()
+    FADE_STATUS_CHANGED = auto()
+    CAMERA_CHANGED = auto()
+    STABLE_PREDICTION_CHANGED = auto()
+    SPLIT_INDEX_CHANGED = auto()
+    BOWSER_FIGHT_CHANGED = auto()
+    INTRO_CHANGED = auto()
+    
 
 class Camera(Enum):
     LAKITU = auto()
@@ -91,6 +100,17 @@ class SplitType(Enum):
     MIPS = "Mips"
     CUSTOM = "Custom"
 
+class PacingMode(Enum):
+    SLEEP = "Sleep"
+    HYBRID = "Hybrid"
+    UNLIMITED = "Unlimited"
+
+
+class OverrunPolicy(Enum):
+    CATCH_UP = "CatchUp"
+    DROP = "Drop"
+
+
 class AS64Status(Enum):
     RUNNING = "Running"
     STOPPED = "Stopped"
@@ -0,0 +1,211 @@
+# AutoSplit64
+#
+# Copyright (C) 2025 Kainev
+#
+# This project is currently not open source and is under active development.
+# You may view the code, but it is not licensed for distribution, modification, or use at this time.
+#
+# For more information see https://github.com/Kainev/AutoSplit64?tab=readme#license
+
+import os
+import sys
+import json
+import time
+import logging
+import argparse
+import threading
+import dataclasses
+from enum import Enum
+from typing import Any, Optional, TextIO
+
+from as64 import config, log, api
+from as64.core import AS64
+from as64.core.route import load as load_route
+from as64.core.scheduler import FrameScheduler
+from as64.core.recording import ReplayCapturePlugin, VideoFileCapturePlugin
+from as64.plugins import Plugin, SplitPlugin, CapturePlugin, PluginValidationError
+from as64.plugins.management import plugin_manager
+from as64.enums import Event, PacingMode
+from as64.helpers.events import EventBus
+
+logger = logging.getLogger(__name__)
+
+
+class Timeline(object):
+    """
+    Writes analysis events to a JSON-lines file, one event per line.
+    """
+
+    def __init__(self, stream: TextIO) -> None:
+        self._stream = stream
+        self.count = 0
+
+    def write(self, event: str, data: Any = None) -> None:
+        game_state = api.get_game_state()
+
+        record = {
+            "frame": game_state.frame_index if game_state else None,
+            "time": game_state.current_time if game_state else None,
+            "event": event,
+        }
+
+        if data is not None:
+            record["data"] = data
+
+        self._stream.write(json.dumps(record, default=_json_default) + "\n")
+        self.count += 1
+
+
+def _json_default(value: Any) -> Any:
+    if dataclasses.is_dataclass(value):
+        return {field.name: getattr(value, field.name) for field in dataclasses.fields(value)}
+    if isinstance(value, Enum):
+        return value.name
+    
+    return str(value)
+
+
+class TimelineSplitPlugin(SplitPlugin):
+    """
+    Split plugin which records split actions to a Timeline instead of controlling a timer.
+    """
+
+    timeline: Timeline = None
+
+    def __init__(self, game_state) -> None:
+        super().__init__()
+        self._game_state = game_state
+        self._index = -1
+
+    def split(self):
+        self._index += 1
+        self.timeline.write("split", {"index": self._index})
+
+    def skip(self):
+        self._index += 1
+        self.timeline.write("skip", {"index": self._index})
+
+    def undo(self):
+        self._index = max(-1, self._index - 1)
+        self.timeline.write("undo", {"index": self._index})
+
+    def reset(self):
+        self._index = -1
+        self.timeline.write("reset")
+
+    def index(self):
+        return self._index
+
+    def sync(self):
+        if self._index == self._game_state.current_split_index:
+            return
+
+        splits = self._game_state.route.splits
+
+        self._game_state.current_split_index = self._index
+        self._game_state.current_split = splits[min(max(self._index, 0), len(splits) - 1)]
+
+
+def _create_capture_plugin(source: str, realtime: bool, stop_event: threading.Event) -> CapturePlugin:
+    if os.path.isdir(source):
+        return ReplayCapturePlugin(source, realtime=realtime, stop_event=stop_event)
+
+    return VideoFileCapturePlugin(source, stop_event=stop_event)
+
+
+def analyse(source: str, output: TextIO, route_path: Optional[str] = None, realtime: bool = False) -> dict:
+    """
+    Run the full plugin chain over a video file or recording.
+
+    :param source: Path of a video file, or of a recording directory written by FrameRecorder.
+    :param output: Stream the JSON-lines timeline is written to.
+    :param route_path: Route file to use instead of route.path.
+    :param realtime: Pace analysis at the game frame rate instead of running as fast as possible.
+    :return: Summary of the run, including the frames per second achieved.
+    """
+    timeline = Timeline(output)
+    TimelineSplitPlugin.timeline = timeline
+
+    def enqueue_message(message: dict) -> None:
+        if message and message.get("event") == "error":
+            logger.error(f"[headless] {message.get('data')}")
+            timeline.write("error", message.get("data"))
+
+    emitter = EventBus()
+    api.emitter._emitter = emitter
+    api.ipc.enqueue_ui_message = enqueue_message
+    config._enqueue_message = enqueue_message
+
+    for event in Event:
+        emitter.on(event, lambda *args, _event=event, **kwargs: timeline.write(_event.value, list(args) or None))
+
+    plugin_manager.load_plugins()
+    plugin_manager.instantiate_plugins(category=Plugin)
+    plugin_manager.run_method(Plugin, "initialize")
+
+    stop_event = threading.Event()
+    capture_plugin = _create_capture_plugin(source, realtime, stop_event)
+
+    scheduler = None if realtime else FrameScheduler(29.97, mode=PacingMode.UNLIMITED)
+
+    _as64 = AS64(
+        plugin_manager,
+        enqueue_message,
+        capture_plugin=capture_plugin,
+        split_plugin_class=TimelineSplitPlugin,
+        scheduler=scheduler,
+        route=load_route(route_path) if route_path else None,
+        record=False
+    )
+
+    if not _as64.is_valid():
+        raise PluginValidationError("An unknown error occurred.")
+
+    start_time = time.perf_counter()
+    _as64.run(stop_event)
+    elapsed = time.perf_counter() - start_time
+
+    # The final frame index belongs to the capture which found the end of the source
+    frames = api.get_game_state().frame_index
+
+    if isinstance(capture_plugin, VideoFileCapturePlugin):
+        capture_plugin.release()
+
+    return {
+        "source": source,
+        "frames": frames,
+        "events": timeline.count,
+        "elapsed": elapsed,
+        "fps": frames / elapsed if elapsed > 0 else 0.0,
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Run AS64 analysis over a video file or recording without a UI.")
+    parser.add_argument("source", help="Video file or recording directory to analyse.")
+    parser.add_argument("-o", "--output", help="JSON-lines timeline output path. Defaults to stdout.")
+    parser.add_argument("-r", "--route", help="Route file to use instead of the configured route.")
+    parser.add_argument("--realtime", action="store_true", help="Pace analysis at the game frame rate.")
+    args = parser.parse_args(argv)
+
+    log.configure_logging()
+    config.load()
+
+    output = open(args.output, "w") if args.output else sys.stdout
+
+    try:
+        summary = analyse(args.source, output, route_path=args.route, realtime=args.realtime)
+    except PluginValidationError as e:
+        logger.error(f"[headless] {e}")
+        return 1
+    finally:
+        if output is not sys.stdout:
+            output.close()
+
+    print(json.dumps(summary), file=sys.stderr)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
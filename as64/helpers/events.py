@@ -0,0 +1,153 @@
+# AutoSplit64
+#
+# Copyright (C) 2025 Kainev
+#
+# This project is currently not open source and is under active development.
+# You may view the code, but it is not licensed for distribution, modification, or use at this time.
+#
+# For more information see https://github.com/Kainev/AutoSplit64?tab=readme#license
+
+import threading
+from enum import Enum
+from fnmatch import fnmatchcase
+from typing import Any, Callable, Dict, Optional, Tuple
+
+
+WILDCARD = "*"
+
+
+class _Listener(object):
+    __slots__ = ("event", "func", "ttl")
+
+    def __init__(self, event: Any, func: Callable[..., Any], ttl: int) -> None:
+        self.event = event
+        self.func = func
+        self.ttl = ttl
+
+
+def _is_pattern(event: Any) -> bool:
+    return isinstance(event, str) and not isinstance(event, Enum) and ("*" in event or "?" in event)
+
+
+def _event_name(event: Any) -> str:
+    return event.value if isinstance(event, Enum) else str(event)
+
+
+class EventBus(object):
+    """
+    Synchronous event dispatcher.
+
+    The listeners of each event are resolved once into a tuple, which emit() iterates
+    directly; the cache is rebuilt only when listeners are added or removed. Wildcard
+    patterns (fnmatch syntax, e.g. "FADE*" or "*") are matched while resolving, so they
+    add no cost to emit() for events which do not match them.
+
+    Listeners registered with a ttl are called at most `ttl` times, and listener tuples are
+    only rebuilt when one expires.
+    """
+
+    def __init__(self) -> None:
+        self._listeners: Dict[Any, Tuple[_Listener, ...]] = {}
+        self._wildcards: Tuple[_Listener, ...] = ()
+        self._resolved: Dict[Any, Tuple[Tuple[_Listener, ...], bool]] = {}
+        self._lock = threading.RLock()
+
+    def on(self, event: Any, func: Optional[Callable[..., Any]] = None, ttl: int = -1):
+        """
+        Register `func` to be called when `event` is emitted. If `ttl` is positive, `func` is
+        removed after being called `ttl` times. Can also be used as a decorator:
+            @bus.on(Event.SPLIT)
+            def on_split(): ...
+        """
+        if func is None:
+            return lambda func: self.on(event, func, ttl)
+
+        listener = _Listener(event, func, ttl)
+
+        with self._lock:
+            if _is_pattern(event):
+                self._wildcards = self._wildcards + (listener,)
+            else:
+                self._listeners[event] = self._listeners.get(event, ()) + (listener,)
+
+            self._resolved = {}
+
+        return func
+
+    def once(self, event: Any, func: Optional[Callable[..., Any]] = None):
+        return self.on(event, func, ttl=1)
+
+    def on_any(self, func: Optional[Callable[..., Any]] = None, ttl: int = -1):
+        return self.on(WILDCARD, func, ttl)
+
+    def off(self, event: Any, func: Callable[..., Any]) -> None:
+        with self._lock:
+            if _is_pattern(event):
+                self._wildcards = tuple(listener for listener in self._wildcards if not (listener.event == event and listener.func == func))
+            else:
+                listeners = tuple(listener for listener in self._listeners.get(event, ()) if listener.func != func)
+                if listeners:
+                    self._listeners[event] = listeners
+                else:
+                    self._listeners.pop(event, None)
+
+            self._resolved = {}
+
+    def off_all(self) -> None:
+        with self._lock:
+            self._listeners = {}
+            self._wildcards = ()
+            self._resolved = {}
+
+    def listeners(self, event: Any) -> Tuple[Callable[..., Any], ...]:
+        return tuple(listener.func for listener in self._resolve(event)[0])
+
+    def emit(self, event: Any, *args: Any, **kwargs: Any) -> None:
+        entry = self._resolved.get(event)
+        if entry is None:
+            entry = self._resolve(event)
+
+        listeners, limited = entry
+
+        if not limited:
+            for listener in listeners:
+                listener.func(*args, **kwargs)
+            return
+
+        for listener in listeners:
+            ttl = listener.ttl
+            if ttl == 0:
+                continue
+
+            if ttl > 0:
+                listener.ttl = ttl - 1
+                if ttl == 1:
+                    self._expire(listener)
+
+            listener.func(*args, **kwargs)
+
+    def _resolve(self, event: Any) -> Tuple[Tuple[_Listener, ...], bool]:
+        with self._lock:
+            listeners = self._listeners.get(event, ())
+
+            if self._wildcards:
+                name = _event_name(event)
+                listeners = listeners + tuple(listener for listener in self._wildcards if fnmatchcase(name, listener.event))
+
+            entry = (listeners, any(listener.ttl > 0 for listener in listeners))
+            self._resolved[event] = entry
+
+            return entry
+
+    def _expire(self, listener: _Listener) -> None:
+        with self._lock:
+            if _is_pattern(listener.event):
+                self._wildcards = tuple(other for other in self._wildcards if other is not listener)
+            else:
+                listeners = tuple(other for other in self._listeners.get(listener.event, ()) if other is not listener)
+                if listeners:
+                    self._listeners[listener.event] = listeners
+                else:
+                    self._listeners.pop(listener.event, None)
+
+            self._resolved = {}
@@ -7,13 +7,29 @@
 #
 # For more information see https://github.com/Kainev/AutoSplit64?tab=readme#license
 
-from typing import Union, Tuple, List
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional, Sequence, Union, Tuple, List
 
 import numpy as np
 import cv2
 
 ColourBound = Union[Tuple[int, ...], List[int], np.ndarray]
 
+
+@dataclass(frozen=True)
+class ColourRangeSpec:
+    """
+    A single colour range check for use with ColourRangeBatch.
+
+    region: Key passed to the image source to retrieve the image (e.g. a Region).
+    lower_bound, upper_bound: Colour range bounds (e.g. (B, G, R)).
+    threshold: The proportion threshold (between 0 and 1).
+    """
+    region: Any
+    lower_bound: Tuple[int, ...]
+    upper_bound: Tuple[int, ...]
+    threshold: float
+
 def in_colour_range(image: np.ndarray, lower_bound: ColourBound, upper_bound: ColourBound, threshold: float) -> bool:
     """
     Determines if the proportion of pixels within a specified colour range exceeds the given threshold.
@@ -51,6 +67,249 @@ def in_colour_range(image: np.ndarray, lower_bound: ColourBound, upper_bound: Co
     return proportion > threshold
 
 
+def in_colour_range_unchecked(image: np.ndarray, lower_bound: np.ndarray, upper_bound: np.ndarray, threshold: float) -> bool:
+    """
+    Fast path of in_colour_range which skips input validation.
+    Bounds should be NumPy arrays matching the image dtype.
+    """
+    mask = cv2.inRange(image, lower_bound, upper_bound)
+    return cv2.countNonZero(mask) > threshold * mask.size
+
+
+def colour_proportion_exceeds(image: np.ndarray,
+                              lower_bound: np.ndarray,
+                              upper_bound: np.ndarray,
+                              threshold: float,
+                              stride: int = 4,
+                              margin: float = 0.05,
+                              blocks: int = 8) -> bool:
+    """
+    Threshold-aware equivalent of in_colour_range for large regions.
+
+    A strided subsample of the image is checked first. If its proportion is further than `margin`
+    from the threshold the subsample decides the result. Otherwise the exact count is taken in
+    row blocks, stopping as soon as the remaining pixels can no longer change the answer.
+
+    Parameters:
+        image (np.ndarray): The input image in BGR or other colour space.
+        lower_bound (np.ndarray): Lower bound for the colour range (e.g., (B, G, R)).
+        upper_bound (np.ndarray): Upper bound for the colour range (e.g., (B, G, R)).
+        threshold (float): The proportion threshold (between 0 and 1).
+        stride (int): Sampling step along both axes for the initial estimate. 1 disables subsampling.
+        margin (float): Distance from the threshold within which the exact count is used.
+        blocks (int): Number of row blocks the exact count is split into.
+
+    Returns:
+        bool: True if the proportion of pixels within the colour range exceeds the threshold, False otherwise.
+    """
+    if stride > 1:
+        sample = cv2.inRange(image[::stride, ::stride], lower_bound, upper_bound)
+        proportion = cv2.countNonZero(sample) / sample.size
+
+        if proportion > threshold + margin:
+            return True
+        if proportion < threshold - margin:
+            return False
+
+    rows = image.shape[0]
+    row_pixels = image.shape[1]
+    required = threshold * rows * row_pixels
+    step = max(1, -(-rows // blocks))
+
+    count = 0
+    for start in range(0, rows, step):
+        end = min(rows, start + step)
+        count += cv2.countNonZero(cv2.inRange(image[start:end], lower_bound, upper_bound))
+
+        if count > required:
+            return True
+        if count + (rows - end) * row_pixels <= required:
+            return False
+
+    return count > required
+
+
+class ColourRangeBatch(object):
+    """
+    Evaluates a fixed list of colour range checks in a single pass.
+
+    Specs are validated once on construction and grouped by bounds. When the frame
+    coordinates of each region are provided via `rects`, evaluate() takes the full frame and
+    computes one cv2.inRange mask per unique bounds over the bounding rectangle of the
+    regions using them; each region's proportion is then counted on a slice of that mask.
+    Regions are only merged into a shared rectangle while it stays within MAX_MERGE_RATIO of
+    their combined area, so distant regions do not mask the frame between them.
+    Without `rects`, evaluate() takes a callable returning each region's image and computes
+    one mask per unique (region, bounds) pair. All thresholds are compared in one vectorised
+    operation, and results are written into a preallocated boolean array indexed in the
+    same order as the specs.
+
+    Example:
+        batch = ColourRangeBatch([
+            ColourRangeSpec(Region.LIFE, black_lower, black_upper, 0.9),
+            ColourRangeSpec(Region.FADEOUT, black_lower, black_upper, 0.9),
+        ], rects=game_capture.region_rect)
+        in_fade, fade_complete = batch.evaluate(game_capture.image)
+    """
+
+    MAX_MERGE_RATIO = 1.5
+
+    def __init__(self, specs: Sequence[ColourRangeSpec], rects: Optional[Callable[[Any], Sequence[int]]] = None) -> None:
+        """
+        :param specs: Colour range checks to evaluate.
+        :param rects: Callable returning the [x, y, width, height] of a region within the frame,
+                      e.g. GameCapture.region_rect. Rects are resolved once, on construction.
+        """
+        self._specs: Tuple[ColourRangeSpec, ...] = tuple(specs)
+
+        bounds_keys: Dict[Tuple[bytes, bytes], int] = {}
+        self._bounds: List[Tuple[np.ndarray, np.ndarray]] = []
+
+        region_keys: Dict[Tuple[Any, int], int] = {}
+        self._regions: List[Tuple[Any, int]] = []
+        region_index = []
+
+        for spec in self._specs:
+            if not (0 <= spec.threshold <= 1):
+                raise ValueError("Threshold must be between 0 and 1.")
+
+            lower = np.asarray(spec.lower_bound, dtype=np.uint8)
+            upper = np.asarray(spec.upper_bound, dtype=np.uint8)
+
+            if lower.shape != upper.shape:
+                raise ValueError("Lower and upper bounds must have the same number of channels.")
+
+            bounds = (lower.tobytes(), upper.tobytes())
+            if bounds not in bounds_keys:
+                bounds_keys[bounds] = len(self._bounds)
+                self._bounds.append((lower, upper))
+
+            key = (spec.region, bounds_keys[bounds])
+            if key not in region_keys:
+                region_keys[key] = len(self._regions)
+                self._regions.append(key)
+
+            region_index.append(region_keys[key])
+
+        self._region_index = np.array(region_index, dtype=np.intp)
+        self._thresholds = np.array([spec.threshold for spec in self._specs], dtype=np.float64)
+
+        self._proportions = np.zeros(len(self._regions), dtype=np.float64)
+        self._results = np.zeros(len(self._specs), dtype=bool)
+
+        # Masks computed per frame: (bounds index, bounding rect, [(proportion index, slice of the mask)])
+        self._groups: Optional[List[Tuple[int, Tuple[int, int, int, int], List[Tuple[int, Tuple[slice, slice]]]]]] = None
+        self._mask_buffers: List[Optional[np.ndarray]] = []
+
+        if rects is not None:
+            self._groups = self._group_regions(rects)
+            self._mask_buffers = [None] * len(self._groups)
+
+    @property
+    def specs(self) -> Tuple[ColourRangeSpec, ...]:
+        return self._specs
+
+    def proportions(self, source: Union[np.ndarray, Callable[[Any], np.ndarray]]) -> np.ndarray:
+        """
+        Compute the proportion of in-range pixels for each unique (region, bounds) pair.
+
+        :param source: The full frame if the batch was constructed with `rects`, otherwise a
+                       callable returning the image for a region, e.g. GameCapture.region_image.
+        :return: Array of proportions, one per unique (region, bounds) pair. The array is reused between calls.
+        """
+        if self._groups is None:
+            for i, (region, bounds) in enumerate(self._regions):
+                lower, upper = self._bounds[bounds]
+                mask = cv2.inRange(source(region), lower, upper)
+                self._proportions[i] = cv2.countNonZero(mask) / mask.size
+
+            return self._proportions
+
+        for group, (bounds, (x, y, width, height), regions) in enumerate(self._groups):
+            lower, upper = self._bounds[bounds]
+            image = source[y:y + height, x:x + width]
+
+            mask = self._mask_buffers[group]
+            if mask is None or mask.shape != image.shape[:2]:
+                mask = self._mask_buffers[group] = np.empty(image.shape[:2], dtype=np.uint8)
+
+            cv2.inRange(image, lower, upper, dst=mask)
+
+            for i, index in regions:
+                region_mask = mask[index]
+                self._proportions[i] = cv2.countNonZero(region_mask) / region_mask.size if region_mask.size else 0.0
+
+        return self._proportions
+
+    def evaluate(self, source: Union[np.ndarray, Callable[[Any], np.ndarray]]) -> np.ndarray:
+        """
+        Evaluate every spec.
+
+        :param source: The full frame if the batch was constructed with `rects`, otherwise a
+                       callable returning the image for a region, e.g. GameCapture.region_image.
+        :return: Boolean array, True where the proportion exceeds the spec threshold. The array is reused between calls.
+        """
+        proportions = self.proportions(source)
+        np.greater(proportions[self._region_index], self._thresholds, out=self._results)
+
+        return self._results
+
+    def _group_regions(self, rects: Callable[[Any], Sequence[int]]):
+        groups = []
+
+        for bounds in range(len(self._bounds)):
+            # Clusters of (rect, area of member regions, members), merged while the union stays compact
+            clusters = []
+            for i, (region, b) in enumerate(self._regions):
+                if b == bounds:
+                    rect = [int(v) for v in rects(region)]
+                    clusters.append((rect, rect[2] * rect[3], [i]))
+
+            merged = True
+            while merged:
+                merged = False
+
+                for a in range(len(clusters)):
+                    for b in range(a + 1, len(clusters)):
+                        union = _union_rect(clusters[a][0], clusters[b][0])
+                        area = clusters[a][1] + clusters[b][1]
+
+                        if union[2] * union[3] <= area * self.MAX_MERGE_RATIO:
+                            clusters[a] = (union, area, clusters[a][2] + clusters[b][2])
+                            del clusters[b]
+                            merged = True
+                            break
+
+                    if merged:
+                        break
+
+            for (left, top, width, height), _, members in clusters:
+                regions = []
+
+                for i in members:
+                    x, y, region_width, region_height = (int(v) for v in rects(self._regions[i][0]))
+                    regions.append((i, (slice(y - top, y - top + region_height), slice(x - left, x - left + region_width))))
+
+                groups.append((bounds, (left, top, width, height), regions))
+
+        return groups
+
+
+def _union_rect(a: Sequence[int], b: Sequence[int]) -> List[int]:
+    left, top = min(a[0], b[0]), min(a[1], b[1])
+    right, bottom = max(a[0] + a[2], b[0] + b[2]), max(a[1] + a[3], b[1] + b[3])
+
+    return [left, top, right - left, bottom - top]
+
+
+def in_colour_ranges(images: Callable[[Any], np.ndarray], specs: Sequence[ColourRangeSpec]) -> np.ndarray:
+    """
+    Evaluate a list of colour range specs in a single pass.
+    Prefer constructing a ColourRangeBatch once and reusing it when the specs do not change between frames.
+    """
+    return ColourRangeBatch(specs).evaluate(images).copy()
+
+
 def is_white_like(pixel: Tuple[int, int, int], similarity_threshold: int, brightness_threshold: int = 200) -> bool:
     """
     Determines if a pixel is "white-like" based on color channel similarity and brightness.
@@ -69,4 +328,51 @@ def is_white_like(pixel: Tuple[int, int, int], similarity_threshold: int, bright
     
     is_bright = average > brightness_threshold
 
-    return channels_similar and is_bright
\ No newline at end of file
+    return channels_similar and is_bright
+
+
+def white_like_mask(image: np.ndarray,
+                    similarity_threshold: int,
+                    brightness_threshold: int = 200,
+                    points: Optional[Sequence[Sequence[int]]] = None) -> np.ndarray:
+    """
+    Vectorised is_white_like over an image or a set of points within it.
+
+    :param image: Image with at least 3 colour channels. Channel order does not matter.
+    :param similarity_threshold: Maximum allowed difference between the highest and lowest channel values.
+    :param brightness_threshold: Minimum average brightness to consider the pixel as white.
+    :param points: Optional list of (x, y) coordinates to test instead of the whole image.
+    :return: Boolean mask with the image's height and width, or one entry per point.
+    """
+    if points is not None:
+        coordinates = np.asarray(points, dtype=np.intp).reshape(-1, 2)
+        pixels = image[coordinates[:, 1], coordinates[:, 0], :3]
+    else:
+        pixels = image[..., :3]
+
+    max_val = pixels.max(axis=-1).astype(np.int16)
+    min_val = pixels.min(axis=-1).astype(np.int16)
+    total = pixels.sum(axis=-1, dtype=np.uint16)
+
+    channels_similar = (max_val - min_val) < similarity_threshold
+
+    # Equivalent to average > brightness_threshold without a float division
+    is_bright = total > 3 * brightness_threshold
+
+    return channels_similar & is_bright
+
+
+def white_like_proportion(image: np.ndarray,
+                          similarity_threshold: int,
+                          brightness_threshold: int = 200,
+                          points: Optional[Sequence[Sequence[int]]] = None) -> float:
+    """
+    Proportion of pixels (or points) in the image which are white-like.
+    See white_like_mask for parameters.
+    """
+    mask = white_like_mask(image, similarity_threshold, brightness_threshold, points)
+
+    if mask.size == 0:
+        return 0.0
+
+    return np.count_nonzero(mask) / mask.size
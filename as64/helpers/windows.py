@@ -8,12 +8,17 @@
 # For more information see https://github.com/Kainev/AutoSplit64?tab=readme#license
 
 import os
-import win32gui
-import win32process
-import win32api
-import win32con
 import psutil
 
+try:
+    import win32gui
+    import win32process
+    import win32api
+    import win32con
+except ImportError:
+    # Window enumeration is only available on Windows
+    win32gui = None
+
 from as64.ipc import rpc
 
 def enum_window_callback(hwnd, pid_set):
@@ -21,8 +26,11 @@ def enum_window_callback(hwnd, pid_set):
             _, pid = win32process.GetWindowThreadProcessId(hwnd)
             pid_set.add(pid)
 
-@rpc.register("windows.visible_process_names")
+@rpc.register("windows.visible_process_names", policy=rpc.ExecutionPolicy.THREAD_POOL, cache_ttl=2)
 def visible_process_names():
+    if win32gui is None:
+        return []
+    
     pid_set = set()
     # Enumerate top-level windows
     win32gui.EnumWindows(enum_window_callback, pid_set)
@@ -51,6 +59,9 @@ def _get_window_handles():
 
 
 def get_handle(name: str):
+    if win32gui is None:
+        return None
+    
     handles = _get_window_handles()
     
     for handle in handles:
@@ -0,0 +1,88 @@
+# AutoSplit64
+#
+# Copyright (C) 2025 Kainev
+#
+# This project is currently not open source and is under active development.
+# You may view the code, but it is not licensed for distribution, modification, or use at this time.
+#
+# For more information see https://github.com/Kainev/AutoSplit64?tab=readme#license
+
+import asyncio
+import threading
+from collections import deque
+from typing import Callable, List
+
+
+class MessageBatcher(object):
+    """
+    Hands messages put from any thread to an asyncio event loop in batches.
+
+    put() appends to a deque and wakes the event loop at most once per batch: the first
+    message of a batch schedules a drain `interval` seconds later, and reaching `max_size`
+    messages drains immediately. Each drain passes every buffered message, in order, to
+    `on_batch` on the event loop thread.
+    """
+
+    def __init__(self,
+                 loop: asyncio.AbstractEventLoop,
+                 on_batch: Callable[[List[dict]], None],
+                 interval: float = 0.005,
+                 max_size: int = 32) -> None:
+        """
+        :param loop: Event loop on_batch is called on.
+        :param on_batch: Callable receiving each non-empty batch of messages.
+        :param interval: Seconds messages are coalesced for before being delivered.
+        :param max_size: Number of buffered messages which triggers delivery before `interval` elapses.
+        """
+        self._loop = loop
+        self._on_batch = on_batch
+        self.interval = interval
+        self.max_size = max_size
+
+        self._buffer: deque = deque()
+        self._lock = threading.Lock()
+        self._scheduled = False
+        self._urgent = False
+
+    def put(self, message: dict) -> None:
+        """
+        Buffer a message for delivery. Safe to call from any thread.
+        """
+        self._buffer.append(message)
+
+        with self._lock:
+            if len(self._buffer) >= self.max_size and not self._urgent:
+                self._urgent = True
+                wake = self.drain
+            elif not self._scheduled:
+                self._scheduled = True
+                wake = self._schedule
+            else:
+                return
+
+        self._loop.call_soon_threadsafe(wake)
+
+    def drain(self) -> None:
+        """
+        Deliver all buffered messages now. Must be called on the event loop thread.
+        """
+        with self._lock:
+            self._urgent = False
+
+        batch = []
+        buffer = self._buffer
+
+        while buffer:
+            batch.append(buffer.popleft())
+
+        if batch:
+            self._on_batch(batch)
+
+    def _schedule(self) -> None:
+        self._loop.call_later(self.interval, self._scheduled_drain)
+
+    def _scheduled_drain(self) -> None:
+        with self._lock:
+            self._scheduled = False
+
+        self.drain()
@@ -0,0 +1,265 @@
+# AutoSplit64
+#
+# Copyright (C) 2025 Kainev
+#
+# This project is currently not open source and is under active development.
+# You may view the code, but it is not licensed for distribution, modification, or use at this time.
+#
+# For more information see https://github.com/Kainev/AutoSplit64?tab=readme#license
+
+import json
+import struct
+import logging
+from enum import IntEnum, IntFlag
+from typing import List, Sequence
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+from .transport import Transport
+
+logger = logging.getLogger(__name__)
+
+
+# Binary framing protocol between AS64 and the UI.
+#
+# Every binary frame starts with an 8 byte header:
+#
+#     magic   uint8   0xA6
+#     version uint8   PROTOCOL_VERSION
+#     type    uint8   FrameType
+#     flags   uint8   FrameFlags
+#     length  uint32  Body length in bytes (big-endian)
+#
+# A MESSAGE body is a single encoded message. A BATCH body is a sequence of messages,
+# each prefixed with its uint32 length. Messages are UTF-8 JSON unless the MSGPACK flag
+# is set.
+#
+# The legacy format, an 8 digit ASCII body length followed by a JSON body for messages
+# to AS64 and newline-delimited JSON for messages to the UI, is distinguished by its
+# first byte, which is always an ASCII digit. Connections start in the legacy format.
+# The UI requests binary framing by sending a HELLO frame listing the codecs it
+# supports, and AS64 replies with a HELLO frame naming the codec it selected. Both
+# sides send binary frames from then on.
+
+MAGIC = 0xA6
+PROTOCOL_VERSION = 1
+
+HEADER = struct.Struct("!BBBBI")
+HEADER_SIZE = HEADER.size
+LENGTH = struct.Struct("!I")
+
+MAX_FRAME_SIZE = 64 * 1024 * 1024
+
+# Oversized frame bodies are read and discarded in chunks of this size
+DISCARD_CHUNK_SIZE = 64 * 1024
+
+
+class FrameType(IntEnum):
+    MESSAGE = 1
+    BATCH = 2
+    HELLO = 3
+
+
+class FrameFlags(IntFlag):
+    NONE = 0
+    MSGPACK = 1
+
+
+class FramingError(Exception):
+    """Raised when a frame cannot be encoded or decoded."""
+    pass
+
+
+def available_codecs() -> List[str]:
+    return ["msgpack", "json"] if msgpack is not None else ["json"]
+
+
+def encode_message(message: dict, flags: FrameFlags = FrameFlags.NONE) -> bytes:
+    if flags & FrameFlags.MSGPACK:
+        return msgpack.packb(message, use_bin_type=True)
+
+    return json.dumps(message).encode("utf-8")
+
+
+def decode_message(body: bytes, flags: FrameFlags = FrameFlags.NONE) -> dict:
+    if flags & FrameFlags.MSGPACK:
+        return msgpack.unpackb(body, raw=False)
+
+    return json.loads(body)
+
+
+def encode_frame(frame_type: FrameType, body: bytes, flags: FrameFlags = FrameFlags.NONE) -> bytes:
+    if len(body) > MAX_FRAME_SIZE:
+        raise FramingError(f"Frame body of {len(body)} bytes exceeds the maximum of {MAX_FRAME_SIZE}")
+
+    return HEADER.pack(MAGIC, PROTOCOL_VERSION, frame_type, flags, len(body)) + body
+
+
+def encode_batch(messages: Sequence[dict], flags: FrameFlags = FrameFlags.NONE) -> bytes:
+    """
+    Encode messages as a single frame; a MESSAGE frame for one message, otherwise a BATCH frame.
+    """
+    if len(messages) == 1:
+        return encode_frame(FrameType.MESSAGE, encode_message(messages[0], flags), flags)
+
+    parts = []
+    for message in messages:
+        body = encode_message(message, flags)
+        parts.append(LENGTH.pack(len(body)))
+        parts.append(body)
+
+    return encode_frame(FrameType.BATCH, b"".join(parts), flags)
+
+
+def decode_batch(body: bytes, flags: FrameFlags = FrameFlags.NONE) -> List[dict]:
+    messages = []
+    offset = 0
+
+    while offset < len(body):
+        if offset + LENGTH.size > len(body):
+            raise FramingError("Truncated batch frame.")
+
+        (length,) = LENGTH.unpack_from(body, offset)
+        offset += LENGTH.size
+
+        if offset + length > len(body):
+            raise FramingError("Truncated batch frame.")
+
+        messages.append(decode_message(body[offset:offset + length], flags))
+        offset += length
+
+    return messages
+
+
+def encode_legacy(messages: Sequence[dict]) -> bytes:
+    """
+    Encode messages in the legacy newline-delimited JSON format sent to the UI.
+    """
+    return "".join(json.dumps(message) + "\n" for message in messages).encode("utf-8")
+
+
+def encode_legacy_request(message: dict) -> bytes:
+    """
+    Encode a message in the legacy format sent to AS64; an 8 digit ASCII length followed by JSON.
+    """
+    body = json.dumps(message).encode("utf-8")
+    return str(len(body)).zfill(8).encode("ascii") + body
+
+
+class FramedConnection(object):
+    """
+    Reads and writes messages over a Transport, negotiating binary framing with the UI.
+    """
+
+    def __init__(self, transport: Transport, binary: bool = True, use_msgpack: bool = True) -> None:
+        """
+        :param transport: Transport to read and write.
+        :param binary: Accept binary framing if the UI requests it. If False, HELLO frames are ignored.
+        :param use_msgpack: Select MessagePack if both sides support it.
+        """
+        self.transport = transport
+
+        self.binary: bool = False
+        self.flags: FrameFlags = FrameFlags.NONE
+
+        self._allow_binary = binary
+        self._use_msgpack = use_msgpack
+
+    @property
+    def codec(self) -> str:
+        return "msgpack" if self.flags & FrameFlags.MSGPACK else "json"
+
+    async def read(self) -> List[dict]:
+        """
+        Read the next frame and return the messages it contains.
+        Frames which cannot be decoded are logged and skipped.
+        """
+        while True:
+            header = await self.transport.read_exactly(HEADER_SIZE)
+
+            if header[0] == MAGIC:
+                _, version, frame_type, flags, length = HEADER.unpack(header)
+
+                if version != PROTOCOL_VERSION:
+                    logger.warning(f"[FramedConnection.read] Discarding frame of unsupported protocol version {version}")
+                    await self._discard(length)
+                    continue
+            else:
+                frame_type, flags = None, FrameFlags.NONE
+
+                try:
+                    length = int(header.decode("ascii"))
+                except (UnicodeDecodeError, ValueError):
+                    logger.debug(f"[FramedConnection.read] Invalid header received: {header.hex()}")
+                    continue
+
+            if length > MAX_FRAME_SIZE:
+                logger.warning(f"[FramedConnection.read] Discarding oversized frame of {length} bytes")
+                await self._discard(length)
+                continue
+
+            body = await self.transport.read_exactly(length)
+
+            try:
+                if frame_type is None:
+                    return [json.loads(body)]
+                if frame_type == FrameType.MESSAGE:
+                    return [decode_message(body, FrameFlags(flags))]
+                if frame_type == FrameType.BATCH:
+                    return decode_batch(body, FrameFlags(flags))
+                if frame_type == FrameType.HELLO:
+                    await self._handle_hello(json.loads(body))
+                    continue
+
+                logger.warning(f"[FramedConnection.read] Unknown frame type: {frame_type}")
+            except Exception as e:
+                # Decoding errors depend on the codec, e.g. json.JSONDecodeError or msgpack's own exceptions
+                logger.warning(f"[FramedConnection.read] Invalid frame received: {e}")
+
+    async def write(self, messages: Sequence[dict]) -> None:
+        """
+        Write messages to the transport in a single frame.
+        """
+        if not messages:
+            return
+
+        if self.binary:
+            data = encode_batch(messages, self.flags)
+        else:
+            data = encode_legacy(messages)
+
+        await self.transport.write_bytes(data)
+
+    async def _discard(self, num_bytes: int) -> None:
+        """
+        Read and drop num_bytes, keeping the stream aligned on the next frame without buffering the body.
+        """
+        while num_bytes > 0:
+            chunk = min(num_bytes, DISCARD_CHUNK_SIZE)
+            await self.transport.read_exactly(chunk)
+            num_bytes -= chunk
+
+    async def _handle_hello(self, hello: dict) -> None:
+        if not self._allow_binary:
+            logger.debug("[FramedConnection._handle_hello] Binary framing disabled, continuing with legacy framing.")
+            return
+
+        if hello.get("version", 0) < PROTOCOL_VERSION:
+            logger.debug(f"[FramedConnection._handle_hello] Unsupported protocol version {hello.get('version')}")
+            return
+
+        codecs = hello.get("codecs", ["json"])
+        use_msgpack = self._use_msgpack and "msgpack" in codecs and "msgpack" in available_codecs()
+        flags = FrameFlags.MSGPACK if use_msgpack else FrameFlags.NONE
+
+        # The reply itself is always JSON
+        reply = {"version": PROTOCOL_VERSION, "codec": "msgpack" if use_msgpack else "json"}
+        await self.transport.write_bytes(encode_frame(FrameType.HELLO, encode_message(reply)))
+
+        self.binary = True
+        self.flags = flags
+
+        logger.info(f"[FramedConnection._handle_hello] Negotiated binary framing v{PROTOCOL_VERSION} with {self.codec} payloads")
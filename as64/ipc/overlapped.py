@@ -0,0 +1,237 @@
+# AutoSplit64
+#
+# Copyright (C) 2025 Kainev
+#
+# This project is currently not open source and is under active development.
+# You may view the code, but it is not licensed for distribution, modification, or use at this time.
+#
+# For more information see https://github.com/Kainev/AutoSplit64?tab=readme#license
+
+import asyncio
+import logging
+import threading
+from typing import Any, Callable, Dict, List, Optional
+
+from .win32 import INFINITE, MAXIMUM_WAIT_OBJECTS
+
+logger = logging.getLogger(__name__)
+
+
+class OverlappedClosedError(Exception):
+    """Raised for operations submitted to, or pending on, a stopped OverlappedDispatcher."""
+    pass
+
+
+class _Slot(object):
+    """
+    An OVERLAPPED structure and the manual-reset event it signals.
+    """
+    __slots__ = ("event", "overlapped")
+
+    def __init__(self, event, overlapped) -> None:
+        self.event = event
+        self.overlapped = overlapped
+
+
+class _Operation(object):
+    __slots__ = ("handle", "slot", "future")
+
+    def __init__(self, handle, slot: _Slot, future: asyncio.Future) -> None:
+        self.handle = handle
+        self.slot = slot
+        self.future = future
+
+
+class OverlappedPool(object):
+    """
+    Reusable OVERLAPPED structures with their events, so each operation does not create
+    and leak a new event handle.
+    """
+
+    def __init__(self, api) -> None:
+        self._api = api
+        self._free: List[_Slot] = []
+        self._slots: List[_Slot] = []
+        self._lock = threading.Lock()
+
+    def acquire(self) -> _Slot:
+        with self._lock:
+            if self._free:
+                return self._free.pop()
+
+        event = self._api.create_event()
+        slot = _Slot(event, self._api.create_overlapped(event))
+
+        with self._lock:
+            self._slots.append(slot)
+
+        return slot
+
+    def release(self, slot: _Slot) -> None:
+        """
+        Return a slot once its operation has completed. Its event is reset; the OVERLAPPED
+        structure is reused as is, as starting an operation reinitialises its status.
+        """
+        self._api.reset_event(slot.event)
+
+        with self._lock:
+            self._free.append(slot)
+
+    def close(self) -> None:
+        with self._lock:
+            for slot in self._slots:
+                self._api.close_handle(slot.event)
+
+            self._slots.clear()
+            self._free.clear()
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+
+class OverlappedDispatcher(object):
+    """
+    Completes overlapped operations on an asyncio event loop.
+
+    A single completion thread waits on the events of every in-flight operation with
+    WaitForMultipleObjects and resolves the matching future with call_soon_threadsafe.
+    Operations are started on the event loop thread, any number may be in flight at once
+    (up to MAXIMUM_WAIT_OBJECTS - 1), and no executor threads are used.
+    """
+
+    MAX_PENDING = MAXIMUM_WAIT_OBJECTS - 1
+
+    def __init__(self, api, loop: Optional[asyncio.AbstractEventLoop] = None) -> None:
+        """
+        :param api: Win32Api, or MockWin32Api.
+        :param loop: Loop futures are resolved on. Defaults to the running loop when started.
+        """
+        self._api = api
+        self._loop = loop
+        self._pool = OverlappedPool(api)
+
+        self._pending: Dict[Any, _Operation] = {}
+        self._lock = threading.Lock()
+        self._limit: Optional[asyncio.Semaphore] = None
+
+        # Signalled to make the completion thread pick up new operations, or stop
+        self._wake = None
+        self._thread: Optional[threading.Thread] = None
+        self._running = False
+
+    @property
+    def running(self) -> bool:
+        return self._running
+
+    def start(self) -> None:
+        if self._running:
+            return
+
+        if self._loop is None:
+            self._loop = asyncio.get_running_loop()
+
+        self._wake = self._api.create_event()
+        self._limit = asyncio.Semaphore(self.MAX_PENDING)
+        self._running = True
+
+        self._thread = threading.Thread(target=self._run, name="OverlappedDispatcher", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """
+        Stop the completion thread. Operations still pending fail with OverlappedClosedError;
+        cancel their I/O first to have them complete normally.
+        """
+        if not self._running:
+            return
+
+        self._running = False
+        self._api.set_event(self._wake)
+        self._thread.join()
+        self._thread = None
+
+        with self._lock:
+            pending = list(self._pending.values())
+            self._pending.clear()
+
+        for operation in pending:
+            if not operation.future.done():
+                operation.future.set_exception(OverlappedClosedError("Dispatcher stopped."))
+
+        self._api.close_handle(self._wake)
+        self._pool.close()
+
+    async def submit(self, handle, start: Callable[[Any], Any]) -> int:
+        """
+        Start an overlapped operation and wait for it to complete.
+
+        :param handle: Handle the operation is performed on.
+        :param start: Called with the OVERLAPPED structure to start the operation, e.g.
+                      `lambda overlapped: api.read_file(handle, buffer, overlapped)`.
+                      Errors raised by it are propagated.
+        :return: Number of bytes transferred.
+        :raises: The API's error type if the operation fails.
+        """
+        if not self._running:
+            raise OverlappedClosedError("Dispatcher is not running.")
+
+        async with self._limit:
+            slot = self._pool.acquire()
+
+            try:
+                start(slot.overlapped)
+            except BaseException:
+                self._pool.release(slot)
+                raise
+
+            future = self._loop.create_future()
+
+            with self._lock:
+                self._pending[slot.event] = _Operation(handle, slot, future)
+
+            self._api.set_event(self._wake)
+
+            # A cancelled caller does not abandon the slot; the completion thread still
+            # waits for the operation, e.g. to finish with ERROR_OPERATION_ABORTED.
+            return await future
+
+    def _run(self) -> None:
+        api = self._api
+
+        while self._running:
+            with self._lock:
+                events = [self._wake]
+                events.extend(self._pending)
+
+            index = api.wait_for_multiple(events, INFINITE)
+
+            if index is None:
+                continue
+
+            if index == 0:
+                api.reset_event(self._wake)
+                continue
+
+            with self._lock:
+                operation = self._pending.pop(events[index], None)
+
+            if operation is None:
+                continue
+
+            try:
+                result, error = api.get_overlapped_result(operation.handle, operation.slot.overlapped), None
+            except Exception as e:
+                result, error = None, e
+
+            self._pool.release(operation.slot)
+            self._loop.call_soon_threadsafe(self._resolve, operation.future, result, error)
+
+    @staticmethod
+    def _resolve(future: asyncio.Future, result: Optional[int], error: Optional[Exception]) -> None:
+        if future.done():
+            return
+
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
@@ -11,18 +11,26 @@ import threading
 import logging
 from typing import Optional
 
-import win32file
-import win32pipe
-import win32event
+try:
+    import win32file
+    import win32pipe
+    import win32event
 
-import pywintypes
+    import pywintypes
+except ImportError:
+    # Named pipes are only available on Windows, see as64.ipc.transport for portable transports
+    win32file = win32pipe = win32event = pywintypes = None
 
 import asyncio
 
+from .transport import Transport, TransportError
+from .overlapped import OverlappedDispatcher, OverlappedClosedError
+from .win32 import default_api, ERROR_BROKEN_PIPE, ERROR_NO_DATA, ERROR_OPERATION_ABORTED
+
 logger = logging.getLogger(__name__)
 
 
-class PipeError(Exception):
+class PipeError(TransportError):
     """Base exception class for Pipe-related errors."""
     pass
 
@@ -38,85 +46,91 @@ class PipeWriteError(PipeError):
     """Raised when writing to the pipe fails."""
     pass
 
-class AsyncPipe:
+class AsyncPipe(Transport):
     """
     A named pipe wrapper using asynchronous (overlapped) I/O on Windows.
-    This class provides a header-based read mechanism and a raw write mechanism.
+    This class provides a header-based read mechanism and a raw write mechanism,
+    and can be used as a Transport for a FramedConnection.
+
+    Operations complete through an OverlappedDispatcher, so waiting on the pipe never
+    occupies an executor thread, and reads and writes may be in flight at the same time.
     """
 
-    def __init__(self, name: str):
+    def __init__(self, name: str, api=None):
         """
         :param name: The name of the pipe
+        :param api: Win32 API layer, see as64.ipc.win32. Defaults to pywin32 when available.
         """
         self.name = name
         self.pipe = None
         self.buffer = ""
 
+        self.api = api if api is not None else default_api()
+        self._dispatcher: Optional[OverlappedDispatcher] = None
+
     async def create(self):
         """
         Create the named pipe with overlapped I/O.
         Raises PipeConnectionError if creation fails.
         """
+        if self.api is None:
+            raise PipeConnectionError("Named pipes are not supported on this platform.")
+        
         try:
-            self.pipe = win32pipe.CreateNamedPipe(
-                self.name,
-                win32pipe.PIPE_ACCESS_DUPLEX | win32file.FILE_FLAG_OVERLAPPED,
-                win32pipe.PIPE_TYPE_MESSAGE | win32pipe.PIPE_READMODE_MESSAGE | win32pipe.PIPE_WAIT,
-                1,      # Max instances
-                4096,   # Out buffer size
-                4096,   # In buffer size
-                0,      # Default timeout
-                None    # Default security attributes
-            )
+            self.pipe = self.api.create_named_pipe(self.name, 4096, 4096)
             logger.debug(f"[AsyncPipe.create] Created named pipe: {self.name}")
-        except pywintypes.error as e:
+        except self.api.error as e:
             logger.error(f"[AsyncPipe.create] Failed to create pipe {self.name}: {e}")
             raise PipeConnectionError(f"[AsyncPipe.create] Failed to create pipe {self.name}: {e}") from e
 
+        self._dispatcher = OverlappedDispatcher(self.api, asyncio.get_running_loop())
+        self._dispatcher.start()
+
     async def connect(self):
         """
         Wait for a client to connect to the pipe.
         Raises PipeConnectionError if connection fails.
         """
         try:
-            await asyncio.get_event_loop().run_in_executor(
-                None,
-                win32pipe.ConnectNamedPipe,
-                self.pipe,
-                None
-            )
+            await self._dispatcher.submit(self.pipe, lambda overlapped: self.api.connect_named_pipe(self.pipe, overlapped))
             logger.debug(f"[AsyncPipe.connect] Pipe connected: {self.name}")
-        except pywintypes.error as e:
+        except (self.api.error, OverlappedClosedError) as e:
             logger.error(f"[AsyncPipe.connect] Failed to connect pipe {self.name}: {e}")
             raise PipeConnectionError(f"[AsyncPipe.connect] Failed to connect pipe {self.name}: {e}") from e
 
-    async def _read_exactly(self, num_bytes: int) -> bytes:
+    async def read_exactly(self, num_bytes: int) -> bytes:
         """
         Asynchronously read num_bytes from the pipe.
         Raises PipeReadError if reading fails or if the pipe is broken.
         """
-        overlapped = pywintypes.OVERLAPPED()
-        event = win32event.CreateEvent(None, True, False, None)
-        overlapped.hEvent = event
+        if self._dispatcher is None:
+            raise PipeReadError("Pipe is not connected.")
+
+        data = bytearray()
 
         try:
-            _, data = win32file.ReadFile(self.pipe, num_bytes, overlapped)
+            while len(data) < num_bytes:
+                buffer = self.api.allocate_buffer(num_bytes - len(data))
+                transferred = await self._dispatcher.submit(self.pipe, lambda overlapped: self.api.read_file(self.pipe, buffer, overlapped))
 
-            await asyncio.get_event_loop().run_in_executor(
-                None,
-                win32event.WaitForSingleObject,
-                overlapped.hEvent,
-                win32event.INFINITE
-            )
-            logger.debug(f"[AsyncPipe._read_exactly] Read {num_bytes} bytes from {self.name}")
+                # A read completing without data means the pipe has been closed, retrying would never end
+                if not transferred:
+                    logger.error("[AsyncPipe.read_exactly] Read completed with no data, the pipe is closed.")
+                    raise PipeReadError("Pipe connection closed by the client.")
+
+                data += buffer[:transferred]
+
+            logger.debug(f"[AsyncPipe.read_exactly] Read {num_bytes} bytes from {self.name}")
             return bytes(data)
 
-        except pywintypes.error as e:
-            if e.winerror == 109:  # ERROR_BROKEN_PIPE
-                logger.error("[AsyncPipe._read_exactly] Broken pipe while reading.")
+        except OverlappedClosedError as e:
+            raise PipeReadError("Pipe closed.") from e
+        except self.api.error as e:
+            if e.winerror in (ERROR_BROKEN_PIPE, ERROR_OPERATION_ABORTED):
+                logger.error("[AsyncPipe.read_exactly] Broken pipe while reading.")
                 raise PipeReadError("Pipe connection closed by the client.") from e
             else:
-                logger.error(f"[AsyncPipe._read_exactly] Failed to read from {self.name}: {e}")
+                logger.error(f"[AsyncPipe.read_exactly] Failed to read from {self.name}: {e}")
                 raise PipeReadError(f"Failed to read from pipe {self.name}: {e}") from e
 
     async def read(self) -> list[str]:
@@ -131,7 +145,7 @@ class AsyncPipe:
         try:
             while True:
                 # 1
-                header_data = await self._read_exactly(8)
+                header_data = await self.read_exactly(8)
                 try:
                     header_str = header_data.decode("utf-8", errors="ignore").strip()
                     body_length = int(header_str)
@@ -141,7 +155,7 @@ class AsyncPipe:
                     continue
 
                 # 2
-                body_data = await self._read_exactly(body_length)
+                body_data = await self.read_exactly(body_length)
                 try:
                     message = body_data.decode("utf-8")
                     logger.debug(f"[AsyncPipe.read] Decoded message: {message}")
@@ -162,54 +176,56 @@ class AsyncPipe:
 
     async def write(self, payload: str):
         """
-        Write data to the pipe
+        Write a newline-terminated string to the pipe
         Raises PipeWriteError if the pipe is broken or writing fails.
         """
-        overlapped = pywintypes.OVERLAPPED()
-        event = win32event.CreateEvent(None, True, False, None)
-        overlapped.hEvent = event
-        
-        payload += "\n"
+        await self.write_bytes((payload + "\n").encode("utf-8"))
 
-        payload_bytes = payload.encode("utf-8")
+    async def write_bytes(self, data: bytes):
+        """
+        Write raw bytes to the pipe in a single overlapped write
+        Raises PipeWriteError if the pipe is broken or writing fails.
+        """
+        if self._dispatcher is None:
+            raise PipeWriteError("Pipe is not connected.")
 
         try:
-            win32file.WriteFile(self.pipe, payload_bytes, overlapped)
-
-            await asyncio.get_event_loop().run_in_executor(
-                None,
-                win32event.WaitForSingleObject,
-                overlapped.hEvent,
-                win32event.INFINITE
-            )
-            logger.debug(f"[AsyncPipe.write] Wrote payload to {self.name}: {payload}")
-
-        except pywintypes.error as e:
-            if e.winerror in (232, 109):  # ERROR_NO_DATA, ERROR_BROKEN_PIPE
-                logger.debug("[AsyncPipe.write] Broken pipe while writing.")
+            await self._dispatcher.submit(self.pipe, lambda overlapped: self.api.write_file(self.pipe, data, overlapped))
+            logger.debug(f"[AsyncPipe.write_bytes] Wrote {len(data)} bytes to {self.name}")
+
+        except OverlappedClosedError as e:
+            raise PipeWriteError("Pipe closed.") from e
+        except self.api.error as e:
+            if e.winerror in (ERROR_NO_DATA, ERROR_BROKEN_PIPE, ERROR_OPERATION_ABORTED):
+                logger.debug("[AsyncPipe.write_bytes] Broken pipe while writing.")
                 raise PipeWriteError("Pipe connection closed by the client.") from e
             else:
-                logger.debug(f"[AsyncPipe.write] Failed to write to {self.name}: {e}")
+                logger.debug(f"[AsyncPipe.write_bytes] Failed to write to {self.name}: {e}")
                 raise PipeWriteError(f"Failed to write to pipe {self.name}: {e}") from e
         except Exception as e:
-            logger.debug(f"[AsyncPipe.write] Unexpected error: {e}")
+            logger.debug(f"[AsyncPipe.write_bytes] Unexpected error: {e}")
             raise PipeWriteError(f"Unexpected error during write to {self.name}: {e}") from e
 
     async def close(self):
         """
         Close the pipe.
-        Disconnects any open connection and closes the handle.
+        Cancels pending I/O, disconnects any open connection and closes the handle.
         """
         if self.pipe:
             try:
-                win32pipe.DisconnectNamedPipe(self.pipe)
-            except pywintypes.error as e:
+                self.api.cancel_io(self.pipe)
+                self.api.disconnect_named_pipe(self.pipe)
+            except self.api.error as e:
                 logger.debug(f"[AsyncPipe.close] Error disconnecting pipe {self.name}: {e}")
             finally:
-                win32file.CloseHandle(self.pipe)
+                self.api.close_handle(self.pipe)
                 self.pipe = None
                 logger.debug(f"[AsyncPipe.close] Pipe closed: {self.name}")
 
+        if self._dispatcher is not None:
+            self._dispatcher.stop()
+            self._dispatcher = None
+
 
 
 class NamedPipeError(Exception):
@@ -7,7 +7,7 @@
 #
 # For more information see https://github.com/Kainev/AutoSplit64?tab=readme#license
 
-from .registry import call, get, register
+from .registry import call, get, register, invalidate, invalidate_dependants, configure, shutdown, ExecutionPolicy
 
 from . import capture_rpc
 from . import plugin_manager_rpc
\ No newline at end of file
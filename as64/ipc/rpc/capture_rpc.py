@@ -12,10 +12,10 @@ import cv2
 from as64.plugins import CapturePlugin
 from as64.plugins.management import plugin_manager
 
-from .registry import register
+from .registry import register, ExecutionPolicy
 
 
-@register("save_frame")
+@register("save_frame", policy=ExecutionPolicy.DEDICATED)
 def save_frame():
     capture_plugin = plugin_manager.get_active_plugin_classes(CapturePlugin)()
     
@@ -10,9 +10,9 @@
 from as64.plugins import CapturePlugin
 from as64.plugins.management import plugin_manager
 
-from .registry import register
+from .registry import register, ExecutionPolicy
 
-@register("plugin_manager.capture_plugins")
+@register("plugin_manager.capture_plugins", cache_ttl=30, invalidated_by=("plugin_manager.set_loaded",))
 def capture_plugins():
     capture_plugins = plugin_manager.get_found_plugin_classes(CapturePlugin)
     return [cls.metadata.name for cls in capture_plugins]
@@ -25,7 +25,11 @@ def current_capture_plugin():
 def set_loaded(plugin_name: str, loaded: bool):
     plugin_manager.set_plugin_loaded_by_name(plugin_name, loaded)
     
-@register("plugin_manager.available_capture_sources")
+@register("plugin_manager.available_capture_sources",
+          policy=ExecutionPolicy.THREAD_POOL,
+          max_concurrency=1,
+          cache_ttl=2,
+          invalidated_by=("plugin_manager.set_loaded", "config.set", "config.rollback"))
 def available_capture_sources():
     capture_plugin = plugin_manager.get_active_plugin_classes(CapturePlugin)()
     return capture_plugin.get_available_sources()
\ No newline at end of file
@@ -8,59 +8,383 @@
 # For more information see https://github.com/Kainev/AutoSplit64?tab=readme#license
 
 
+import json
+import time
 import asyncio
 import logging
-from functools import wraps
-
-import asyncio
+import threading
+from enum import Enum
+from functools import partial
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, Optional, Set
 
 logger = logging.getLogger("RPC")
 
+
+class ExecutionPolicy(Enum):
+    """
+    Where a synchronous RPC function runs. Coroutine functions always run on the event loop.
+    """
+    # On the event loop. Calls run in the order they are received; for fast functions only
+    INLINE = "inline"
+    # On the shared RPC thread pool
+    THREAD_POOL = "thread_pool"
+    # On a worker thread of its own, so it never waits behind other RPCs. Calls run one at a time
+    DEDICATED = "dedicated"
+
+
+class RpcStats(object):
+    """
+    Call count and latency of an RPC method, including time spent waiting to run.
+    """
+    __slots__ = ("count", "errors", "in_flight", "total", "max")
+
+    def __init__(self) -> None:
+        self.reset()
+
+    def reset(self) -> None:
+        self.count = 0
+        self.errors = 0
+        self.in_flight = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, elapsed: float) -> None:
+        self.count += 1
+        self.total += elapsed
+        if elapsed > self.max:
+            self.max = elapsed
+
+    def as_dict(self) -> dict:
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "in_flight": self.in_flight,
+            "mean_ms": self.total / self.count * 1000 if self.count else 0.0,
+            "max_ms": self.max * 1000,
+        }
+
+
+_MISS = object()
+
+
+class RpcCache(object):
+    """
+    LRU cache of RPC results with a time to live. Read and filled on the event loop thread,
+    and may be cleared from any thread.
+    """
+    __slots__ = ("ttl", "maxsize", "hits", "misses", "generation", "_entries", "_lock")
+
+    def __init__(self, ttl: float, maxsize: int = 32) -> None:
+        """
+        :param ttl: Seconds a result is served from the cache.
+        :param maxsize: Number of results kept, the least recently used is evicted first.
+        """
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+
+        # Incremented on invalidation, so results computed before it are not stored
+        self.generation = 0
+
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key) -> Any:
+        """
+        Return the cached result for key, or _MISS.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is not None:
+                expires, value = entry
+
+                if time.monotonic() < expires:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+
+                del self._entries[key]
+
+            self.misses += 1
+            return _MISS
+
+    def put(self, key, value, generation: int) -> None:
+        with self._lock:
+            if generation != self.generation:
+                return
+
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.generation += 1
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class RpcMethod(object):
+    __slots__ = ("name", "func", "processor", "policy", "semaphore", "stats", "cache", "cache_key", "_executor")
+
+    def __init__(self,
+                 name: str,
+                 func: Callable,
+                 processor: Optional[Callable] = None,
+                 policy: ExecutionPolicy = ExecutionPolicy.INLINE,
+                 max_concurrency: Optional[int] = None,
+                 cache: Optional[RpcCache] = None,
+                 cache_key: Optional[Callable] = None) -> None:
+        self.name = name
+        self.func = func
+        self.processor = processor
+        self.policy = policy
+        self.semaphore = asyncio.Semaphore(max_concurrency) if max_concurrency else None
+        self.stats = RpcStats()
+        self.cache = cache
+        self.cache_key = cache_key
+
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def executor(self) -> Optional[ThreadPoolExecutor]:
+        if self.policy is ExecutionPolicy.THREAD_POOL:
+            return _thread_pool()
+
+        if self.policy is ExecutionPolicy.DEDICATED:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"rpc-{self.name}")
+            return self._executor
+
+        return None
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def key(self, args, kwargs):
+        if self.cache_key is not None:
+            return self.cache_key(*args, **kwargs)
+
+        return json.dumps([args, kwargs], sort_keys=True, default=repr)
+
+    def run(self, args, kwargs):
+        result = self.func(*args, **kwargs)
+
+        if self.processor:
+            result = self.processor(result)
+
+        return result
+
+
 _RPC_REGISTRY = {}
 
-def register(name=None, processor=None):
+# Method name -> names of the cached methods its calls invalidate
+_DEPENDANTS: Dict[str, Set[str]] = {}
+
+_thread_pool_workers = 4
+_thread_pool_executor: Optional[ThreadPoolExecutor] = None
+
+
+def register(name=None,
+             processor=None,
+             policy: ExecutionPolicy = ExecutionPolicy.INLINE,
+             max_concurrency: Optional[int] = None,
+             cache_ttl: Optional[float] = None,
+             cache_size: int = 32,
+             cache_key: Optional[Callable] = None,
+             invalidated_by: Iterable[str] = ()):
     """
     Decorator to register a function as an RPC call.
     Usage:
-        @rpc("someName", processor=func)
+        @rpc("someName", processor=func, policy=ExecutionPolicy.THREAD_POOL, max_concurrency=1)
         def some_func(*args, **kwargs):
             ...
+
+    :param processor: Applied to the result before it is returned.
+    :param policy: ExecutionPolicy of synchronous functions.
+    :param max_concurrency: Maximum number of calls running at once, or None for no limit.
+    :param cache_ttl: Seconds results are cached for, per set of arguments. None disables caching.
+                      Cached results are shared between callers and must not be mutated. Errors
+                      and None results are not cached.
+    :param cache_size: Maximum number of cached results.
+    :param cache_key: Called with the RPC arguments to build the cache key. Defaults to the JSON encoded arguments.
+    :param invalidated_by: Names of RPCs which clear the cache when called successfully. Functions
+                           which are also called directly clear it with invalidate_dependants().
     """
     def decorator(func):
         proc_name = name or func.__name__
-        _RPC_REGISTRY[proc_name] = (func, processor)
+        cache = RpcCache(cache_ttl, cache_size) if cache_ttl is not None else None
+        _RPC_REGISTRY[proc_name] = RpcMethod(proc_name, func, processor, policy, max_concurrency, cache, cache_key)
+
+        for dependency in invalidated_by:
+            _DEPENDANTS.setdefault(dependency, set()).add(proc_name)
 
         return func
     return decorator
 
-def get(proc_name):
-    """Retrieve a registered RPC function by name, or None if not found"""
+def get(proc_name) -> Optional[RpcMethod]:
+    """Retrieve a registered RPC method by name, or None if not found"""
     return _RPC_REGISTRY.get(proc_name)
 
 
+def invalidate(*names: str) -> None:
+    """
+    Clear the cached results of the named RPCs, or of every RPC if no names are given.
+    """
+    for name in names or _RPC_REGISTRY:
+        method = _RPC_REGISTRY.get(name)
+        if method is not None and method.cache is not None:
+            method.cache.clear()
+
+
+def invalidate_dependants(name: str) -> None:
+    """
+    Clear the cached results of the RPCs registered as invalidated by `name`.
+    Safe to call from any thread.
+    """
+    dependants = _DEPENDANTS.get(name)
+    if dependants:
+        invalidate(*dependants)
+
+
+def configure(workers: int = 4) -> None:
+    """
+    Set the number of threads of the shared RPC thread pool. Takes effect when the pool is next created.
+    """
+    global _thread_pool_workers
+    _thread_pool_workers = workers
+
+
+def shutdown() -> None:
+    """
+    Shut down the RPC worker threads. Calls which have not started are cancelled.
+    """
+    global _thread_pool_executor
+
+    if _thread_pool_executor is not None:
+        _thread_pool_executor.shutdown(wait=False, cancel_futures=True)
+        _thread_pool_executor = None
+
+    for method in _RPC_REGISTRY.values():
+        method.shutdown()
+
+
+def _thread_pool() -> ThreadPoolExecutor:
+    global _thread_pool_executor
+
+    if _thread_pool_executor is None:
+        _thread_pool_executor = ThreadPoolExecutor(max_workers=_thread_pool_workers, thread_name_prefix="rpc")
+
+    return _thread_pool_executor
+
+
+async def _invoke(method: RpcMethod, args, kwargs):
+    if asyncio.iscoroutinefunction(method.func):
+        result = await method.func(*args, **kwargs)
+
+        if method.processor:
+            result = method.processor(result)
+
+        return result
+
+    executor = method.executor()
+    if executor is None:
+        return method.run(args, kwargs)
+
+    return await asyncio.get_running_loop().run_in_executor(executor, partial(method.run, args, kwargs))
+
+
 async def call(proc_name, args=None, kwargs=None):
     """
     Dispatches the RPC call to a registered function (sync or async)
+    according to its execution policy.
     Returns (result, error)
     """
     args = args or []
     kwargs = kwargs or {}
-    entry = get(proc_name)
-    
-    if not entry:
+    method = get(proc_name)
+
+    if not method:
         return None, f"Unknown RPC '{proc_name}'"
-    
-    func, processor = entry
+
+    stats = method.stats
+    stats.in_flight += 1
+    start = time.perf_counter()
 
     try:
-        if asyncio.iscoroutinefunction(func):
-            result = await func(*args, **kwargs)
+        cache = method.cache
+        if cache is not None:
+            key = method.key(args, kwargs)
+            result = cache.get(key)
+
+            if result is not _MISS:
+                return result, None
+
+            generation = cache.generation
+
+        if method.semaphore is not None:
+            async with method.semaphore:
+                result = await _invoke(method, args, kwargs)
         else:
-            result = func(*args, **kwargs)
-            
-        if processor:
-            result = processor(result)
-            
+            result = await _invoke(method, args, kwargs)
+
+        # None is how RPCs such as route.load report failures, which should be retried rather than served again
+        if cache is not None and result is not None:
+            cache.put(key, result, generation)
+
+        invalidate_dependants(proc_name)
+
         return result, None
     except Exception as ex:
-        return None, str(ex)
\ No newline at end of file
+        stats.errors += 1
+        return None, str(ex)
+    finally:
+        stats.in_flight -= 1
+        stats.record(time.perf_counter() - start)
+
+
+@register("rpc.stats")
+def summary() -> dict:
+    """
+    Per-method call counts and latencies of every RPC called so far.
+    """
+    summary = {}
+
+    for name, method in _RPC_REGISTRY.items():
+        if not (method.stats.count or method.stats.in_flight):
+            continue
+
+        summary[name] = method.stats.as_dict()
+
+        if method.cache is not None:
+            summary[name].update({
+                "cache_hits": method.cache.hits,
+                "cache_misses": method.cache.misses,
+                "cache_size": len(method.cache),
+            })
+
+    return summary
+
+
+@register("rpc.reset_stats")
+def reset_stats() -> None:
+    for method in _RPC_REGISTRY.values():
+        method.stats.reset()
+
+        if method.cache is not None:
+            method.cache.hits = 0
+            method.cache.misses = 0
+
+
+@register("rpc.invalidate")
+def invalidate_rpc(*names: str) -> None:
+    invalidate(*names)
@@ -0,0 +1,281 @@
+# AutoSplit64
+#
+# Copyright (C) 2025 Kainev
+#
+# This project is currently not open source and is under active development.
+# You may view the code, but it is not licensed for distribution, modification, or use at this time.
+#
+# For more information see https://github.com/Kainev/AutoSplit64?tab=readme#license
+
+import os
+import sys
+import socket
+import asyncio
+import logging
+import tempfile
+from typing import Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class TransportError(Exception):
+    """Base exception class for transport errors."""
+    pass
+
+
+class TransportClosedError(TransportError):
+    """Raised when reading from or writing to a closed transport."""
+    pass
+
+
+class Transport(object):
+    """
+    Bidirectional byte stream between AS64 and the UI.
+    """
+
+    async def create(self) -> None:
+        """
+        Create the server endpoint the UI connects to.
+        """
+        pass
+
+    async def connect(self) -> None:
+        """
+        Wait for the UI to connect.
+        """
+        pass
+
+    async def read_exactly(self, num_bytes: int) -> bytes:
+        """
+        Read exactly num_bytes from the transport.
+        Raises TransportClosedError if the transport is closed first.
+        """
+        raise NotImplementedError
+
+    async def write_bytes(self, data: bytes) -> None:
+        """
+        Write data to the transport in a single operation, so concurrent writes do not interleave.
+        """
+        raise NotImplementedError
+
+    async def close(self) -> None:
+        pass
+
+
+class MemoryTransport(Transport):
+    """
+    In-memory transport, one end of a pair created by MemoryTransport.pair().
+    """
+
+    def __init__(self) -> None:
+        self._buffer = bytearray()
+        self._available = asyncio.Event()
+        self._peer: Optional["MemoryTransport"] = None
+        self._closed = False
+
+    @classmethod
+    def pair(cls) -> Tuple["MemoryTransport", "MemoryTransport"]:
+        first, second = cls(), cls()
+        first._peer, second._peer = second, first
+
+        return first, second
+
+    async def read_exactly(self, num_bytes: int) -> bytes:
+        while len(self._buffer) < num_bytes:
+            if self._closed:
+                raise TransportClosedError("Memory transport closed.")
+
+            self._available.clear()
+            await self._available.wait()
+
+        data = bytes(self._buffer[:num_bytes])
+        del self._buffer[:num_bytes]
+
+        return data
+
+    async def write_bytes(self, data: bytes) -> None:
+        if self._closed or self._peer is None or self._peer._closed:
+            raise TransportClosedError("Memory transport closed.")
+
+        self._peer._buffer += data
+        self._peer._available.set()
+
+    async def close(self) -> None:
+        self._closed = True
+        self._available.set()
+
+        if self._peer is not None:
+            self._peer._closed = True
+            self._peer._available.set()
+
+
+class StreamTransport(Transport):
+    """
+    Transport over an asyncio StreamReader/StreamWriter pair.
+    Reads complete on the event loop without a thread hop.
+    """
+
+    def __init__(self, reader: Optional[asyncio.StreamReader] = None, writer: Optional[asyncio.StreamWriter] = None) -> None:
+        self.reader = reader
+        self.writer = writer
+
+    async def read_exactly(self, num_bytes: int) -> bytes:
+        if self.reader is None:
+            raise TransportClosedError("Transport is not connected.")
+
+        try:
+            return await self.reader.readexactly(num_bytes)
+        except asyncio.IncompleteReadError as e:
+            raise TransportClosedError("Connection closed by the client.") from e
+        except ConnectionError as e:
+            raise TransportClosedError(f"Connection lost: {e}") from e
+
+    async def write_bytes(self, data: bytes) -> None:
+        if self.writer is None or self.writer.is_closing():
+            raise TransportClosedError("Transport is not connected.")
+
+        try:
+            self.writer.write(data)
+            await self.writer.drain()
+        except ConnectionError as e:
+            raise TransportClosedError(f"Connection lost: {e}") from e
+
+    async def close(self) -> None:
+        if self.writer is not None:
+            self.writer.close()
+            try:
+                await self.writer.wait_closed()
+            except ConnectionError:
+                pass
+
+            self.writer = None
+            self.reader = None
+
+
+class _StreamServerTransport(StreamTransport):
+    """
+    StreamTransport which listens for a single client connection.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._connected: Optional[asyncio.Future] = None
+
+    async def connect(self) -> None:
+        if self._server is None:
+            await self.create()
+
+        self.reader, self.writer = await self._connected
+
+    async def close(self) -> None:
+        await super().close()
+
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    def _on_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        if self._connected.done():
+            logger.warning("[StreamTransport] Rejecting additional client connection.")
+            writer.close()
+            return
+
+        self._connected.set_result((reader, writer))
+
+
+class UnixSocketTransport(_StreamServerTransport):
+    """
+    Unix domain socket transport.
+    """
+
+    def __init__(self, path: str) -> None:
+        """
+        :param path: Filesystem path of the socket. An existing socket file is replaced.
+        """
+        super().__init__()
+        self.path = path
+
+    async def create(self) -> None:
+        if os.path.exists(self.path):
+            os.unlink(self.path)
+
+        self._connected = asyncio.get_running_loop().create_future()
+        self._server = await asyncio.start_unix_server(self._on_client, path=self.path)
+
+        logger.debug(f"[UnixSocketTransport.create] Listening on {self.path}")
+
+    async def close(self) -> None:
+        await super().close()
+
+        if os.path.exists(self.path):
+            os.unlink(self.path)
+
+
+class TcpTransport(_StreamServerTransport):
+    """
+    TCP transport. Listens on the loopback interface by default.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0) -> None:
+        """
+        :param host: Interface to listen on.
+        :param port: Port to listen on. 0 selects a free port, available as `port` after create().
+        """
+        super().__init__()
+        self.host = host
+        self.port = port
+
+    async def create(self) -> None:
+        self._connected = asyncio.get_running_loop().create_future()
+        self._server = await asyncio.start_server(self._on_client, host=self.host, port=self.port)
+
+        self.port = self._server.sockets[0].getsockname()[1]
+
+        logger.debug(f"[TcpTransport.create] Listening on {self.host}:{self.port}")
+
+    async def connect(self) -> None:
+        await super().connect()
+
+        sock = self.writer.get_extra_info("socket")
+        if sock is not None:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+
+def default_socket_path() -> str:
+    return os.path.join(tempfile.gettempdir(), "AutoSplit64.sock")
+
+
+def create_transport(pipe_name: str,
+                     kind: str = "auto",
+                     socket_path: Optional[str] = None,
+                     host: str = "127.0.0.1",
+                     port: int = 0) -> Transport:
+    """
+    Create the server transport for the UI connection.
+
+    :param pipe_name: Named pipe name, used by the "pipe" transport.
+    :param kind: "pipe", "unix", "tcp", or "auto" to use a named pipe on Windows and a Unix socket elsewhere.
+    :param socket_path: Unix socket path. Defaults to AutoSplit64.sock in the temporary directory.
+    :param host: TCP interface.
+    :param port: TCP port.
+    """
+    if kind == "auto":
+        if sys.platform == "win32":
+            kind = "pipe"
+        elif hasattr(socket, "AF_UNIX"):
+            kind = "unix"
+        else:
+            kind = "tcp"
+
+    if kind == "pipe":
+        # Imported here as as64.ipc.pipe depends on this module
+        from .pipe import AsyncPipe
+        return AsyncPipe(pipe_name)
+    if kind == "unix":
+        return UnixSocketTransport(socket_path or default_socket_path())
+    if kind == "tcp":
+        return TcpTransport(host, port)
+
+    raise ValueError(f"Unknown transport '{kind}'")
@@ -0,0 +1,365 @@
+# AutoSplit64
+#
+# Copyright (C) 2025 Kainev
+#
+# This project is currently not open source and is under active development.
+# You may view the code, but it is not licensed for distribution, modification, or use at this time.
+#
+# For more information see https://github.com/Kainev/AutoSplit64?tab=readme#license
+
+import threading
+from typing import Optional, Sequence
+
+try:
+    import win32file
+    import win32pipe
+    import win32event
+
+    import pywintypes
+except ImportError:
+    win32file = win32pipe = win32event = pywintypes = None
+
+
+# The subset of the Win32 API used for overlapped named pipe I/O.
+#
+# Win32Api wraps pywin32 and MockWin32Api implements the same calls in memory, so the
+# overlapped I/O layer in as64.ipc.overlapped can be driven without Windows.
+
+ERROR_BROKEN_PIPE = 109
+ERROR_NO_DATA = 232
+ERROR_MORE_DATA = 234
+ERROR_PIPE_CONNECTED = 535
+ERROR_OPERATION_ABORTED = 995
+ERROR_IO_PENDING = 997
+
+INFINITE = 0xFFFFFFFF
+
+# WaitForMultipleObjects accepts at most this many handles
+MAXIMUM_WAIT_OBJECTS = 64
+
+
+class Win32Api(object):
+    """
+    Overlapped named pipe calls backed by pywin32.
+    """
+
+    def __init__(self) -> None:
+        if pywintypes is None:
+            raise RuntimeError("pywin32 is not available on this platform.")
+
+        self.error = pywintypes.error
+
+    def create_named_pipe(self, name: str, out_buffer_size: int = 4096, in_buffer_size: int = 4096):
+        return win32pipe.CreateNamedPipe(
+            name,
+            win32pipe.PIPE_ACCESS_DUPLEX | win32file.FILE_FLAG_OVERLAPPED,
+            win32pipe.PIPE_TYPE_MESSAGE | win32pipe.PIPE_READMODE_MESSAGE | win32pipe.PIPE_WAIT,
+            1,                  # Max instances
+            out_buffer_size,
+            in_buffer_size,
+            0,                  # Default timeout
+            None                # Default security attributes
+        )
+
+    def connect_named_pipe(self, handle, overlapped) -> int:
+        """
+        Start waiting for a client. If one is already connected the overlapped event is
+        signalled here, as Windows completes the call without signalling it.
+        """
+        result = win32pipe.ConnectNamedPipe(handle, overlapped)
+
+        if result == ERROR_PIPE_CONNECTED:
+            win32event.SetEvent(overlapped.hEvent)
+
+        return result
+
+    def disconnect_named_pipe(self, handle) -> None:
+        win32pipe.DisconnectNamedPipe(handle)
+
+    def close_handle(self, handle) -> None:
+        win32file.CloseHandle(handle)
+
+    def create_event(self):
+        return win32event.CreateEvent(None, True, False, None)
+
+    def set_event(self, event) -> None:
+        win32event.SetEvent(event)
+
+    def reset_event(self, event) -> None:
+        win32event.ResetEvent(event)
+
+    def create_overlapped(self, event):
+        overlapped = pywintypes.OVERLAPPED()
+        overlapped.hEvent = event
+        return overlapped
+
+    def allocate_buffer(self, size: int):
+        return win32file.AllocateReadBuffer(size)
+
+    def read_file(self, handle, buffer, overlapped) -> int:
+        result, _ = win32file.ReadFile(handle, buffer, overlapped)
+        return result
+
+    def write_file(self, handle, data: bytes, overlapped) -> int:
+        result, _ = win32file.WriteFile(handle, data, overlapped)
+        return result
+
+    def get_overlapped_result(self, handle, overlapped) -> int:
+        """
+        Return the number of bytes transferred by a completed operation.
+        A message mode read into a buffer smaller than the message completes with
+        ERROR_MORE_DATA; the buffer is full and the rest is returned by the next read.
+        """
+        try:
+            return win32file.GetOverlappedResult(handle, overlapped, False)
+        except pywintypes.error as e:
+            if e.winerror == ERROR_MORE_DATA:
+                return overlapped.InternalHigh
+            raise
+
+    def cancel_io(self, handle) -> None:
+        win32file.CancelIo(handle)
+
+    def wait_for_multiple(self, events: Sequence, timeout: int = INFINITE) -> Optional[int]:
+        """
+        Wait until any event is signalled and return its index, or None on timeout.
+        """
+        result = win32event.WaitForMultipleObjects(list(events), False, timeout)
+
+        if result == win32event.WAIT_TIMEOUT:
+            return None
+
+        return result - win32event.WAIT_OBJECT_0
+
+
+def default_api() -> Optional[Win32Api]:
+    """
+    Return a Win32Api, or None if pywin32 is not available.
+    """
+    return Win32Api() if pywintypes is not None else None
+
+
+class MockWin32Error(Exception):
+    """
+    Stand-in for pywintypes.error.
+    """
+
+    def __init__(self, winerror: int, funcname: str = "", strerror: str = "") -> None:
+        super().__init__(winerror, funcname, strerror)
+        self.winerror = winerror
+        self.funcname = funcname
+        self.strerror = strerror
+
+
+class _MockEvent(object):
+    __slots__ = ("signalled",)
+
+    def __init__(self) -> None:
+        self.signalled = False
+
+
+class _MockOverlapped(object):
+    __slots__ = ("hEvent", "InternalHigh", "error")
+
+    def __init__(self, event: _MockEvent) -> None:
+        self.hEvent = event
+        self.InternalHigh = 0
+        self.error = 0
+
+
+class MockPipeHandle(object):
+    """
+    One end of an in-memory pipe. Data is delivered as a byte stream.
+    """
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.inbound = bytearray()
+        self.peer: Optional["MockPipeHandle"] = None
+        self.closed = False
+
+        self.pending_reads = []
+        self.pending_connect = None
+
+
+class MockWin32Api(object):
+    """
+    In-memory implementation of the Win32Api calls.
+
+    Clients connect with connect_client() and exchange data through the blocking
+    client_read() and client_write() helpers, from any thread.
+    """
+
+    def __init__(self) -> None:
+        self.error = MockWin32Error
+
+        self._condition = threading.Condition()
+        self._pipes = {}
+
+    # Server calls
+
+    def create_named_pipe(self, name: str, out_buffer_size: int = 4096, in_buffer_size: int = 4096) -> MockPipeHandle:
+        with self._condition:
+            handle = MockPipeHandle(name)
+            self._pipes[name] = handle
+            return handle
+
+    def connect_named_pipe(self, handle: MockPipeHandle, overlapped: _MockOverlapped) -> int:
+        with self._condition:
+            if handle.peer is not None:
+                self._complete(overlapped, 0)
+                return ERROR_PIPE_CONNECTED
+
+            handle.pending_connect = overlapped
+            return ERROR_IO_PENDING
+
+    def disconnect_named_pipe(self, handle: MockPipeHandle) -> None:
+        with self._condition:
+            self._close(handle)
+
+    def close_handle(self, handle) -> None:
+        if isinstance(handle, MockPipeHandle):
+            with self._condition:
+                self._close(handle)
+                self._pipes.pop(handle.name, None)
+
+    def create_event(self) -> _MockEvent:
+        return _MockEvent()
+
+    def set_event(self, event: _MockEvent) -> None:
+        with self._condition:
+            event.signalled = True
+            self._condition.notify_all()
+
+    def reset_event(self, event: _MockEvent) -> None:
+        with self._condition:
+            event.signalled = False
+
+    def create_overlapped(self, event: _MockEvent) -> _MockOverlapped:
+        return _MockOverlapped(event)
+
+    def allocate_buffer(self, size: int) -> bytearray:
+        return bytearray(size)
+
+    def read_file(self, handle: MockPipeHandle, buffer: bytearray, overlapped: _MockOverlapped) -> int:
+        with self._condition:
+            if handle.closed:
+                raise MockWin32Error(ERROR_BROKEN_PIPE, "ReadFile", "The pipe has been ended.")
+
+            handle.pending_reads.append((overlapped, buffer))
+            self._service_reads(handle)
+
+            return 0 if not handle.pending_reads else ERROR_IO_PENDING
+
+    def write_file(self, handle: MockPipeHandle, data: bytes, overlapped: _MockOverlapped) -> int:
+        with self._condition:
+            if handle.closed or handle.peer is None or handle.peer.closed:
+                raise MockWin32Error(ERROR_NO_DATA, "WriteFile", "The pipe is being closed.")
+
+            handle.peer.inbound += data
+            self._service_reads(handle.peer)
+            self._complete(overlapped, len(data))
+
+            return 0
+
+    def get_overlapped_result(self, handle: MockPipeHandle, overlapped: _MockOverlapped) -> int:
+        if overlapped.error:
+            raise MockWin32Error(overlapped.error, "GetOverlappedResult", "Overlapped operation failed.")
+
+        return overlapped.InternalHigh
+
+    def cancel_io(self, handle: MockPipeHandle) -> None:
+        with self._condition:
+            self._abort(handle, ERROR_OPERATION_ABORTED)
+
+    def wait_for_multiple(self, events: Sequence[_MockEvent], timeout: int = INFINITE) -> Optional[int]:
+        with self._condition:
+            signalled = lambda: next((i for i, event in enumerate(events) if event.signalled), None)
+            wait = None if timeout == INFINITE else timeout / 1000
+
+            if not self._condition.wait_for(lambda: signalled() is not None, wait):
+                return None
+
+            return signalled()
+
+    # Client calls
+
+    def connect_client(self, name: str) -> MockPipeHandle:
+        with self._condition:
+            server = self._pipes.get(name)
+            if server is None or server.peer is not None:
+                raise MockWin32Error(2, "CreateFile", "The system cannot find the file specified.")
+
+            client = MockPipeHandle(name)
+            client.peer, server.peer = server, client
+
+            if server.pending_connect is not None:
+                self._complete(server.pending_connect, 0)
+                server.pending_connect = None
+
+            return client
+
+    def client_write(self, client: MockPipeHandle, data: bytes) -> None:
+        with self._condition:
+            if client.peer is None or client.peer.closed:
+                raise MockWin32Error(ERROR_NO_DATA, "WriteFile", "The pipe is being closed.")
+
+            client.peer.inbound += data
+            self._service_reads(client.peer)
+
+    def client_read(self, client: MockPipeHandle, num_bytes: int, timeout: Optional[float] = None) -> bytes:
+        """
+        Block until num_bytes have been written to the client, and return them.
+        """
+        with self._condition:
+            ready = lambda: len(client.inbound) >= num_bytes or client.closed
+            if not self._condition.wait_for(ready, timeout) or len(client.inbound) < num_bytes:
+                raise MockWin32Error(ERROR_BROKEN_PIPE, "ReadFile", "The pipe has been ended.")
+
+            data = bytes(client.inbound[:num_bytes])
+            del client.inbound[:num_bytes]
+            return data
+
+    def client_close(self, client: MockPipeHandle) -> None:
+        with self._condition:
+            self._close(client)
+
+    # Internal, called with the condition held
+
+    def _complete(self, overlapped: _MockOverlapped, transferred: int, error: int = 0) -> None:
+        overlapped.InternalHigh = transferred
+        overlapped.error = error
+        overlapped.hEvent.signalled = True
+        self._condition.notify_all()
+
+    def _service_reads(self, handle: MockPipeHandle) -> None:
+        while handle.pending_reads and handle.inbound:
+            overlapped, buffer = handle.pending_reads.pop(0)
+
+            count = min(len(buffer), len(handle.inbound))
+            buffer[:count] = handle.inbound[:count]
+            del handle.inbound[:count]
+
+            self._complete(overlapped, count)
+
+    def _abort(self, handle: MockPipeHandle, error: int) -> None:
+        for overlapped, _ in handle.pending_reads:
+            self._complete(overlapped, 0, error)
+        handle.pending_reads.clear()
+
+        if handle.pending_connect is not None:
+            self._complete(handle.pending_connect, 0, error)
+            handle.pending_connect = None
+
+    def _close(self, handle: MockPipeHandle) -> None:
+        if handle.closed:
+            return
+
+        handle.closed = True
+        self._abort(handle, ERROR_BROKEN_PIPE)
+
+        if handle.peer is not None:
+            handle.peer.closed = True
+            self._abort(handle.peer, ERROR_BROKEN_PIPE)
+
+        self._condition.notify_all()
@@ -9,4 +9,4 @@
 
 from as64.plugins.base import BasePlugin, Plugin, CapturePlugin, GameStatePlugin, SplitPlugin, PluginValidationError
 from as64.plugins.management import PluginManager
-from as64.plugins.metadata import PluginMetaData
\ No newline at end of file
+from as64.plugins.metadata import PluginMetaData, reads, writes
\ No newline at end of file
@@ -8,7 +8,7 @@
 # For more information see https://github.com/Kainev/AutoSplit64?tab=readme#license
 
 from abc import ABC, abstractmethod
-from typing import List
+from typing import List, Optional
 
 from as64.plugins.metadata import PluginMetaData
 
@@ -129,4 +129,13 @@ class CapturePlugin(BasePlugin):
 
     @abstractmethod
     def get_available_sources(self) -> List[str]:
-        pass
\ No newline at end of file
+        pass
+    
+    def frame_time(self) -> Optional[float]:
+        """
+        Time the most recently captured frame occurred.
+        
+        [Use] Override if the plugin knows when its frames occurred (e.g. replaying recorded footage).
+              Returning None uses the time capture() was called.
+        """
+        return None
\ No newline at end of file
@@ -0,0 +1,216 @@
+# AutoSplit64
+#
+# Copyright (C) 2025 Kainev
+#
+# This project is currently not open source and is under active development.
+# You may view the code, but it is not licensed for distribution, modification, or use at this time.
+#
+# For more information see https://github.com/Kainev/AutoSplit64?tab=readme#license
+
+import time
+import logging
+from concurrent.futures import ThreadPoolExecutor, wait
+from contextlib import nullcontext
+from typing import Callable, ContextManager, List, Optional
+
+from .base import Plugin
+from .metadata import declared_access
+
+logger = logging.getLogger(__name__)
+
+
+class PluginRunner(object):
+    """
+    Executes a single plugin each frame and enforces its time budget.
+
+    A plugin which exceeds `metadata.time_budget` on `max_overruns` consecutive executions is
+    demoted to running every 2nd, 4th, ... up to every `max_interval`th frame. Plugins are never
+    left running in the background, as they read and write the GameState of the current frame.
+    Plugins whose metadata declares them critical are never demoted.
+    """
+
+    def __init__(self,
+                 plugin: Plugin,
+                 latency=None,
+                 enqueue_message: Optional[Callable[[dict], None]] = None,
+                 max_overruns: int = 5,
+                 max_interval: int = 8) -> None:
+        """
+        :param plugin: Plugin instance to execute.
+        :param latency: Optional LatencyRing each execution time is recorded to.
+        :param enqueue_message: Callable used to warn the UI when the plugin is demoted.
+        :param max_overruns: Consecutive budget overruns before the plugin is demoted.
+        :param max_interval: Largest frame interval a plugin is demoted to.
+        """
+        self.plugin = plugin
+        self.latency = latency
+
+        metadata = plugin.metadata
+        self.name: str = metadata.name if metadata else type(plugin).__name__
+        self.budget: Optional[float] = metadata.time_budget if metadata else None
+        self.critical: bool = metadata.critical if metadata else False
+        self.reads, self.writes = declared_access(type(plugin))
+
+        self.interval: int = 1
+        self.overruns: int = 0
+
+        # Number of execute() calls, used to run demoted plugins every `interval` calls. The
+        # scheduler's frame index is not used as it skips ahead when frames are dropped
+        self._calls: int = 0
+
+        self._enqueue_message = enqueue_message
+        self._max_overruns = max_overruns
+        self._max_interval = max_interval
+
+    @property
+    def enforced(self) -> bool:
+        return self.budget is not None and not self.critical
+
+    @property
+    def declared(self) -> bool:
+        return bool(self.reads or self.writes)
+
+    def conflicts(self, other: "PluginRunner") -> bool:
+        """
+        True if this runner and `other` must not execute concurrently.
+        Plugins which declare no accesses conflict with every other plugin.
+        """
+        if not self.declared or not other.declared:
+            return True
+
+        return bool(self.writes & (other.reads | other.writes) or other.writes & self.reads)
+
+    def execute(self, game_state, controller) -> None:
+        self._calls += 1
+
+        if self.interval > 1 and self._calls % self.interval:
+            return
+
+        start = time.perf_counter()
+        self.plugin.execute(game_state, controller)
+        elapsed = time.perf_counter() - start
+
+        if self.latency is not None:
+            self.latency.add(elapsed)
+
+        if self.enforced:
+            self._check_budget(elapsed)
+
+    def _check_budget(self, elapsed: float) -> None:
+        if elapsed <= self.budget:
+            self.overruns = 0
+            return
+
+        self.overruns += 1
+
+        if self.overruns >= self._max_overruns:
+            self.overruns = 0
+            self._demote(elapsed)
+
+    def _demote(self, elapsed: float) -> None:
+        if self.interval >= self._max_interval:
+            return
+
+        self.interval = min(self.interval * 2, self._max_interval)
+        self._calls = 0
+        message = f"Plugin '{self.name}' exceeded its {self.budget * 1000:.1f}ms time budget ({elapsed * 1000:.1f}ms) and now runs every {self.interval} frames."
+
+        logger.warning(f"[PluginRunner] {message}")
+
+        if self._enqueue_message:
+            self._enqueue_message({"event": "warning", "data": message})
+
+
+class PluginExecutor(object):
+    """
+    Executes a list of plugins each frame through PluginRunners.
+    """
+
+    def __init__(self, runners: List[PluginRunner]) -> None:
+        self.runners = runners
+
+    def execute(self, game_state, controller) -> None:
+        for runner in self.runners:
+            runner.execute(game_state, controller)
+
+    def shutdown(self) -> None:
+        pass
+
+
+def build_levels(runners: List[PluginRunner]) -> List[List[PluginRunner]]:
+    """
+    Group runners into levels which can execute concurrently.
+
+    A runner depends on every earlier runner it conflicts with, and is placed one level after
+    the latest of those dependencies. Runners keep their relative order within each level.
+    """
+    levels: List[List[PluginRunner]] = []
+    placed: List[int] = []
+
+    for index, runner in enumerate(runners):
+        level = 0
+        for previous in range(index):
+            if placed[previous] >= level and runner.conflicts(runners[previous]):
+                level = placed[previous] + 1
+
+        placed.append(level)
+
+        if level == len(levels):
+            levels.append([])
+        levels[level].append(runner)
+
+    return levels
+
+
+class ParallelPluginExecutor(PluginExecutor):
+    """
+    Executes independent plugins concurrently on a thread pool.
+
+    Plugins are grouped into levels using their declared reads and writes (see build_levels),
+    and each level completes before the next begins. Events emitted by plugins within a level
+    are buffered and dispatched in plugin order once the level completes, so listeners observe
+    the same sequence as sequential execution.
+    """
+
+    def __init__(self,
+                 runners: List[PluginRunner],
+                 workers: int = 4,
+                 deferred: Optional[Callable[[], ContextManager[list]]] = None,
+                 emit: Optional[Callable[..., None]] = None) -> None:
+        """
+        :param runners: Runners to execute, in execution order.
+        :param workers: Size of the thread pool.
+        :param deferred: Context manager factory buffering events emitted on the current thread.
+        :param emit: Callable used to dispatch buffered events.
+        """
+        super().__init__(runners)
+
+        self.levels = build_levels(runners)
+
+        self._deferred = deferred or (lambda: nullcontext([]))
+        self._emit = emit
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="AS64PluginPool")
+
+    def execute(self, game_state, controller) -> None:
+        for level in self.levels:
+            if len(level) == 1:
+                level[0].execute(game_state, controller)
+                continue
+
+            futures = [self._pool.submit(self._execute_deferred, runner, game_state, controller) for runner in level]
+            wait(futures)
+
+            # Merge in plugin order; the first error is raised after earlier events are dispatched
+            for future in futures:
+                for event, args, kwargs in future.result():
+                    self._emit(event, *args, **kwargs)
+
+    def shutdown(self) -> None:
+        super().shutdown()
+        self._pool.shutdown(wait=True)
+
+    def _execute_deferred(self, runner: PluginRunner, game_state, controller) -> list:
+        with self._deferred() as events:
+            runner.execute(game_state, controller)
+
+        return events
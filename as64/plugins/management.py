@@ -9,10 +9,11 @@
 
 import os
 import logging
-from typing import Type, List, Dict
+from typing import Callable, Optional, Type, List, Dict
 from collections import defaultdict
 
 from as64 import config
+from as64.ipc import rpc
 
 from .base import (
     BasePlugin,
@@ -20,6 +21,12 @@ from .base import (
     SplitPlugin
 )
 
+from .execution import (
+    PluginExecutor,
+    ParallelPluginExecutor,
+    PluginRunner
+)
+
 from .discovery import (
     DiscoveredPlugin,
     DirectoryPluginDiscovery,
@@ -189,6 +196,43 @@ class PluginManager:
         # except Exception as e:
         #     logger.error(f"[run_method] ERROR {str(e)}")
                 
+    def create_executor(
+        self,
+        plugins: List[BasePlugin],
+        enqueue_message: Optional[Callable[[dict], None]] = None,
+        latency: Optional[Callable[[str], object]] = None
+    ) -> PluginExecutor:
+        """
+        Create an executor which runs `plugins` each frame, enforcing their time budgets.
+        If execution.parallel is enabled, plugins with non-conflicting reads and writes run concurrently.
+        
+        :param plugins: Plugin instances to execute, in execution order.
+        :param enqueue_message: Callable used to warn the UI when a plugin is degraded.
+        :param latency: Optional callable returning the LatencyRing for a plugin name.
+        """
+        max_overruns = config.get("budgets", "max_overruns", default=5)
+        max_interval = config.get("budgets", "max_interval", default=8)
+        
+        runners = []
+        for plugin in plugins:
+            runner = PluginRunner(plugin, None, enqueue_message, max_overruns, max_interval)
+            if latency:
+                runner.latency = latency(runner.name)
+            runners.append(runner)
+            
+        if not config.get("execution", "parallel", default=False):
+            return PluginExecutor(runners)
+        
+        # Imported here as as64.api depends on this package
+        from as64.api import emitter
+        
+        return ParallelPluginExecutor(
+            runners,
+            workers=config.get("execution", "workers", default=4),
+            deferred=emitter.deferred,
+            emit=emitter.emit
+        )
+                
     def set_plugin_loaded_by_name(
         self,
         plugin_name: str,
@@ -218,6 +262,9 @@ class PluginManager:
         else:
             self._set_multi_instance_plugin_loaded(derived_category, plugin_name, loaded)
             
+        # Cached RPC results may describe the previously active plugins
+        rpc.invalidate_dependants("plugin_manager.set_loaded")
+            
     def _set_single_instance_plugin_loaded(
         self,
         category: Type[BasePlugin],
@@ -8,7 +8,8 @@
 # For more information see https://github.com/Kainev/AutoSplit64?tab=readme#license
 
 from dataclasses import dataclass, field
-from typing import List
+from enum import Enum
+from typing import Any, List, Optional, Tuple
 
 @dataclass
 class PluginMetaData:
@@ -17,3 +18,58 @@ class PluginMetaData:
     author: str = "Unknown"
     description: str = ""
     required_plugins: List[str] = field(default_factory=list)
+    time_budget: Optional[float] = None     # Seconds execute() may take per frame before the plugin is degraded
+    critical: bool = False                  # Critical plugins are never degraded for exceeding their time budget
+    reads: List[Any] = field(default_factory=list)      # GameState fields and Regions read by execute()
+    writes: List[Any] = field(default_factory=list)     # GameState fields written by execute()
+
+
+def reads(*names: Any):
+    """
+    Class decorator declaring the GameState fields and Regions a plugin reads.
+    Usage:
+        @reads("star_count", Region.STAR)
+        class MyPlugin(GameStatePlugin):
+            ...
+    """
+    def decorator(cls):
+        cls._declared_reads = tuple(getattr(cls, "_declared_reads", ())) + names
+        return cls
+    return decorator
+
+
+def writes(*names: Any):
+    """
+    Class decorator declaring the GameState fields a plugin writes.
+    Usage:
+        @writes("prediction", "probability")
+        class MyPlugin(GameStatePlugin):
+            ...
+    """
+    def decorator(cls):
+        cls._declared_writes = tuple(getattr(cls, "_declared_writes", ())) + names
+        return cls
+    return decorator
+
+
+def access_key(name: Any) -> str:
+    """Normalise a GameState field name or Region into a comparable key."""
+    if isinstance(name, Enum):
+        return f"{type(name).__name__}.{name.name}"
+    return str(name)
+
+
+def declared_access(cls) -> Tuple[frozenset, frozenset]:
+    """
+    Returns the (reads, writes) declared by a plugin class through its metadata and decorators.
+    """
+    metadata = getattr(cls, "metadata", None)
+
+    read_names = list(getattr(cls, "_declared_reads", ()))
+    write_names = list(getattr(cls, "_declared_writes", ()))
+
+    if metadata:
+        read_names.extend(metadata.reads)
+        write_names.extend(metadata.writes)
+
+    return frozenset(map(access_key, read_names)), frozenset(map(access_key, write_names))
@@ -12,7 +12,7 @@
 const { ipcMain, dialog, app } = require("electron");
 const fs = require("fs");
 const log = require("./logger");
-const { sendMessage, sendRequest } = require("./pipe");
+const { sendMessage, sendRequest, sendBatch } = require("./pipe");
 const windowManager = require("./window-manager");
 
 function setupFileHandling() {
@@ -104,6 +104,15 @@ function setupCommunicationHandling() {
       throw err;
     }
   });
+
+  ipcMain.handle("send-batch", async (event, calls, ordered) => {
+    try {
+      return await sendBatch(calls, { ordered });
+    } catch (err) {
+      log.error("Error handling send-batch:", err);
+      throw err;
+    }
+  });
 }
 
 function setupPathHandling() {
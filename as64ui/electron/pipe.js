@@ -10,12 +10,29 @@
  */
 
 const net = require("net");
+const os = require("os");
+const path = require("path");
 const log = require("./logger");
 const windowManager = require("./window-manager");
 
-const PIPE_NAME = process.env.PIPE_NAME || "\\\\.\\pipe\\AutoSplit64";
+// Named pipe on Windows, Unix socket elsewhere (see as64/ipc/transport.py)
+const DEFAULT_PIPE_NAME =
+  process.platform === "win32" ? "\\\\.\\pipe\\AutoSplit64" : path.join(os.tmpdir(), "AutoSplit64.sock");
+const PIPE_NAME = process.env.PIPE_NAME || DEFAULT_PIPE_NAME;
 let as64Pipe = null;
 
+// Binary framing (see as64/ipc/framing.py)
+const FRAME_MAGIC = 0xa6;
+const PROTOCOL_VERSION = 1;
+const HEADER_SIZE = 8;
+const FRAME_MESSAGE = 1;
+const FRAME_BATCH = 2;
+const FRAME_HELLO = 3;
+const FLAG_MSGPACK = 1;
+
+// Set once AS64 accepts binary framing, until then the legacy format is used
+let binaryFraming = false;
+
 const pendingRequests = {};
 
 function generateUniqueId() {
@@ -25,8 +42,12 @@ function generateUniqueId() {
 function connectToAS64() {
   log.info(`Connecting to named pipe: ${PIPE_NAME}...`);
 
+  binaryFraming = false;
+  buffer = Buffer.alloc(0);
+
   as64Pipe = net.connect(PIPE_NAME, () => {
     log.info("Connected to AS64 pipe.");
+    sendHello();
   });
 
   as64Pipe.on("data", handleData);
@@ -50,61 +71,143 @@ function handlePipeClose() {
 }
 
 // Inbound buffer
-let buffer = "";
+let buffer = Buffer.alloc(0);
 
 function handleData(data) {
-  buffer += data.toString("utf-8");
+  buffer = buffer.length ? Buffer.concat([buffer, data]) : data;
 
-  const lines = buffer.split("\n");
+  let offset = 0;
 
-  for (let i = 0; i < lines.length - 1; i++) {
-    const line = lines[i].trim();
-    if (!line) continue;
+  while (offset < buffer.length) {
+    if (buffer[offset] === FRAME_MAGIC) {
+      // Binary frame
+      if (buffer.length - offset < HEADER_SIZE) break;
 
-    try {
-      const parsedData = JSON.parse(line);
-      log.debug("Parsed line:", parsedData);
+      const type = buffer[offset + 2];
+      const flags = buffer[offset + 3];
+      const length = buffer.readUInt32BE(offset + 4);
 
-      if (parsedData.replyTo) {
-        handleIncomingResponse(parsedData);
-      }
+      if (buffer.length - offset < HEADER_SIZE + length) break;
 
-      if (parsedData.event && parsedData.event === "loaded") {
-        if (!windowManager.mainWindow) {
-          windowManager.createMainWindow();
-        }
+      const body = buffer.subarray(offset + HEADER_SIZE, offset + HEADER_SIZE + length);
+      offset += HEADER_SIZE + length;
 
-        if (windowManager.splashWindow) {
-          windowManager.splashWindow.close();
-        }
-      }
+      handleFrame(type, flags, body);
+    } else {
+      // Legacy newline-delimited JSON
+      const end = buffer.indexOf(0x0a, offset);
+      if (end === -1) break;
 
-      if (windowManager.mainWindow && windowManager.mainWindow.webContents) {
-        windowManager.mainWindow.webContents.send("message", parsedData);
-      }
+      const line = buffer.toString("utf-8", offset, end).trim();
+      offset = end + 1;
+
+      if (line) handleJSON(line);
+    }
+  }
+
+  buffer = buffer.subarray(offset);
+}
 
-      if (windowManager.secondaryWindows) {
-        Object.keys(windowManager.secondaryWindows).forEach((key) => {
-          const win = windowManager.secondaryWindows[key];
-          if (win && win.webContents) {
-            win.webContents.send("message", parsedData);
-          }
-        });
+function handleFrame(type, flags, body) {
+  if (flags & FLAG_MSGPACK) {
+    log.error("Received MessagePack frame, which is not supported.");
+    return;
+  }
+
+  switch (type) {
+    case FRAME_MESSAGE:
+      handleJSON(body.toString("utf-8"));
+      break;
+    case FRAME_BATCH: {
+      let offset = 0;
+      while (offset + 4 <= body.length) {
+        const length = body.readUInt32BE(offset);
+        offset += 4;
+        handleJSON(body.toString("utf-8", offset, offset + length));
+        offset += length;
       }
-    } catch (err) {
-      log.error("Failed to parse JSON line:", line, err);
+      break;
     }
+    case FRAME_HELLO:
+      binaryFraming = true;
+      log.info("Negotiated binary framing:", body.toString("utf-8"));
+      break;
+    default:
+      log.warn("Unknown frame type:", type);
   }
+}
 
-  buffer = lines[lines.length - 1];
+function handleJSON(line) {
+  try {
+    handleMessage(JSON.parse(line));
+  } catch (err) {
+    log.error("Failed to parse JSON line:", line, err);
+  }
+}
+
+function handleMessage(parsedData) {
+  log.debug("Parsed line:", parsedData);
+
+  if (parsedData.replyTo) {
+    handleIncomingResponse(parsedData);
+  }
+
+  if (parsedData.event && parsedData.event === "loaded") {
+    if (!windowManager.mainWindow) {
+      windowManager.createMainWindow();
+    }
+
+    if (windowManager.splashWindow) {
+      windowManager.splashWindow.close();
+    }
+  }
+
+  if (windowManager.mainWindow && windowManager.mainWindow.webContents) {
+    windowManager.mainWindow.webContents.send("message", parsedData);
+  }
+
+  if (windowManager.secondaryWindows) {
+    Object.keys(windowManager.secondaryWindows).forEach((key) => {
+      const win = windowManager.secondaryWindows[key];
+      if (win && win.webContents) {
+        win.webContents.send("message", parsedData);
+      }
+    });
+  }
+}
+
+function encodeFrame(type, body) {
+  const header = Buffer.alloc(HEADER_SIZE);
+  header.writeUInt8(FRAME_MAGIC, 0);
+  header.writeUInt8(PROTOCOL_VERSION, 1);
+  header.writeUInt8(type, 2);
+  header.writeUInt8(0, 3);
+  header.writeUInt32BE(body.length, 4);
+  return Buffer.concat([header, body]);
+}
+
+function encodeMessage(message) {
+  const body = Buffer.from(JSON.stringify(message), "utf-8");
+
+  if (binaryFraming) {
+    return encodeFrame(FRAME_MESSAGE, body);
+  }
+
+  const header = body.length.toString().padStart(8, "0");
+  return Buffer.concat([Buffer.from(header, "ascii"), body]);
+}
+
+function sendHello() {
+  const hello = { version: PROTOCOL_VERSION, codecs: ["json"] };
+  as64Pipe.write(encodeFrame(FRAME_HELLO, Buffer.from(JSON.stringify(hello), "utf-8")));
 }
 
 function handleIncomingResponse(parsedData) {
-  const { replyTo: reqId, result } = parsedData;
+  const { replyTo: reqId, result, results } = parsedData;
   if (reqId && pendingRequests[reqId]) {
     const { resolve, timer } = pendingRequests[reqId];
     clearTimeout(timer);
-    resolve(result);
+    resolve(results !== undefined ? results : result);
     delete pendingRequests[reqId];
   }
 }
@@ -115,11 +218,7 @@ function sendMessage(message) {
     log.warn("No pipe connection available to send message.");
     return;
   }
-  const jsonMessage = JSON.stringify(message);
-  const bodyLength = Buffer.byteLength(jsonMessage, "utf-8");
-  const header = bodyLength.toString().padStart(8, "0");
-  const fullMessage = header + jsonMessage;
-  as64Pipe.write(fullMessage);
+  as64Pipe.write(encodeMessage(message));
 }
 
 // Request/response
@@ -130,24 +229,25 @@ function sendRequest(message, timeout = 1000) {
     }
     const requestId = generateUniqueId();
     message.requestId = requestId;
-    const jsonMessage = JSON.stringify(message);
-
-    const bodyLength = Buffer.byteLength(jsonMessage, "utf-8");
-    const header = bodyLength.toString().padStart(8, "0");
-    const fullMessage = header + jsonMessage;
-
     const timer = setTimeout(() => {
       delete pendingRequests[requestId];
       reject(new Error("Request timed out"));
     }, timeout);
 
     pendingRequests[requestId] = { resolve, timer };
-    as64Pipe.write(fullMessage);
+    as64Pipe.write(encodeMessage(message));
   });
 }
 
+// Several RPCs in one request, e.g. sendBatch([{ rpc: "config.get", args: ["capture"] }])
+// Resolves with a { result } or { error } entry per call, in order
+function sendBatch(calls, { ordered = false, timeout = 1000 } = {}) {
+  return sendRequest({ batch: calls, ordered }, timeout);
+}
+
 module.exports = {
   connectToAS64,
   sendMessage,
   sendRequest,
+  sendBatch,
 };
@@ -25,6 +25,16 @@ contextBridge.exposeInMainWorld("api", {
     });
   },
 
+  // Calls are [procName, ...args] arrays, resolves with the result of each call
+  async rpcBatch(calls, ordered = false) {
+    const replies = await ipcRenderer.invoke(
+      "send-batch",
+      calls.map(([procName, ...args]) => ({ rpc: procName, args })),
+      ordered
+    );
+    return replies.map((reply) => reply.result);
+  },
+
   onMessage: (callback) => {
     ipcRenderer.on("message", (event, data) => {
       callback(data);
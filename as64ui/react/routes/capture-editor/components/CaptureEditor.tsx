@@ -48,11 +48,10 @@ export const CaptureEditorComponent: React.FC<CaptureEditorProps> = ({
       });
     };
     const fetchVisibleProcesses = async () => {
-      const sources = await window.api.rpc(
-        "plugin_manager.available_capture_sources"
-      );
-
-      const source = await window.api.rpc("config.get", "capture", "source");
+      const [sources, source] = await window.api.rpcBatch([
+        ["plugin_manager.available_capture_sources"],
+        ["config.get", "capture", "source"],
+      ]);
 
       setCurrentSource(source);
       setAvailableSources(sources);
@@ -0,0 +1,56 @@
+# AutoSplit64
+#
+# Copyright (C) 2025 Kainev
+#
+# This project is currently not open source and is under active development.
+# You may view the code, but it is not licensed for distribution, modification, or use at this time.
+#
+# For more information see https://github.com/Kainev/AutoSplit64?tab=readme#license
+
+import asyncio
+
+from as64.ipc import framing
+from as64.ipc.framing import FramedConnection, FrameType, encode_batch, encode_frame, encode_legacy_request
+from as64.ipc.transport import MemoryTransport
+
+
+def _read(data: bytes, timeout: float = 1.0):
+    async def run():
+        local, remote = MemoryTransport.pair()
+        await remote.write_bytes(data)
+
+        return await asyncio.wait_for(FramedConnection(local).read(), timeout)
+
+    return asyncio.run(run())
+
+
+def test_oversized_frame_is_skipped(monkeypatch):
+    monkeypatch.setattr(framing, "MAX_FRAME_SIZE", 16)
+    monkeypatch.setattr(framing, "DISCARD_CHUNK_SIZE", 7)
+
+    oversized = framing.HEADER.pack(framing.MAGIC, framing.PROTOCOL_VERSION, FrameType.MESSAGE, 0, 100) + b"x" * 100
+    message = encode_frame(FrameType.MESSAGE, b'{"a":1}')
+
+    assert _read(oversized + message) == [{"a": 1}]
+
+
+def test_unsupported_version_is_skipped():
+    unsupported = framing.HEADER.pack(framing.MAGIC, framing.PROTOCOL_VERSION + 1, FrameType.MESSAGE, 0, 7) + b'{"b":2}'
+    message = encode_frame(FrameType.MESSAGE, b'{"a":1}')
+
+    assert _read(unsupported + message) == [{"a": 1}]
+
+
+def test_oversized_legacy_message_is_skipped(monkeypatch):
+    monkeypatch.setattr(framing, "MAX_FRAME_SIZE", 16)
+
+    oversized = encode_legacy_request({"padding": "x" * 64})
+    message = encode_legacy_request({"a": 1})
+
+    assert _read(oversized + message) == [{"a": 1}]
+
+
+def test_batch_round_trip():
+    messages = [{"a": 1}, {"b": [2, 3]}, {"c": "d"}]
+
+    assert _read(encode_batch(messages)) == messages
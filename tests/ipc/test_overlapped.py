@@ -0,0 +1,258 @@
+# AutoSplit64
+#
+# Copyright (C) 2025 Kainev
+#
+# This project is currently not open source and is under active development.
+# You may view the code, but it is not licensed for distribution, modification, or use at this time.
+#
+# For more information see https://github.com/Kainev/AutoSplit64?tab=readme#license
+
+import asyncio
+
+import pytest
+
+from as64.ipc.framing import FramedConnection, encode_legacy, encode_legacy_request
+from as64.ipc.overlapped import OverlappedClosedError, OverlappedDispatcher
+from as64.ipc.pipe import AsyncPipe, PipeConnectionError, PipeReadError, PipeWriteError
+from as64.ipc.win32 import ERROR_OPERATION_ABORTED, MockWin32Api, MockWin32Error
+
+
+PIPE_NAME = r"\\.\pipe\AutoSplit64Test"
+
+
+def _run(coroutine, timeout: float = 2.0):
+    async def run():
+        return await asyncio.wait_for(coroutine, timeout)
+
+    return asyncio.run(run())
+
+
+async def _connect(api: MockWin32Api):
+    pipe = AsyncPipe(PIPE_NAME, api)
+    await pipe.create()
+
+    connect = asyncio.create_task(pipe.connect())
+    await asyncio.sleep(0.01)
+    assert not connect.done()
+
+    client = api.connect_client(PIPE_NAME)
+    await connect
+
+    return pipe, client
+
+
+def test_connect():
+    async def run():
+        api = MockWin32Api()
+        pipe, client = await _connect(api)
+
+        assert client.peer is pipe.pipe
+        await pipe.close()
+
+    _run(run())
+
+
+def test_connect_fails_once_closed():
+    async def run():
+        pipe = AsyncPipe(PIPE_NAME, MockWin32Api())
+        await pipe.create()
+
+        connect = asyncio.create_task(pipe.connect())
+        await asyncio.sleep(0.01)
+        await pipe.close()
+
+        with pytest.raises(PipeConnectionError):
+            await connect
+
+    _run(run())
+
+
+def test_read_exactly_across_partial_reads():
+    async def run():
+        api = MockWin32Api()
+        pipe, client = await _connect(api)
+
+        read = asyncio.create_task(pipe.read_exactly(10))
+
+        api.client_write(client, b"0123")
+        await asyncio.sleep(0.01)
+        assert not read.done()
+
+        api.client_write(client, b"456789")
+        assert await read == b"0123456789"
+
+        await pipe.close()
+
+    _run(run())
+
+
+def test_write():
+    async def run():
+        api = MockWin32Api()
+        pipe, client = await _connect(api)
+
+        await pipe.write_bytes(b"hello")
+        assert await asyncio.to_thread(api.client_read, client, 5, 1.0) == b"hello"
+
+        await pipe.close()
+
+    _run(run())
+
+
+def test_write_after_client_closed():
+    async def run():
+        api = MockWin32Api()
+        pipe, client = await _connect(api)
+
+        api.client_close(client)
+
+        with pytest.raises(PipeWriteError):
+            await pipe.write_bytes(b"hello")
+
+        await pipe.close()
+
+    _run(run())
+
+
+def test_framed_round_trip():
+    async def run():
+        api = MockWin32Api()
+        pipe, client = await _connect(api)
+        connection = FramedConnection(pipe)
+
+        read = asyncio.create_task(connection.read())
+        api.client_write(client, encode_legacy_request({"a": 1}))
+        assert await read == [{"a": 1}]
+
+        await connection.write([{"b": 2}])
+        expected = encode_legacy([{"b": 2}])
+        assert await asyncio.to_thread(api.client_read, client, len(expected), 1.0) == expected
+
+        await pipe.close()
+
+    _run(run())
+
+
+def test_client_close_while_reading():
+    async def run():
+        api = MockWin32Api()
+        pipe, client = await _connect(api)
+
+        read = asyncio.create_task(pipe.read_exactly(4))
+        await asyncio.sleep(0.01)
+        api.client_close(client)
+
+        with pytest.raises(PipeReadError):
+            await read
+
+        await pipe.close()
+
+    _run(run())
+
+
+def test_close_while_reading():
+    async def run():
+        api = MockWin32Api()
+        pipe, _ = await _connect(api)
+
+        read = asyncio.create_task(pipe.read_exactly(4))
+        await asyncio.sleep(0.01)
+        await pipe.close()
+
+        with pytest.raises(PipeReadError):
+            await read
+
+    _run(run())
+
+
+def test_read_completing_without_data():
+    async def run():
+        api = MockWin32Api()
+        pipe, _ = await _connect(api)
+
+        # Complete every read successfully with no data, as a read from a closed pipe can
+        def read_file(handle, buffer, overlapped):
+            with api._condition:
+                api._complete(overlapped, 0)
+            return 0
+
+        api.read_file = read_file
+
+        with pytest.raises(PipeReadError):
+            await pipe.read_exactly(4)
+
+        await pipe.close()
+
+    _run(run())
+
+
+def test_cancel_io_aborts_pending_read():
+    async def run():
+        api = MockWin32Api()
+        dispatcher = OverlappedDispatcher(api)
+        dispatcher.start()
+
+        handle = api.create_named_pipe(PIPE_NAME)
+        client = api.connect_client(PIPE_NAME)
+        buffer = api.allocate_buffer(4)
+
+        read = asyncio.create_task(dispatcher.submit(handle, lambda overlapped: api.read_file(handle, buffer, overlapped)))
+        await asyncio.sleep(0.01)
+        api.cancel_io(handle)
+
+        with pytest.raises(MockWin32Error) as error:
+            await read
+        assert error.value.winerror == ERROR_OPERATION_ABORTED
+
+        # The dispatcher keeps completing operations after a cancellation
+        read = asyncio.create_task(dispatcher.submit(handle, lambda overlapped: api.read_file(handle, buffer, overlapped)))
+        api.client_write(client, b"data")
+        assert await read == 4
+        assert bytes(buffer) == b"data"
+
+        dispatcher.stop()
+
+    _run(run())
+
+
+def test_stop_fails_pending_operations():
+    async def run():
+        api = MockWin32Api()
+        dispatcher = OverlappedDispatcher(api)
+        dispatcher.start()
+
+        handle = api.create_named_pipe(PIPE_NAME)
+        api.connect_client(PIPE_NAME)
+        buffer = api.allocate_buffer(4)
+
+        read = asyncio.create_task(dispatcher.submit(handle, lambda overlapped: api.read_file(handle, buffer, overlapped)))
+        await asyncio.sleep(0.01)
+        dispatcher.stop()
+
+        with pytest.raises(OverlappedClosedError):
+            await read
+
+        with pytest.raises(OverlappedClosedError):
+            await dispatcher.submit(handle, lambda overlapped: api.read_file(handle, buffer, overlapped))
+
+    _run(run())
+
+
+def test_concurrent_operations_reuse_slots():
+    async def run():
+        api = MockWin32Api()
+        pipe, client = await _connect(api)
+
+        for i in range(50):
+            read = asyncio.create_task(pipe.read_exactly(1))
+            await pipe.write_bytes(b"x")
+            api.client_write(client, bytes([i]))
+
+            assert await read == bytes([i])
+
+        # One slot each for the read and the write in flight at the same time
+        assert len(pipe._dispatcher._pool) <= 2
+
+        await pipe.close()
+
+    _run(run())
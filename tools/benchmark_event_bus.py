@@ -0,0 +1,73 @@
+# AutoSplit64
+#
+# Copyright (C) 2025 Kainev
+#
+# This project is currently not open source and is under active development.
+# You may view the code, but it is not licensed for distribution, modification, or use at this time.
+#
+# For more information see https://github.com/Kainev/AutoSplit64?tab=readme#license
+
+"""
+Measures emit cost of EventBus at 0, 1 and 10 listeners, compared against pymitter if installed.
+
+Usage (from the repository root):
+    python -m tools.benchmark_event_bus [--iterations N]
+"""
+
+import argparse
+import timeit
+
+from as64.enums import Event
+from as64.helpers.events import EventBus
+
+try:
+    from pymitter import EventEmitter
+except ImportError:
+    EventEmitter = None
+
+
+LISTENER_COUNTS = (0, 1, 10)
+
+
+def listener(*args, **kwargs):
+    pass
+
+
+def measure(emitter, listeners: int, iterations: int) -> float:
+    for _ in range(listeners):
+        emitter.on(Event.FADEOUT_BEGIN, lambda *args, **kwargs: None)
+
+    emit = emitter.emit
+    event = Event.FADEOUT_BEGIN
+
+    return min(timeit.repeat(lambda: emit(event, 1), number=iterations, repeat=5)) / iterations
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="Benchmark event emit cost.")
+    parser.add_argument("--iterations", type=int, default=100000)
+    args = parser.parse_args(argv)
+
+    emitters = [("EventBus", EventBus), ("EventBus + wildcard", None)]
+    if EventEmitter is not None:
+        emitters.append(("pymitter", EventEmitter))
+
+    print(f"{'emitter':<24}" + "".join(f"{f'{count} listeners':>16}" for count in LISTENER_COUNTS) + "   (ns/emit)")
+
+    for name, factory in emitters:
+        results = []
+        for count in LISTENER_COUNTS:
+            if factory is None:
+                # A wildcard on another event name must not slow down FADEOUT_BEGIN
+                emitter = EventBus()
+                emitter.on("CAMERA*", listener)
+            else:
+                emitter = factory()
+
+            results.append(measure(emitter, count, args.iterations))
+
+        print(f"{name:<24}" + "".join(f"{seconds * 1e9:>16.0f}" for seconds in results))
+
+
+if __name__ == "__main__":
+    main()
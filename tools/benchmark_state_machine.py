@@ -0,0 +1,103 @@
+# AutoSplit64
+#
+# Copyright (C) 2025 Kainev
+#
+# This project is currently not open source and is under active development.
+# You may view the code, but it is not licensed for distribution, modification, or use at this time.
+#
+# For more information see https://github.com/Kainev/AutoSplit64?tab=readme#license
+
+"""
+Compares recursive StateMachine.trigger dispatch against compiled table dispatch.
+
+Usage (from the repository root):
+    python -m tools.benchmark_state_machine [--iterations N]
+"""
+
+import argparse
+import logging
+import timeit
+
+from as64.api import State, StateMachine
+
+
+SIGNALS = ("fade_out", "fade_in", "star", "death", "reset", "unused")
+
+
+class Idle(State):
+    pass
+
+
+class FadeOut(State):
+    pass
+
+
+class FadeIn(State):
+    pass
+
+
+class Level(StateMachine):
+    pass
+
+
+def build() -> StateMachine:
+    """
+    Two-level machine resembling a GameState plugin: signals handled by the inner level
+    machine, signals delegated to the outer machine, conditional and unhandled signals.
+    """
+    outer = StateMachine()
+    level = Level()
+    menu = Idle()
+
+    idle, fade_out, fade_in = Idle(), FadeOut(), FadeIn()
+
+    level.add_transition(idle, fade_out, "fade_out")
+    level.add_transition(fade_out, fade_in, "fade_in")
+    level.add_transition(fade_in, idle, "star", condition=lambda *args, **kwargs: True)
+    level.set_initial_state(idle)
+
+    outer.add_transition(level, menu, "reset")
+    outer.add_transition(menu, level, "death")
+    outer.add_transition(None, menu, "reset_all")
+    outer.set_initial_state(level)
+
+    outer.update()
+    level.update()
+
+    return level
+
+
+def run(machine: StateMachine, iterations: int) -> float:
+    trigger = machine.trigger
+
+    def cycle():
+        for signal in SIGNALS:
+            trigger(signal)
+
+    return min(timeit.repeat(cycle, number=iterations, repeat=5)) / (iterations * len(SIGNALS))
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="Benchmark StateMachine dispatch.")
+    parser.add_argument("--iterations", type=int, default=20000)
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.ERROR)
+
+    recursive = run(build(), args.iterations)
+
+    machine = build()
+    machine.compile(log=True)
+    compiled_logged = run(machine, args.iterations)
+
+    machine = build()
+    machine.compile(log=False)
+    compiled = run(machine, args.iterations)
+
+    print(f"{'dispatch':<24}{'ns/trigger':>12}{'speedup':>10}")
+    for name, seconds in (("recursive", recursive), ("compiled (log=True)", compiled_logged), ("compiled (log=False)", compiled)):
+        print(f"{name:<24}{seconds * 1e9:>12.0f}{recursive / seconds:>9.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,168 @@
+# AutoSplit64
+#
+# Copyright (C) 2025 Kainev
+#
+# This project is currently not open source and is under active development.
+# You may view the code, but it is not licensed for distribution, modification, or use at this time.
+#
+# For more information see https://github.com/Kainev/AutoSplit64?tab=readme#license
+
+"""
+Loopback benchmark of the IPC transports: messages per second and round-trip latency.
+
+The "executor" backend reproduces the I/O pattern of AsyncPipe, where every read and write
+blocks a thread pool worker and hands the result back to the event loop, over a socket pair
+so it can run on any platform.
+
+Usage (from the repository root):
+    python -m tools.benchmark_transport [--messages N] [--round-trips N]
+"""
+
+import socket
+import asyncio
+import argparse
+import statistics
+import tempfile
+import time
+import os
+
+from as64.ipc.framing import FramedConnection
+from as64.ipc.transport import Transport, TransportClosedError, StreamTransport, UnixSocketTransport, TcpTransport
+
+
+MESSAGE = {"event": "status", "data": {"frame": 0, "prediction": 12, "probability": 0.97}}
+
+
+class ExecutorSocketTransport(Transport):
+    """
+    Blocking socket driven through run_in_executor, one thread hop per read and write.
+    """
+
+    def __init__(self, sock: socket.socket) -> None:
+        self._sock = sock
+        self._sock.setblocking(True)
+
+    async def read_exactly(self, num_bytes: int) -> bytes:
+        return await asyncio.get_running_loop().run_in_executor(None, self._recv_exactly, num_bytes)
+
+    async def write_bytes(self, data: bytes) -> None:
+        await asyncio.get_running_loop().run_in_executor(None, self._sock.sendall, data)
+
+    async def close(self) -> None:
+        self._sock.close()
+
+    def _recv_exactly(self, num_bytes: int) -> bytes:
+        data = bytearray()
+        while len(data) < num_bytes:
+            chunk = self._sock.recv(num_bytes - len(data))
+            if not chunk:
+                raise TransportClosedError("Socket closed.")
+            data += chunk
+
+        return bytes(data)
+
+
+async def _connect(backend: str):
+    if backend == "executor":
+        server_sock, client_sock = socket.socketpair()
+        return ExecutorSocketTransport(server_sock), ExecutorSocketTransport(client_sock)
+
+    if backend == "unix":
+        server = UnixSocketTransport(os.path.join(tempfile.gettempdir(), f"as64-benchmark-{os.getpid()}.sock"))
+        await server.create()
+        client = StreamTransport(*await asyncio.open_unix_connection(server.path))
+    else:
+        server = TcpTransport("127.0.0.1", 0)
+        await server.create()
+        reader, writer = await asyncio.open_connection("127.0.0.1", server.port)
+        writer.get_extra_info("socket").setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        client = StreamTransport(reader, writer)
+
+    await server.connect()
+
+    return server, client
+
+
+def _binary(transport: Transport) -> FramedConnection:
+    connection = FramedConnection(transport)
+    connection.binary = True
+    return connection
+
+
+async def throughput(backend: str, messages: int) -> float:
+    server, client = await _connect(backend)
+    receiver, sender = _binary(server), _binary(client)
+
+    async def receive():
+        count = 0
+        while count < messages:
+            count += len(await receiver.read())
+
+    start = time.perf_counter()
+    task = asyncio.create_task(receive())
+
+    for _ in range(messages):
+        await sender.write([MESSAGE])
+
+    await task
+    elapsed = time.perf_counter() - start
+
+    await client.close()
+    await server.close()
+
+    return messages / elapsed
+
+
+async def round_trip(backend: str, count: int) -> list:
+    server, client = await _connect(backend)
+    responder, requester = _binary(server), _binary(client)
+
+    async def echo():
+        for _ in range(count):
+            await responder.write(await responder.read())
+
+    task = asyncio.create_task(echo())
+    samples = []
+
+    for _ in range(count):
+        start = time.perf_counter()
+        await requester.write([MESSAGE])
+        await requester.read()
+        samples.append(time.perf_counter() - start)
+
+    await task
+    await client.close()
+    await server.close()
+
+    return samples
+
+
+async def run(messages: int, round_trips: int) -> None:
+    backends = ["executor", "tcp"]
+    if hasattr(socket, "AF_UNIX"):
+        backends.insert(1, "unix")
+
+    print(f"{'transport':<12}{'msgs/s':>12}{'rtt mean us':>14}{'rtt p50 us':>13}{'rtt p99 us':>13}")
+
+    for backend in backends:
+        rate = await throughput(backend, messages)
+        samples = sorted(await round_trip(backend, round_trips))
+
+        mean = statistics.fmean(samples) * 1e6
+        p50 = samples[len(samples) // 2] * 1e6
+        p99 = samples[int(len(samples) * 0.99)] * 1e6
+
+        print(f"{backend:<12}{rate:>12.0f}{mean:>14.1f}{p50:>13.1f}{p99:>13.1f}")
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="Benchmark IPC transports over loopback.")
+    parser.add_argument("--messages", type=int, default=20000)
+    parser.add_argument("--round-trips", type=int, default=2000)
+    args = parser.parse_args(argv)
+
+    asyncio.run(run(args.messages, args.round_trips))
+
+
+if __name__ == "__main__":
+    main()